@@ -0,0 +1,291 @@
+from array import array
+from weakref import WeakValueDictionary
+
+# Índice usado como "puntero nulo" en los arreglos de enlaces
+NULO = -1
+
+
+class VistaNodo:
+    """
+    Vista de un nodo de ListaDobleEnlazadaArreglo.
+
+    La lista no guarda objetos nodo: esta vista se crea a pedido y expone
+    dato, siguiente y anterior como si lo fuera, para poder recorrer la
+    lista con el mismo código que la versión enlazada por punteros.
+    """
+    __slots__ = ('_lista', '_indice', '__weakref__')
+
+    def __init__(self, lista, indice):
+        self._lista = lista
+        self._indice = indice
+
+    @property
+    def dato(self):
+        return self._lista._datos[self._indice]
+
+    @dato.setter
+    def dato(self, dato):
+        self._lista._datos[self._indice] = dato
+
+    @property
+    def siguiente(self):
+        return self._lista._vista(self._lista._siguientes[self._indice])
+
+    @property
+    def anterior(self):
+        return self._lista._vista(self._lista._anteriores[self._indice])
+
+
+class ListaDobleEnlazadaArreglo:
+    """
+    Implementación de TAD Lista Doblemente Enlazada sobre arreglos.
+
+    En lugar de un objeto por nodo, los datos y los enlaces se guardan en
+    tres arreglos paralelos que crecen a demanda: '_datos' (lista de
+    Python), '_siguientes' y '_anteriores' (array de enteros de 64 bits).
+    Un nodo es un índice en esos arreglos y NULO (-1) hace de None.
+    Las posiciones liberadas por extraer se apilan en '_libres' y se
+    reutilizan antes de hacer crecer los arreglos.
+
+    Así la lista completa son cinco objetos sin importar su tamaño, lo que
+    evita la presión sobre el recolector de basura de millones de nodos.
+    """
+
+    def __init__(self):
+        """Inicializa una lista vacía"""
+        self._datos = []
+        self._siguientes = array('q')
+        self._anteriores = array('q')
+        self._libres = array('q')
+        self._cabeza = NULO
+        self._cola = NULO
+        self.tamanio = 0
+        # Se crea recién cuando se pide la primera vista
+        self._vistas = None
+
+    # ---- vistas de nodos ----
+
+    def _vista(self, indice):
+        """Devuelve la vista del nodo en 'indice' (None para NULO)"""
+        if indice == NULO:
+            return None
+        if self._vistas is None:
+            self._vistas = WeakValueDictionary()
+        vista = self._vistas.get(indice)
+        if vista is None:
+            vista = VistaNodo(self, indice)
+            self._vistas[indice] = vista
+        return vista
+
+    @property
+    def cabeza(self):
+        """Vista del primer nodo, o None si la lista está vacía"""
+        return self._vista(self._cabeza)
+
+    @property
+    def cola(self):
+        """Vista del último nodo, o None si la lista está vacía"""
+        return self._vista(self._cola)
+
+    # ---- manejo de posiciones libres ----
+
+    def _reservar(self, item):
+        """Devuelve un índice libre con 'item' cargado, creciendo si hace falta - O(1) amortizado"""
+        if self._libres:
+            indice = self._libres.pop()
+            self._datos[indice] = item
+            return indice
+        self._datos.append(item)
+        self._siguientes.append(NULO)
+        self._anteriores.append(NULO)
+        return len(self._datos) - 1
+
+    def _liberar(self, indice):
+        """Marca 'indice' como libre y suelta la referencia a su dato - O(1)"""
+        self._datos[indice] = None
+        if self._vistas is not None:
+            self._vistas.pop(indice, None)
+        self._libres.append(indice)
+
+    # ---- operaciones del TAD ----
+
+    def esta_vacia(self):
+        """Devuelve True si la lista está vacía - O(1)"""
+        return self._cabeza == NULO
+
+    def agregar_al_inicio(self, item):
+        """Agrega un nuevo ítem al inicio de la lista - O(1)"""
+        nuevo = self._reservar(item)
+        self._anteriores[nuevo] = NULO
+        self._siguientes[nuevo] = self._cabeza
+
+        if self._cabeza == NULO:
+            self._cola = nuevo
+        else:
+            self._anteriores[self._cabeza] = nuevo
+        self._cabeza = nuevo
+
+        self.tamanio += 1
+
+    def agregar_al_final(self, item):
+        """Agrega un nuevo ítem al final de la lista - O(1)"""
+        nuevo = self._reservar(item)
+        self._siguientes[nuevo] = NULO
+        self._anteriores[nuevo] = self._cola
+
+        if self._cola == NULO:
+            self._cabeza = nuevo
+        else:
+            self._siguientes[self._cola] = nuevo
+        self._cola = nuevo
+
+        self.tamanio += 1
+
+    def _obtener_indice(self, posicion):
+        """Método auxiliar para obtener el índice del nodo en posición dada - O(n)"""
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion
+
+        if posicion < 0 or posicion >= self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        # Optimización: empezar desde el extremo más cercano
+        if posicion <= self.tamanio // 2:
+            siguientes = self._siguientes
+            actual = self._cabeza
+            for _ in range(posicion):
+                actual = siguientes[actual]
+        else:
+            anteriores = self._anteriores
+            actual = self._cola
+            for _ in range(self.tamanio - 1 - posicion):
+                actual = anteriores[actual]
+
+        return actual
+
+    def insertar(self, item, posicion=None):
+        """Agrega un nuevo ítem en la posición especificada"""
+        if posicion is None:
+            self.agregar_al_final(item)
+            return
+
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion + 1
+
+        if posicion < 0 or posicion > self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        if posicion == 0:
+            self.agregar_al_inicio(item)
+        elif posicion == self.tamanio:
+            self.agregar_al_final(item)
+        else:
+            actual = self._obtener_indice(posicion)
+            previo = self._anteriores[actual]
+            nuevo = self._reservar(item)
+
+            self._siguientes[nuevo] = actual
+            self._anteriores[nuevo] = previo
+            self._siguientes[previo] = nuevo
+            self._anteriores[actual] = nuevo
+
+            self.tamanio += 1
+
+    def extraer(self, posicion=None):
+        """Elimina y devuelve el ítem en la posición especificada"""
+        if self.esta_vacia():
+            raise IndexError("No se puede extraer de una lista vacía")
+
+        if posicion is None:
+            posicion = self.tamanio - 1
+
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion
+
+        if posicion < 0 or posicion >= self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        if posicion == 0:
+            # Extraer del inicio - O(1)
+            indice = self._cabeza
+            self._cabeza = self._siguientes[indice]
+            if self._cabeza != NULO:
+                self._anteriores[self._cabeza] = NULO
+            else:
+                self._cola = NULO
+
+        elif posicion == self.tamanio - 1:
+            # Extraer del final - O(1)
+            indice = self._cola
+            self._cola = self._anteriores[indice]
+            if self._cola != NULO:
+                self._siguientes[self._cola] = NULO
+            else:
+                self._cabeza = NULO
+
+        else:
+            # Extraer del medio - O(n)
+            indice = self._obtener_indice(posicion)
+            previo = self._anteriores[indice]
+            proximo = self._siguientes[indice]
+            self._siguientes[previo] = proximo
+            self._anteriores[proximo] = previo
+
+        dato = self._datos[indice]
+        self._liberar(indice)
+        self.tamanio -= 1
+        return dato
+
+    def copiar(self):
+        """
+        Realiza una copia de la lista - O(n)
+        La copia queda compactada: el i-ésimo ítem ocupa el índice i.
+        """
+        nueva_lista = ListaDobleEnlazadaArreglo()
+        n = self.tamanio
+        if n == 0:
+            return nueva_lista
+
+        nueva_lista._datos = list(self)
+        nueva_lista._siguientes = array('q', range(1, n + 1))
+        nueva_lista._siguientes[n - 1] = NULO
+        nueva_lista._anteriores = array('q', range(-1, n - 1))
+        nueva_lista._cabeza = 0
+        nueva_lista._cola = n - 1
+        nueva_lista.tamanio = n
+        return nueva_lista
+
+    def invertir(self):
+        """
+        Invierte el orden de los elementos - O(1)
+        Basta con intercambiar los arreglos de enlaces y los extremos.
+        """
+        self._siguientes, self._anteriores = self._anteriores, self._siguientes
+        self._cabeza, self._cola = self._cola, self._cabeza
+
+    def concatenar(self, otra_lista):
+        """Concatena otra lista al final de esta - MODIFICA la lista actual"""
+        for dato in list(otra_lista):
+            self.agregar_al_final(dato)
+
+    def __len__(self):
+        """Devuelve el número de ítems - O(1)"""
+        return self.tamanio
+
+    def __add__(self, otra_lista):
+        """Suma dos listas - devuelve nueva lista sin modificar originales"""
+        nueva_lista = self.copiar()
+        nueva_lista.concatenar(otra_lista)
+        return nueva_lista
+
+    def __iter__(self):
+        """Permite recorrer la lista con for - O(n)"""
+        datos = self._datos
+        siguientes = self._siguientes
+        actual = self._cabeza
+        while actual != NULO:
+            yield datos[actual]
+            actual = siguientes[actual]
@@ -0,0 +1,423 @@
+from itertools import chain
+from weakref import WeakValueDictionary
+
+
+class Bloque:
+    """Nodo de ListaDesenrollada: guarda hasta 'capacidad_bloque' ítems contiguos"""
+    __slots__ = ('datos', 'siguiente', 'anterior')
+
+    def __init__(self, datos):
+        self.datos = datos
+        self.siguiente = None
+        self.anterior = None
+
+
+class VistaElemento:
+    """
+    Vista de un ítem de ListaDesenrollada.
+
+    Expone dato, siguiente y anterior como un nodo de ListaDobleEnlazada
+    para poder recorrer la lista con el mismo código. Es válida mientras
+    la lista no se modifique.
+    """
+    __slots__ = ('_lista', '_bloque', '_desplazamiento', '__weakref__')
+
+    def __init__(self, lista, bloque, desplazamiento):
+        self._lista = lista
+        self._bloque = bloque
+        self._desplazamiento = desplazamiento
+
+    @property
+    def dato(self):
+        return self._bloque.datos[self._desplazamiento]
+
+    @dato.setter
+    def dato(self, dato):
+        self._bloque.datos[self._desplazamiento] = dato
+
+    def _fisico_siguiente(self):
+        bloque, d = self._bloque, self._desplazamiento + 1
+        if d < len(bloque.datos):
+            return self._lista._vista(bloque, d)
+        if bloque.siguiente is None:
+            return None
+        return self._lista._vista(bloque.siguiente, 0)
+
+    def _fisico_anterior(self):
+        bloque, d = self._bloque, self._desplazamiento
+        if d > 0:
+            return self._lista._vista(bloque, d - 1)
+        if bloque.anterior is None:
+            return None
+        return self._lista._vista(bloque.anterior, len(bloque.anterior.datos) - 1)
+
+    @property
+    def siguiente(self):
+        if self._lista._invertida:
+            return self._fisico_anterior()
+        return self._fisico_siguiente()
+
+    @property
+    def anterior(self):
+        if self._lista._invertida:
+            return self._fisico_siguiente()
+        return self._fisico_anterior()
+
+
+class ListaDesenrollada:
+    """
+    Implementación de TAD Lista Doblemente Enlazada "desenrollada".
+
+    Cada nodo (Bloque) guarda una lista de Python con hasta
+    'capacidad_bloque' ítems, así que hay un objeto enlazado cada B ítems
+    en lugar de uno por ítem: menos memoria por elemento, recorridos sobre
+    memoria contigua y acceso por posición en O(n/B) saltando bloques.
+
+    Un bloque lleno se parte a la mitad al insertar en él, y uno que queda
+    por debajo de la mitad al extraer se une con el siguiente si entran
+    juntos, de modo que los bloques interiores no quedan casi vacíos.
+
+    invertir es O(1): sólo cambia la bandera '_invertida', que indica que
+    el orden lógico es el inverso del orden físico de los bloques.
+    """
+
+    CAPACIDAD_BLOQUE = 64
+
+    def __init__(self, capacidad_bloque=None):
+        """Inicializa una lista vacía"""
+        if capacidad_bloque is None:
+            capacidad_bloque = self.CAPACIDAD_BLOQUE
+        if capacidad_bloque < 2:
+            raise ValueError("La capacidad de los bloques debe ser al menos 2")
+        self.capacidad_bloque = capacidad_bloque
+        # Primer y último bloque en orden físico
+        self._primero = None
+        self._ultimo = None
+        self._invertida = False
+        self.tamanio = 0
+        # Se crea recién cuando se pide la primera vista
+        self._vistas = None
+
+    # ---- vistas de ítems ----
+
+    def _vista(self, bloque, desplazamiento):
+        """Devuelve la vista del ítem 'desplazamiento' de 'bloque'"""
+        if self._vistas is None:
+            self._vistas = WeakValueDictionary()
+        clave = (bloque, desplazamiento)
+        vista = self._vistas.get(clave)
+        if vista is None:
+            vista = VistaElemento(self, bloque, desplazamiento)
+            self._vistas[clave] = vista
+        return vista
+
+    @property
+    def cabeza(self):
+        """Vista del primer ítem, o None si la lista está vacía"""
+        if self.tamanio == 0:
+            return None
+        if self._invertida:
+            return self._vista(self._ultimo, len(self._ultimo.datos) - 1)
+        return self._vista(self._primero, 0)
+
+    @property
+    def cola(self):
+        """Vista del último ítem, o None si la lista está vacía"""
+        if self.tamanio == 0:
+            return None
+        if self._invertida:
+            return self._vista(self._primero, 0)
+        return self._vista(self._ultimo, len(self._ultimo.datos) - 1)
+
+    # ---- operaciones sobre el orden físico ----
+
+    def _enlazar_al_final(self, bloque):
+        bloque.anterior = self._ultimo
+        if self._ultimo is None:
+            self._primero = bloque
+        else:
+            self._ultimo.siguiente = bloque
+        self._ultimo = bloque
+
+    def _enlazar_al_inicio(self, bloque):
+        bloque.siguiente = self._primero
+        if self._primero is None:
+            self._ultimo = bloque
+        else:
+            self._primero.anterior = bloque
+        self._primero = bloque
+
+    def _enlazar_despues(self, bloque, nuevo):
+        nuevo.anterior = bloque
+        nuevo.siguiente = bloque.siguiente
+        if bloque.siguiente is None:
+            self._ultimo = nuevo
+        else:
+            bloque.siguiente.anterior = nuevo
+        bloque.siguiente = nuevo
+
+    def _desenlazar(self, bloque):
+        if bloque.anterior is None:
+            self._primero = bloque.siguiente
+        else:
+            bloque.anterior.siguiente = bloque.siguiente
+        if bloque.siguiente is None:
+            self._ultimo = bloque.anterior
+        else:
+            bloque.siguiente.anterior = bloque.anterior
+
+    def _localizar(self, posicion):
+        """Devuelve (bloque, desplazamiento) de la posición física dada - O(n/B)"""
+        if posicion <= self.tamanio // 2:
+            bloque = self._primero
+            while posicion >= len(bloque.datos):
+                posicion -= len(bloque.datos)
+                bloque = bloque.siguiente
+            return bloque, posicion
+        posicion = self.tamanio - posicion
+        bloque = self._ultimo
+        while posicion > len(bloque.datos):
+            posicion -= len(bloque.datos)
+            bloque = bloque.anterior
+        return bloque, len(bloque.datos) - posicion
+
+    def _agregar_fisico_final(self, item):
+        if self._ultimo is None or len(self._ultimo.datos) >= self.capacidad_bloque:
+            self._enlazar_al_final(Bloque([item]))
+        else:
+            self._ultimo.datos.append(item)
+
+    def _agregar_fisico_inicio(self, item):
+        if self._primero is None or len(self._primero.datos) >= self.capacidad_bloque:
+            self._enlazar_al_inicio(Bloque([item]))
+        else:
+            self._primero.datos.insert(0, item)
+
+    def _insertar_fisico(self, posicion, item):
+        """Inserta 'item' en la posición física dada, partiendo el bloque si está lleno"""
+        if posicion == self.tamanio:
+            self._agregar_fisico_final(item)
+            return
+        bloque, d = self._localizar(posicion)
+        datos = bloque.datos
+        if len(datos) >= self.capacidad_bloque:
+            mitad = len(datos) // 2
+            nuevo = Bloque(datos[mitad:])
+            del datos[mitad:]
+            self._enlazar_despues(bloque, nuevo)
+            if d > mitad:
+                datos, d = nuevo.datos, d - mitad
+        datos.insert(d, item)
+
+    def _extraer_fisico(self, posicion):
+        """Extrae el ítem en la posición física dada, uniendo bloques con poca carga"""
+        bloque, d = self._localizar(posicion)
+        datos = bloque.datos
+        dato = datos.pop(d)
+        if not datos:
+            self._desenlazar(bloque)
+        elif len(datos) < self.capacidad_bloque // 2:
+            proximo = bloque.siguiente
+            if proximo is not None and len(datos) + len(proximo.datos) <= self.capacidad_bloque:
+                datos.extend(proximo.datos)
+                self._desenlazar(proximo)
+        return dato
+
+    def _anexar_fisico(self, datos, al_inicio=False):
+        """Agrega la lista 'datos' en bloques llenos en un extremo físico - O(k)"""
+        capacidad = self.capacidad_bloque
+        if al_inicio:
+            if self._primero is not None:
+                corte = max(0, len(datos) - (capacidad - len(self._primero.datos)))
+                self._primero.datos[:0] = datos[corte:]
+                datos = datos[:corte]
+            # Se enlazan de atrás para adelante para que el resto quede al principio
+            fin = len(datos)
+            while fin > 0:
+                self._enlazar_al_inicio(Bloque(datos[max(0, fin - capacidad):fin]))
+                fin -= capacidad
+        else:
+            inicio = 0
+            if self._ultimo is not None:
+                inicio = capacidad - len(self._ultimo.datos)
+                self._ultimo.datos.extend(datos[:inicio])
+            for i in range(inicio, len(datos), capacidad):
+                self._enlazar_al_final(Bloque(datos[i:i + capacidad]))
+
+    # ---- operaciones del TAD ----
+
+    @classmethod
+    def desde_iterable(cls, iterable, capacidad_bloque=None):
+        """Crea una lista con los ítems de 'iterable' en bloques llenos - O(n)"""
+        lista = cls(capacidad_bloque)
+        lista.extender(iterable)
+        return lista
+
+    def extender(self, iterable):
+        """Agrega al final todos los ítems de 'iterable' - O(k)"""
+        datos = list(iterable)
+        if not datos:
+            return
+        self._vistas = None
+        if self._invertida:
+            datos.reverse()
+        self._anexar_fisico(datos, al_inicio=self._invertida)
+        self.tamanio += len(datos)
+
+    def a_lista(self):
+        """Devuelve los ítems en una lista de Python - O(n)"""
+        return list(self)
+
+    def a_numpy(self, dtype=None):
+        """Devuelve los ítems en un arreglo de NumPy - O(n)"""
+        import numpy as np
+        return np.array(self.a_lista(), dtype=dtype)
+
+    def esta_vacia(self):
+        """Devuelve True si la lista está vacía - O(1)"""
+        return self.tamanio == 0
+
+    def agregar_al_inicio(self, item):
+        """Agrega un nuevo ítem al inicio de la lista - O(1) amortizado"""
+        self._vistas = None
+        if self._invertida:
+            self._agregar_fisico_final(item)
+        else:
+            self._agregar_fisico_inicio(item)
+        self.tamanio += 1
+
+    def agregar_al_final(self, item):
+        """Agrega un nuevo ítem al final de la lista - O(1) amortizado"""
+        self._vistas = None
+        if self._invertida:
+            self._agregar_fisico_inicio(item)
+        else:
+            self._agregar_fisico_final(item)
+        self.tamanio += 1
+
+    def insertar(self, item, posicion=None):
+        """Agrega un nuevo ítem en la posición especificada - O(n/B + B)"""
+        if posicion is None:
+            self.agregar_al_final(item)
+            return
+
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion + 1
+
+        if posicion < 0 or posicion > self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        self._vistas = None
+        # Insertar antes del ítem lógico 'posicion' es insertar después
+        # del ítem físico tamanio-1-posicion cuando la lista está invertida
+        if self._invertida:
+            posicion = self.tamanio - posicion
+        self._insertar_fisico(posicion, item)
+        self.tamanio += 1
+
+    def extraer(self, posicion=None):
+        """Elimina y devuelve el ítem en la posición especificada - O(n/B + B)"""
+        if self.esta_vacia():
+            raise IndexError("No se puede extraer de una lista vacía")
+
+        if posicion is None:
+            posicion = self.tamanio - 1
+
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion
+
+        if posicion < 0 or posicion >= self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        self._vistas = None
+        if self._invertida:
+            posicion = self.tamanio - 1 - posicion
+        dato = self._extraer_fisico(posicion)
+        self.tamanio -= 1
+        return dato
+
+    def copiar(self):
+        """Realiza una copia de la lista copiando cada bloque - O(n)"""
+        nueva_lista = ListaDesenrollada(self.capacidad_bloque)
+        bloque = self._primero
+        while bloque is not None:
+            nueva_lista._enlazar_al_final(Bloque(bloque.datos[:]))
+            bloque = bloque.siguiente
+        nueva_lista._invertida = self._invertida
+        nueva_lista.tamanio = self.tamanio
+        return nueva_lista
+
+    def invertir(self):
+        """Invierte el orden de los elementos - O(1)"""
+        self._vistas = None
+        self._invertida = not self._invertida
+
+    def concatenar(self, otra_lista, mover=False):
+        """
+        Concatena otra lista al final de esta - MODIFICA la lista actual
+
+        Con mover=True y otra ListaDesenrollada con el mismo sentido, los
+        bloques de 'otra_lista' se enlazan a esta en O(1) y ella queda vacía.
+        """
+        if not mover:
+            self.extender(otra_lista)
+            return
+        if otra_lista is self:
+            raise ValueError("No se puede mover una lista dentro de sí misma")
+        if not isinstance(otra_lista, ListaDesenrollada):
+            raise TypeError("Sólo se pueden mover los bloques de otra ListaDesenrollada")
+        if otra_lista.esta_vacia():
+            return
+
+        if otra_lista._invertida != self._invertida:
+            # Los bloques están en sentidos opuestos: hay que copiar los ítems
+            self.extender(otra_lista)
+        else:
+            self._vistas = None
+            if self._primero is None:
+                self._primero, self._ultimo = otra_lista._primero, otra_lista._ultimo
+            elif self._invertida:
+                otra_lista._ultimo.siguiente = self._primero
+                self._primero.anterior = otra_lista._ultimo
+                self._primero = otra_lista._primero
+            else:
+                self._ultimo.siguiente = otra_lista._primero
+                otra_lista._primero.anterior = self._ultimo
+                self._ultimo = otra_lista._ultimo
+            self.tamanio += otra_lista.tamanio
+
+        otra_lista._vistas = None
+        otra_lista._primero = otra_lista._ultimo = None
+        otra_lista.tamanio = 0
+
+    def __len__(self):
+        """Devuelve el número de ítems - O(1)"""
+        return self.tamanio
+
+    def __add__(self, otra_lista):
+        """Suma dos listas - devuelve nueva lista sin modificar originales"""
+        nueva_lista = self.copiar()
+        nueva_lista.concatenar(otra_lista)
+        return nueva_lista
+
+    def _bloques(self, hacia_atras):
+        bloque = self._ultimo if hacia_atras else self._primero
+        while bloque is not None:
+            yield bloque.datos
+            bloque = bloque.anterior if hacia_atras else bloque.siguiente
+
+    def _recorrer_fisico(self, hacia_atras):
+        # chain recorre cada bloque en C: sólo se vuelve a Python una vez por bloque
+        if hacia_atras:
+            return chain.from_iterable(map(reversed, self._bloques(True)))
+        return chain.from_iterable(self._bloques(False))
+
+    def __iter__(self):
+        """Permite recorrer la lista con for - O(n)"""
+        return self._recorrer_fisico(self._invertida)
+
+    def __reversed__(self):
+        """Permite recorrer la lista de atrás para adelante con reversed() - O(n)"""
+        return self._recorrer_fisico(not self._invertida)
@@ -1,54 +1,598 @@
+from math import isqrt
+from weakref import WeakSet
+
+
 class Nodo:
-    """Nodo para lista doblemente enlazada"""
+    """Nodo para lista doblemente enlazada.
+
+    Usa __slots__ para no reservar un __dict__ por instancia: cada nodo
+    ocupa 56 bytes en lugar de ~96 (ver modules/benchmark_memoria.py).
+    """
+    __slots__ = ('dato', 'siguiente', 'anterior')
+
     def __init__(self, dato):
         self.dato = dato
         self.siguiente = None
         self.anterior = None
 
 
-class ListaDobleEnlazada:
-    """Implementación de TAD Lista Doblemente Enlazada"""
+class PoolNodos:
+    """
+    Lista libre (free-list) de nodos liberados por extraer.
+
+    Los nodos devueltos al pool se encadenan entre sí por el campo
+    'siguiente', así que el pool no necesita memoria adicional. Al pedir
+    un nodo se reutiliza uno libre si lo hay y sólo se crea uno nuevo
+    cuando el pool está vacío. Puede compartirse entre varias listas.
+    """
+    __slots__ = ('_libre', '_cantidad', 'capacidad')
+
+    def __init__(self, capacidad=None):
+        """Crea un pool vacío. 'capacidad' limita los nodos retenidos (None = sin límite)"""
+        self._libre = None
+        self._cantidad = 0
+        self.capacidad = capacidad
+
+    def obtener(self, dato):
+        """Devuelve un nodo con 'dato', reutilizando uno libre si existe - O(1)"""
+        nodo = self._libre
+        if nodo is None:
+            return Nodo(dato)
+        self._libre = nodo.siguiente
+        self._cantidad -= 1
+        nodo.dato = dato
+        nodo.siguiente = None
+        return nodo
+
+    def liberar(self, nodo):
+        """Devuelve un nodo desenlazado al pool - O(1)"""
+        if self.capacidad is not None and self._cantidad >= self.capacidad:
+            return
+        # Soltar la referencia al dato para no retenerlo en memoria
+        nodo.dato = None
+        nodo.anterior = None
+        nodo.siguiente = self._libre
+        self._libre = nodo
+        self._cantidad += 1
+
+    def __len__(self):
+        """Cantidad de nodos disponibles para reutilizar - O(1)"""
+        return self._cantidad
+
+
+class IndiceBloques:
+    """
+    Índice por bloques para acceder por posición en O(√n).
+
+    Divide la lista en bloques consecutivos de nodos y guarda, para cada
+    bloque, su primer nodo ('inicios') y su cantidad de nodos
+    ('cantidades'). Para llegar a una posición se suman cantidades hasta
+    dar con el bloque y luego se camina dentro de él desde el extremo más
+    cercano. Los bloques se parten al superar 2*√n nodos y se fusionan con
+    el siguiente cuando quedan chicos, así hay O(√n) bloques de O(√n) nodos.
+    """
+    __slots__ = ('inicios', 'cantidades', 'total')
+
+    TAMANIO_MINIMO = 16
 
     def __init__(self):
-        """Inicializa una lista vacía"""
-        self.cabeza = None
-        self.cola = None
+        """Crea un índice vacío"""
+        self.inicios = []
+        self.cantidades = []
+        self.total = 0
+
+    def _objetivo(self):
+        """Tamaño de bloque buscado para la cantidad actual de nodos"""
+        return max(self.TAMANIO_MINIMO, isqrt(self.total))
+
+    def anexar(self, primero, cantidad):
+        """
+        Agrega 'cantidad' nodos enlazados al final desde 'primero' - O(m)
+        Primero completa el último bloque hasta el tamaño buscado y recién
+        después abre bloques nuevos; si no, cada anexado chico (extender de
+        a un ítem, por ejemplo) dejaría un bloque más y el índice crecería
+        hasta tener un bloque por nodo.
+        """
+        objetivo = max(self.TAMANIO_MINIMO, isqrt(self.total + cantidad))
+        nodo = primero
+        if self.cantidades and self.cantidades[-1] < objetivo:
+            agregados = min(objetivo - self.cantidades[-1], cantidad)
+            self.cantidades[-1] += agregados
+            self.total += agregados
+            cantidad -= agregados
+            if cantidad:
+                for _ in range(agregados):
+                    nodo = nodo.siguiente
+        while cantidad > 0:
+            tamanio_bloque = min(objetivo, cantidad)
+            self.inicios.append(nodo)
+            self.cantidades.append(tamanio_bloque)
+            self.total += tamanio_bloque
+            cantidad -= tamanio_bloque
+            if cantidad:
+                for _ in range(tamanio_bloque):
+                    nodo = nodo.siguiente
+
+    def _bloque(self, posicion):
+        """Devuelve (bloque, posición de su primer nodo) que contiene 'posicion' - O(√n)"""
+        cantidades = self.cantidades
+        if posicion < self.total // 2:
+            inicio = 0
+            for b, cantidad in enumerate(cantidades):
+                if posicion < inicio + cantidad:
+                    return b, inicio
+                inicio += cantidad
+        else:
+            fin = self.total
+            for b in range(len(cantidades) - 1, -1, -1):
+                inicio = fin - cantidades[b]
+                if posicion >= inicio:
+                    return b, inicio
+                fin = inicio
+        raise IndexError("Posición fuera de rango")
+
+    def localizar(self, posicion, cola):
+        """Devuelve el nodo en 'posicion' (0 <= posicion < total) - O(√n)"""
+        b, inicio = self._bloque(posicion)
+        desplazamiento = posicion - inicio
+        cantidad = self.cantidades[b]
+        if desplazamiento <= cantidad // 2:
+            actual = self.inicios[b]
+            for _ in range(desplazamiento):
+                actual = actual.siguiente
+        else:
+            # Caminar hacia atrás desde el último nodo del bloque
+            if b + 1 < len(self.inicios):
+                actual = self.inicios[b + 1].anterior
+            else:
+                actual = cola
+            for _ in range(cantidad - 1 - desplazamiento):
+                actual = actual.anterior
+        return actual
+
+    def al_insertar(self, posicion, nuevo_nodo):
+        """Registra que 'nuevo_nodo' quedó en 'posicion' - O(√n)"""
+        cantidades = self.cantidades
+        if not cantidades:
+            self.inicios.append(nuevo_nodo)
+            cantidades.append(1)
+            self.total = 1
+            return
+
+        if posicion == self.total:
+            b = len(cantidades) - 1
+        else:
+            b, inicio = self._bloque(posicion)
+            if posicion == inicio:
+                if b > 0:
+                    # Queda al final del bloque anterior
+                    b -= 1
+                else:
+                    self.inicios[0] = nuevo_nodo
+
+        cantidades[b] += 1
+        self.total += 1
+        if cantidades[b] > 2 * self.TAMANIO_MINIMO and cantidades[b] > 2 * isqrt(self.total):
+            self._dividir(b)
+
+    def al_extraer(self, posicion, nodo):
+        """
+        Registra que se va a extraer 'nodo' de 'posicion' - O(√n)
+        Debe llamarse antes de desenlazar el nodo.
+        """
+        if posicion == self.total - 1:
+            b = len(self.cantidades) - 1
+            inicio = self.total - self.cantidades[b]
+        else:
+            b, inicio = self._bloque(posicion)
+        if posicion == inicio:
+            self.inicios[b] = nodo.siguiente
+
+        self.cantidades[b] -= 1
+        self.total -= 1
+        if self.cantidades[b] == 0:
+            del self.inicios[b]
+            del self.cantidades[b]
+        elif (self.cantidades[b] < self._objetivo() // 2 and b + 1 < len(self.cantidades)
+              and self.cantidades[b] + self.cantidades[b + 1] <= 2 * self._objetivo()):
+            # Fusionar con el bloque siguiente
+            self.cantidades[b] += self.cantidades[b + 1]
+            del self.inicios[b + 1]
+            del self.cantidades[b + 1]
+
+    def _dividir(self, b):
+        """Parte el bloque b en dos mitades - O(√n)"""
+        mitad = self.cantidades[b] // 2
+        nodo = self.inicios[b]
+        for _ in range(mitad):
+            nodo = nodo.siguiente
+        self.inicios.insert(b + 1, nodo)
+        self.cantidades.insert(b + 1, self.cantidades[b] - mitad)
+        self.cantidades[b] = mitad
+
+    def invertir(self, cola):
+        """
+        Ajusta el índice para la lista invertida - O(√n)
+        Debe llamarse antes de invertir los enlaces de la lista.
+        """
+        # El nuevo primer nodo de cada bloque es el antiguo último
+        finales = [inicio.anterior for inicio in self.inicios[1:]]
+        finales.append(cola)
+        finales.reverse()
+        self.inicios = finales
+        self.cantidades.reverse()
+
+    def extender(self, otro):
+        """Agrega al final los bloques de otro índice (al mover sus nodos) - O(√m)"""
+        if not otro.cantidades:
+            return
+        b = len(self.cantidades) - 1
+        self.inicios.extend(otro.inicios)
+        self.cantidades.extend(otro.cantidades)
+        self.total += otro.total
+        # Igual que en anexar: mover listas chicas no debe sumar un bloque cada vez
+        if b >= 0 and self.cantidades[b] + self.cantidades[b + 1] <= self._objetivo():
+            self.cantidades[b] += self.cantidades[b + 1]
+            del self.inicios[b + 1]
+            del self.cantidades[b + 1]
+
+
+class CursorInvalidoError(RuntimeError):
+    """Se lanza al usar un cursor luego de que su lista se modificó por otro medio"""
+    pass
+
+
+class Cursor:
+    """
+    Cursor para recorrer y editar una ListaDobleEnlazada sin buscar por posición.
+
+    Está parado sobre un ítem (posiciones 0 a n-1) o al final de la lista
+    (posición n). Moverse, insertar y extraer en el lugar del cursor es
+    O(1) (O(√n) si la lista está indexada). Si la lista se modifica por
+    cualquier otro medio, incluido otro cursor, el cursor queda invalidado
+    y sus operaciones lanzan CursorInvalidoError.
+    """
+    __slots__ = ('_lista', '_nodo', '_posicion', '_version')
+
+    def __init__(self, lista, nodo, posicion):
+        self._lista = lista
+        self._nodo = nodo
+        self._posicion = posicion
+        self._version = lista._version
+
+    def _verificar(self):
+        if self._version != self._lista._version:
+            raise CursorInvalidoError("La lista se modificó fuera de este cursor")
+
+    @property
+    def posicion(self):
+        """Posición actual del cursor"""
+        self._verificar()
+        return self._posicion
+
+    @property
+    def dato(self):
+        """Ítem sobre el que está el cursor"""
+        self._verificar()
+        if self._nodo is None:
+            raise IndexError("El cursor está al final de la lista")
+        return self._nodo.dato
+
+    @dato.setter
+    def dato(self, dato):
+        self._verificar()
+        if self._nodo is None:
+            raise IndexError("El cursor está al final de la lista")
+        self._lista._preparar_modificacion()
+        self._nodo.dato = dato
+
+    def en_final(self):
+        """Devuelve True si el cursor está después del último ítem"""
+        self._verificar()
+        return self._nodo is None
+
+    def avanzar(self):
+        """Mueve el cursor al ítem siguiente - O(1)"""
+        self._verificar()
+        if self._nodo is None:
+            raise IndexError("El cursor ya está al final de la lista")
+        self._nodo = self._nodo.siguiente
+        self._posicion += 1
+
+    def retroceder(self):
+        """Mueve el cursor al ítem anterior - O(1)"""
+        self._verificar()
+        if self._posicion == 0:
+            raise IndexError("El cursor ya está al inicio de la lista")
+        self._nodo = self._lista._cola if self._nodo is None else self._nodo.anterior
+        self._posicion -= 1
+
+    def insertar(self, item):
+        """
+        Inserta 'item' en la posición del cursor, antes del ítem actual - O(1)
+        El cursor sigue sobre el mismo ítem, que pasa a la posición siguiente.
+        """
+        self._verificar()
+        self._lista._insertar_antes(self._nodo, self._posicion, item)
+        self._posicion += 1
+        self._version = self._lista._version
+
+    def extraer(self):
+        """
+        Elimina y devuelve el ítem actual - O(1)
+        El cursor queda sobre el ítem que le seguía.
+        """
+        self._verificar()
+        if self._nodo is None:
+            raise IndexError("El cursor está al final de la lista")
+        siguiente = self._nodo.siguiente
+        dato = self._lista._extraer_nodo(self._nodo, self._posicion)
+        self._nodo = siguiente
+        self._version = self._lista._version
+        return dato
+
+
+class ListaDobleEnlazada:
+    """
+    Implementación de TAD Lista Doblemente Enlazada
+
+    Con indexada=True mantiene un IndiceBloques que baja el acceso por
+    posición (insertar/extraer en el medio) de O(n) a O(√n).
+
+    El resultado de sumar dos listas con + es diferido (copy-on-write):
+    guarda referencias a los operandos y recién copia sus nodos cuando se
+    accede a los nodos de la suma, cuando se la modifica o cuando se
+    modifica alguno de los operandos. Recorrerla o pedir su len() no copia.
+
+    cabeza y cola entregan los nodos para leerlos o recorrer la lista; sus
+    campos no deben modificarse desde afuera (una suma diferida pendiente
+    vería el cambio). Para cambiar los datos se usan insertar y extraer,
+    o un Cursor.
+    """
+
+    def __init__(self, pool=None, indexada=False):
+        """
+        Inicializa una lista vacía.
+        Si se indica un PoolNodos, los nodos se toman de él y los nodos
+        extraídos se le devuelven para ser reutilizados.
+        Si indexada es True se mantiene un índice por bloques de los nodos.
+        """
+        self._cabeza = None
+        self._cola = None
         self.tamanio = 0
+        self._pool = pool
+        self._indice = IndiceBloques() if indexada else None
+        # Cambia con cada modificación; los cursores lo usan para detectar cambios
+        self._version = 0
+        # (izquierda, derecha) mientras la lista sea una suma sin copiar
+        self._diferida = None
+        # Sumas diferidas que leen de esta lista (WeakSet, o None si no hay)
+        self._dependientes = None
+
+    @property
+    def cabeza(self):
+        """Primer nodo de la lista, o None si está vacía"""
+        if self._diferida is not None:
+            self._materializar()
+        return self._cabeza
+
+    @cabeza.setter
+    def cabeza(self, nodo):
+        self._cabeza = nodo
+        self._version += 1
+
+    @property
+    def cola(self):
+        """Último nodo de la lista, o None si está vacía"""
+        if self._diferida is not None:
+            self._materializar()
+        return self._cola
+
+    @cola.setter
+    def cola(self, nodo):
+        self._cola = nodo
+        self._version += 1
+
+    @property
+    def indexada(self):
+        """True si la lista mantiene un índice por bloques"""
+        return self._indice is not None
+
+    def indexar(self, activar=True):
+        """Activa (construyendo el índice, O(n)) o desactiva el índice por bloques"""
+        if not activar:
+            self._indice = None
+            return
+        if self._diferida is not None:
+            self._materializar()
+        self._indice = IndiceBloques()
+        self._indice.anexar(self._cabeza, self.tamanio)
+
+    def _nuevo_nodo(self, item):
+        """Crea un nodo para 'item' o lo toma del pool si la lista usa uno"""
+        if self._pool is None:
+            return Nodo(item)
+        return self._pool.obtener(item)
+
+    def _anexar(self, iterable):
+        """
+        Enlaza al final un nodo por cada dato de 'iterable' en una sola pasada - O(m)
+
+        Los nodos se crean sin pasar por Nodo.__init__ y se enlazan detrás
+        de un nodo centinela, sin llamadas a métodos por ítem.
+        """
+        centinela = Nodo(None)
+        ultimo_previo = self._cola if self._cola is not None else centinela
+        cola = ultimo_previo
+        agregados = 0
+
+        try:
+            if self._pool is None:
+                crear = Nodo.__new__
+                for agregados, dato in enumerate(iterable, 1):
+                    nuevo_nodo = crear(Nodo)
+                    nuevo_nodo.dato = dato
+                    nuevo_nodo.anterior = cola
+                    cola.siguiente = nuevo_nodo
+                    cola = nuevo_nodo
+            else:
+                obtener = self._pool.obtener
+                for agregados, dato in enumerate(iterable, 1):
+                    nuevo_nodo = obtener(dato)
+                    nuevo_nodo.anterior = cola
+                    cola.siguiente = nuevo_nodo
+                    cola = nuevo_nodo
+        finally:
+            # Aunque el iterable falle a mitad de camino, la lista queda bien enlazada
+            if agregados:
+                cola.siguiente = None
+                primero = ultimo_previo.siguiente
+                if ultimo_previo is centinela:
+                    primero.anterior = None
+                    self._cabeza = primero
+                self._cola = cola
+                self.tamanio += agregados
+                if self._indice is not None:
+                    self._indice.anexar(primero, agregados)
+
+    def _desenlazar(self, nodo):
+        """Quita 'nodo' de la cadena de enlaces, actualizando cabeza y cola - O(1)"""
+        anterior = nodo.anterior
+        siguiente = nodo.siguiente
+        if anterior is None:
+            self._cabeza = siguiente
+        else:
+            anterior.siguiente = siguiente
+        if siguiente is None:
+            self._cola = anterior
+        else:
+            siguiente.anterior = anterior
+
+    # ---- construcción y exportación masiva ----
+
+    @classmethod
+    def desde_iterable(cls, iterable, pool=None, indexada=False):
+        """Crea una lista con los ítems de 'iterable' enlazados en una sola pasada - O(n)"""
+        lista = cls(pool, indexada)
+        lista._anexar(iterable)
+        return lista
+
+    def extender(self, iterable):
+        """Agrega al final todos los ítems de 'iterable' en una sola pasada - O(m)"""
+        self._preparar_modificacion()
+        self._version += 1
+        # Extender una lista consigo misma: copiar los ítems antes de agregarlos
+        self._anexar(list(iterable) if iterable is self else iterable)
+
+    def a_lista(self):
+        """Devuelve una lista de Python con los ítems, reservada de una vez - O(n)"""
+        resultado = [None] * self.tamanio
+        if self._diferida is not None:
+            for i, dato in enumerate(self):
+                resultado[i] = dato
+            return resultado
+
+        actual = self._cabeza
+        for i in range(self.tamanio):
+            resultado[i] = actual.dato
+            actual = actual.siguiente
+        return resultado
+
+    def a_numpy(self, dtype=None):
+        """
+        Devuelve un arreglo de NumPy con los ítems - O(n)
+        Con un dtype dado el arreglo se reserva de una vez y se llena sin
+        listas intermedias; sin dtype NumPy lo infiere de los ítems.
+        """
+        import numpy as np
+
+        if dtype is None:
+            return np.array(self.a_lista())
+        return np.fromiter(self, dtype=dtype, count=self.tamanio)
+
+    # ---- copy-on-write de las sumas diferidas ----
+
+    def _materializar(self):
+        """Copia los nodos de los operandos de una suma diferida - O(n)"""
+        izquierda, derecha = self._diferida
+        self._diferida = None
+        self.tamanio = 0
+        self._anexar(izquierda)
+        self._anexar(derecha)
+        izquierda._quitar_dependiente(self)
+        derecha._quitar_dependiente(self)
+
+    def _agregar_dependiente(self, suma):
+        if self._dependientes is None:
+            self._dependientes = WeakSet()
+        self._dependientes.add(suma)
+
+    def _quitar_dependiente(self, suma):
+        if self._dependientes is not None:
+            self._dependientes.discard(suma)
+
+    def _preparar_modificacion(self):
+        """
+        Debe llamarse antes de modificar la lista. Si es una suma diferida
+        la copia, y si otras sumas diferidas leen de ella las copia primero
+        para que no vean el cambio.
+        """
+        if self._diferida is not None:
+            self._materializar()
+        if self._dependientes is not None:
+            for suma in list(self._dependientes):
+                suma._materializar()
+            self._dependientes = None
+
+    # ---- operaciones del TAD ----
 
     def esta_vacia(self):
         """Devuelve True si la lista está vacía - O(1)"""
-        return self.cabeza is None
+        return self.tamanio == 0
 
     def agregar_al_inicio(self, item):
         """Agrega un nuevo ítem al inicio de la lista - O(1)"""
-        nuevo_nodo = Nodo(item)
+        if self._diferida is not None or self._dependientes is not None:
+            self._preparar_modificacion()
+        nuevo_nodo = self._nuevo_nodo(item)
 
-        if self.esta_vacia():
-            self.cabeza = nuevo_nodo
-            self.cola = nuevo_nodo
+        if self._cabeza is None:
+            self._cabeza = nuevo_nodo
+            self._cola = nuevo_nodo
         else:
-            nuevo_nodo.siguiente = self.cabeza
-            self.cabeza.anterior = nuevo_nodo
-            self.cabeza = nuevo_nodo
+            nuevo_nodo.siguiente = self._cabeza
+            self._cabeza.anterior = nuevo_nodo
+            self._cabeza = nuevo_nodo
 
+        if self._indice is not None:
+            self._indice.al_insertar(0, nuevo_nodo)
         self.tamanio += 1
+        self._version += 1
 
     def agregar_al_final(self, item):
         """Agrega un nuevo ítem al final de la lista - O(1)"""
-        nuevo_nodo = Nodo(item)
+        if self._diferida is not None or self._dependientes is not None:
+            self._preparar_modificacion()
+        nuevo_nodo = self._nuevo_nodo(item)
 
-        if self.esta_vacia():
-            self.cabeza = nuevo_nodo
-            self.cola = nuevo_nodo
+        if self._cola is None:
+            self._cabeza = nuevo_nodo
+            self._cola = nuevo_nodo
         else:
-            nuevo_nodo.anterior = self.cola
-            self.cola.siguiente = nuevo_nodo
-            self.cola = nuevo_nodo
+            nuevo_nodo.anterior = self._cola
+            self._cola.siguiente = nuevo_nodo
+            self._cola = nuevo_nodo
 
+        if self._indice is not None:
+            self._indice.al_insertar(self.tamanio, nuevo_nodo)
         self.tamanio += 1
+        self._version += 1
 
     def _obtener_nodo(self, posicion):
-        """Método auxiliar para obtener nodo en posición dada - O(n)"""
+        """Método auxiliar para obtener nodo en posición dada - O(n), u O(√n) si está indexada"""
+        if self._diferida is not None:
+            self._materializar()
+
         # Manejar índices negativos
         if posicion < 0:
             posicion = self.tamanio + posicion
@@ -56,15 +600,18 @@ class ListaDobleEnlazada:
         if posicion < 0 or posicion >= self.tamanio:
             raise IndexError("Posición fuera de rango")
 
+        if self._indice is not None:
+            return self._indice.localizar(posicion, self._cola)
+
         # Optimización: empezar desde el extremo más cercano
         if posicion <= self.tamanio // 2:
             # Empezar desde el inicio
-            actual = self.cabeza
+            actual = self._cabeza
             for _ in range(posicion):
                 actual = actual.siguiente
         else:
             # Empezar desde el final
-            actual = self.cola
+            actual = self._cola
             for _ in range(self.tamanio - 1 - posicion):
                 actual = actual.anterior
 
@@ -88,15 +635,33 @@ class ListaDobleEnlazada:
         elif posicion == self.tamanio:
             self.agregar_al_final(item)
         else:
-            nuevo_nodo = Nodo(item)
-            nodo_actual = self._obtener_nodo(posicion)
-
+            self._insertar_antes(self._obtener_nodo(posicion), posicion, item)
+
+    def _insertar_antes(self, nodo_actual, posicion, item):
+        """
+        Inserta 'item' antes de 'nodo_actual', que está en 'posicion'.
+        Si 'nodo_actual' es None lo agrega al final - O(1), u O(√n) si está indexada
+        """
+        self._preparar_modificacion()
+        nuevo_nodo = self._nuevo_nodo(item)
+
+        if nodo_actual is None:
+            nuevo_nodo.anterior = self._cola
+        else:
             nuevo_nodo.siguiente = nodo_actual
             nuevo_nodo.anterior = nodo_actual.anterior
-            nodo_actual.anterior.siguiente = nuevo_nodo
             nodo_actual.anterior = nuevo_nodo
+        if nuevo_nodo.anterior is None:
+            self._cabeza = nuevo_nodo
+        else:
+            nuevo_nodo.anterior.siguiente = nuevo_nodo
+        if nodo_actual is None:
+            self._cola = nuevo_nodo
 
-            self.tamanio += 1
+        if self._indice is not None:
+            self._indice.al_insertar(posicion, nuevo_nodo)
+        self.tamanio += 1
+        self._version += 1
 
     def extraer(self, posicion=None):
         """Elimina y devuelve el ítem en la posición especificada"""
@@ -113,57 +678,60 @@ class ListaDobleEnlazada:
         if posicion < 0 or posicion >= self.tamanio:
             raise IndexError("Posición fuera de rango")
 
+        if self._diferida is not None:
+            self._materializar()
+
         # Casos especiales para O(1) en los extremos
         if posicion == 0:
             # Extraer del inicio - O(1)
-            dato = self.cabeza.dato
-            self.cabeza = self.cabeza.siguiente
-            if self.cabeza:
-                self.cabeza.anterior = None
-            else:
-                self.cola = None
-            self.tamanio -= 1
-            return dato
-
+            nodo_a_extraer = self._cabeza
         elif posicion == self.tamanio - 1:
             # Extraer del final - O(1)
-            dato = self.cola.dato
-            self.cola = self.cola.anterior
-            if self.cola:
-                self.cola.siguiente = None
-            else:
-                self.cabeza = None
-            self.tamanio -= 1
-            return dato
-
+            nodo_a_extraer = self._cola
         else:
-            # Extraer del medio - O(n)
+            # Extraer del medio - O(n), u O(√n) si está indexada
             nodo_a_extraer = self._obtener_nodo(posicion)
-            dato = nodo_a_extraer.dato
 
-            nodo_a_extraer.anterior.siguiente = nodo_a_extraer.siguiente
-            nodo_a_extraer.siguiente.anterior = nodo_a_extraer.anterior
+        return self._extraer_nodo(nodo_a_extraer, posicion)
 
-            self.tamanio -= 1
-            return dato
+    def _extraer_nodo(self, nodo, posicion):
+        """Quita 'nodo', que está en 'posicion', y devuelve su dato - O(1), u O(√n) si está indexada"""
+        if self._dependientes is not None:
+            self._preparar_modificacion()
+        if self._indice is not None:
+            self._indice.al_extraer(posicion, nodo)
+        self._desenlazar(nodo)
 
-    def copiar(self):
-        """Realiza una copia de la lista - O(n)"""
-        nueva_lista = ListaDobleEnlazada()
-        actual = self.cabeza
-
-        while actual is not None:
-            nueva_lista.agregar_al_final(actual.dato)
-            actual = actual.siguiente
+        self.tamanio -= 1
+        self._version += 1
+        dato = nodo.dato
+        if self._pool is not None:
+            self._pool.liberar(nodo)
+        return dato
 
+    def copiar(self):
+        """
+        Realiza una copia de la lista - O(n)
+        La copia de una suma diferida es otra suma diferida - O(1)
+        """
+        if self._diferida is not None:
+            izquierda, derecha = self._diferida
+            return izquierda + derecha
+
+        nueva_lista = ListaDobleEnlazada(self._pool, self.indexada)
+        nueva_lista._anexar(self)
         return nueva_lista
 
     def invertir(self):
         """Invierte el orden de los elementos - O(n)"""
-        if self.esta_vacia() or self.tamanio == 1:
+        if self.tamanio <= 1:
             return
+        self._preparar_modificacion()
+        self._version += 1
+        if self._indice is not None:
+            self._indice.invertir(self._cola)
 
-        actual = self.cabeza
+        actual = self._cabeza
 
         # Intercambiar punteros siguiente y anterior para cada nodo
         while actual is not None:
@@ -172,28 +740,104 @@ class ListaDobleEnlazada:
             actual = actual.anterior  # Moverse al siguiente (que ahora es anterior)
 
         # Intercambiar cabeza y cola
-        self.cabeza, self.cola = self.cola, self.cabeza
+        self._cabeza, self._cola = self._cola, self._cabeza
+
+    def concatenar(self, otra_lista, mover=False):
+        """
+        Concatena otra lista al final de esta - MODIFICA la lista actual
+
+        Por defecto copia los ítems de 'otra_lista' - O(m).
+        Con mover=True enlaza directamente los nodos de 'otra_lista' a
+        continuación de la cola - O(1) - y 'otra_lista' queda vacía.
+        (Si esta lista está indexada y 'otra_lista' no, indexar sus nodos es O(m).)
+        """
+        if not mover:
+            self.extender(otra_lista)
+            return
 
-    def concatenar(self, otra_lista):
-        """Concatena otra lista al final de esta - MODIFICA la lista actual"""
-        actual = otra_lista.cabeza
-        while actual is not None:
-            self.agregar_al_final(actual.dato)
-            actual = actual.siguiente
+        if otra_lista is self:
+            raise ValueError("No se puede mover una lista dentro de sí misma")
+        if not isinstance(otra_lista, ListaDobleEnlazada):
+            raise TypeError("Sólo se pueden mover los nodos de otra ListaDobleEnlazada")
+
+        self._preparar_modificacion()
+        otra_lista._preparar_modificacion()
+        if otra_lista._cabeza is None:
+            return
+        self._version += 1
+        otra_lista._version += 1
+
+        if self._cola is None:
+            self._cabeza = otra_lista._cabeza
+        else:
+            self._cola.siguiente = otra_lista._cabeza
+            otra_lista._cabeza.anterior = self._cola
+        if self._indice is not None:
+            if otra_lista._indice is not None:
+                self._indice.extender(otra_lista._indice)
+            else:
+                # La donante no tiene índice: hay que recorrer sus nodos - O(m)
+                self._indice.anexar(otra_lista._cabeza, otra_lista.tamanio)
+        self._cola = otra_lista._cola
+        self.tamanio += otra_lista.tamanio
+
+        otra_lista._cabeza = None
+        otra_lista._cola = None
+        otra_lista.tamanio = 0
+        if otra_lista._indice is not None:
+            otra_lista._indice = IndiceBloques()
+
+    def cursor(self, posicion=0):
+        """
+        Devuelve un Cursor parado en 'posicion' (len(lista) = al final).
+        Ubicarlo cuesta lo mismo que un acceso por posición; después
+        moverse, insertar y extraer desde el cursor es O(1).
+        """
+        if self._diferida is not None:
+            self._materializar()
+
+        # Manejar índices negativos
+        if posicion < 0:
+            posicion = self.tamanio + posicion
+
+        if posicion < 0 or posicion > self.tamanio:
+            raise IndexError("Posición fuera de rango")
+
+        nodo = None if posicion == self.tamanio else self._obtener_nodo(posicion)
+        return Cursor(self, nodo, posicion)
 
     def __len__(self):
         """Devuelve el número de ítems - O(1)"""
         return self.tamanio
 
     def __add__(self, otra_lista):
-        """Suma dos listas - devuelve nueva lista sin modificar originales"""
-        nueva_lista = self.copiar()
-        nueva_lista.concatenar(otra_lista)
+        """
+        Suma dos listas - devuelve nueva lista sin modificar originales - O(1)
+        Los nodos se copian recién cuando hace falta (ver _materializar).
+        """
+        if not isinstance(otra_lista, ListaDobleEnlazada):
+            nueva_lista = self.copiar()
+            nueva_lista.concatenar(otra_lista)
+            return nueva_lista
+
+        nueva_lista = ListaDobleEnlazada(self._pool, self.indexada)
+        if self.tamanio + otra_lista.tamanio == 0:
+            return nueva_lista
+        nueva_lista._diferida = (self, otra_lista)
+        nueva_lista.tamanio = self.tamanio + otra_lista.tamanio
+        self._agregar_dependiente(nueva_lista)
+        otra_lista._agregar_dependiente(nueva_lista)
         return nueva_lista
 
     def __iter__(self):
         """Permite recorrer la lista con for - O(n)"""
-        actual = self.cabeza
+        if self._diferida is not None:
+            izquierda, derecha = self._diferida
+            yield from izquierda
+            yield from derecha
+            return
+
+        actual = self._cabeza
         while actual is not None:
             yield actual.dato
-            actual = actual.siguiente
\ No newline at end of file
+            actual = actual.siguiente
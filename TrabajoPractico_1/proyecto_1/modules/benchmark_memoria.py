@@ -0,0 +1,87 @@
+"""
+Benchmark de memoria de los nodos de ListaDobleEnlazada.
+
+Compara los bytes por elemento de una lista de 10^6 ítems usando el nodo
+original (con __dict__ por instancia) contra el nodo con __slots__, y
+muestra cuántos nodos nuevos se crean al reinsertar después de extraer
+con y sin PoolNodos.
+
+Uso (desde la carpeta del proyecto):
+    python -m modules.benchmark_memoria
+"""
+import tracemalloc
+
+from modules.Listadobleenlazada import Nodo, ListaDobleEnlazada, PoolNodos
+
+N_ELEMENTOS = 10**6
+
+
+class NodoConDict:
+    """Nodo tal como estaba antes de agregar __slots__"""
+    def __init__(self, dato):
+        self.dato = dato
+        self.siguiente = None
+        self.anterior = None
+
+
+def encadenar(clase_nodo, n):
+    """Enlaza n nodos de la clase indicada igual que agregar_al_final"""
+    cabeza = cola = clase_nodo(None)
+    for _ in range(n - 1):
+        nuevo_nodo = clase_nodo(None)
+        nuevo_nodo.anterior = cola
+        cola.siguiente = nuevo_nodo
+        cola = nuevo_nodo
+    return cabeza, cola
+
+
+def bytes_por_elemento(clase_nodo, n=N_ELEMENTOS):
+    """
+    Mide con tracemalloc la memoria que ocupan n nodos enlazados.
+    Todos los nodos guardan el mismo dato (None) para medir sólo el costo
+    del nodo y no el de los datos.
+    """
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    extremos = encadenar(clase_nodo, n)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del extremos
+    return (despues - antes) / n
+
+
+def memoria_reinsercion(pool, n=N_ELEMENTOS):
+    """
+    Llena una lista, extrae la mitad y vuelve a insertar la misma cantidad.
+    Devuelve los bytes nuevos reservados durante la reinserción.
+    """
+    lista = ListaDobleEnlazada(pool)
+    for i in range(n):
+        lista.agregar_al_final(i)
+    for _ in range(n // 2):
+        lista.extraer()
+
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    for _ in range(n // 2):
+        lista.agregar_al_final(None)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return despues - antes
+
+
+def main():
+    print(f"Memoria por nodo para {N_ELEMENTOS} elementos:")
+    sin_slots = bytes_por_elemento(NodoConDict)
+    con_slots = bytes_por_elemento(Nodo)
+    print(f"  antes (__dict__):    {sin_slots:7.2f} bytes/elemento")
+    print(f"  después (__slots__): {con_slots:7.2f} bytes/elemento")
+    print(f"  ahorro: {100 * (1 - con_slots / sin_slots):.1f}%")
+
+    print(f"\nReinserción de {N_ELEMENTOS // 2} elementos luego de extraerlos:")
+    print(f"  sin pool: {memoria_reinsercion(None) / (N_ELEMENTOS // 2):7.2f} bytes nuevos/elemento")
+    print(f"  con pool: {memoria_reinsercion(PoolNodos()) / (N_ELEMENTOS // 2):7.2f} bytes nuevos/elemento")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from modules.ListaArreglo import ListaDobleEnlazadaArreglo
+import tests.TEST_problema1 as test_lde
+import unittest
+
+
+class Test_LDE_Arreglo(test_lde.Test_LDE):
+    """Corre el test de ListaDobleEnlazada sobre la variante con arreglos"""
+
+    clase_lista = ListaDobleEnlazadaArreglo
+
+    def test_reutiliza_posiciones_libres(self):
+        """
+        al extraer y volver a agregar no deben crecer los arreglos internos
+        """
+        capacidad = len(self.lde_3._datos)
+        for _ in range(10):
+            self.lde_3.extraer(5)
+        for item in range(10):
+            self.lde_3.insertar(item, 5)
+        self.assertEqual(len(self.lde_3._datos), capacidad,
+                         "Las posiciones liberadas por extraer deben reutilizarse")
+        self.recorrer_lista(self.lde_3)
+
+    def test_invertir_y_agregar(self):
+        """
+        luego de invertir (que sólo intercambia los arreglos de enlaces)
+        se debe poder seguir agregando en ambos extremos
+        """
+        self.lde_3.invertir()
+        self.lde_3.agregar_al_final("fin")
+        self.lde_3.agregar_al_inicio("inicio")
+        self.recorrer_lista(self.lde_3)
+        self.assertEqual(list(self.lde_3),
+                         ["inicio"] + self.lista_aux_3[::-1] + ["fin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
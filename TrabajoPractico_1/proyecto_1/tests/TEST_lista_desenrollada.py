@@ -0,0 +1,96 @@
+from modules.ListaDesenrollada import ListaDesenrollada
+import tests.TEST_problema1 as test_lde
+from functools import partial
+import unittest
+import random
+
+
+class Test_LDE_Desenrollada(test_lde.Test_LDE):
+    """Corre el test de ListaDobleEnlazada sobre la lista desenrollada"""
+
+    # Bloques chicos para que los 200 ítems ejerciten divisiones y uniones
+    clase_lista = partial(ListaDesenrollada, 4)
+
+    def verificar_bloques(self, lista):
+        """Comprueba los enlaces entre bloques y que ninguno exceda la capacidad"""
+        bloque = lista._primero
+        anterior = None
+        total = 0
+        while bloque is not None:
+            self.assertIs(bloque.anterior, anterior)
+            self.assertGreater(len(bloque.datos), 0, "No debe haber bloques vacíos")
+            self.assertLessEqual(len(bloque.datos), lista.capacidad_bloque)
+            total += len(bloque.datos)
+            anterior = bloque
+            bloque = bloque.siguiente
+        self.assertIs(lista._ultimo, anterior)
+        self.assertEqual(total, len(lista))
+
+    def test_operaciones_aleatorias(self):
+        """
+        aplico inserciones y extracciones en posiciones aleatorias, inversiones
+        y concatenaciones, y comparo contra una lista de Python
+        """
+        lista = ListaDesenrollada(8)
+        referencia = []
+        for paso in range(3000):
+            operacion = random.random()
+            if operacion < 0.4 or not referencia:
+                posicion = random.randint(0, len(referencia))
+                lista.insertar(paso, posicion)
+                referencia.insert(posicion, paso)
+            elif operacion < 0.85:
+                posicion = random.randrange(len(referencia))
+                self.assertEqual(lista.extraer(posicion), referencia.pop(posicion))
+            elif operacion < 0.9:
+                lista.invertir()
+                referencia.reverse()
+            elif operacion < 0.95:
+                lista.agregar_al_inicio(-paso)
+                referencia.insert(0, -paso)
+            else:
+                otra = ListaDesenrollada(8)
+                otra.extender(range(random.randint(0, 50)))
+                if random.random() < 0.5:
+                    otra.invertir()
+                referencia.extend(otra)
+                lista.concatenar(otra, mover=random.random() < 0.5)
+            if paso % 100 == 0:
+                self.verificar_bloques(lista)
+        self.verificar_bloques(lista)
+        self.assertEqual(list(lista), referencia)
+        self.recorrer_lista(lista)
+
+    def test_iteracion_inversa(self):
+        """reversed() recorre de atrás para adelante, invertida o no"""
+        self.assertEqual(list(reversed(self.lde_3)), self.lista_aux_3[::-1])
+        self.lde_3.invertir()
+        self.assertEqual(list(reversed(self.lde_3)), self.lista_aux_3)
+
+    def test_invertir_es_perezoso(self):
+        """invertir no mueve los bloques y se puede seguir operando en ambos extremos"""
+        primero = self.lde_3._primero
+        self.lde_3.invertir()
+        self.assertIs(self.lde_3._primero, primero)
+        self.lde_3.agregar_al_final("fin")
+        self.lde_3.agregar_al_inicio("inicio")
+        self.lde_3.extender(["a", "b"])
+        self.assertEqual(list(self.lde_3),
+                         ["inicio"] + self.lista_aux_3[::-1] + ["fin", "a", "b"])
+        self.recorrer_lista(self.lde_3)
+        self.verificar_bloques(self.lde_3)
+
+    def test_desde_iterable_llena_bloques(self):
+        """desde_iterable usa bloques llenos salvo el último"""
+        lista = ListaDesenrollada.desde_iterable(range(10), capacidad_bloque=4)
+        self.assertEqual(lista._primero.datos, [0, 1, 2, 3])
+        self.assertEqual(lista._ultimo.datos, [8, 9])
+        self.assertEqual(list(lista), list(range(10)))
+
+    def test_capacidad_invalida(self):
+        with self.assertRaises(ValueError):
+            ListaDesenrollada(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
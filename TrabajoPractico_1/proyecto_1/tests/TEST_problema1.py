@@ -1,23 +1,28 @@
-from modules.GraficosModulos1 import ListaDobleEnlazada
+from modules.Listadobleenlazada import ListaDobleEnlazada, PoolNodos, CursorInvalidoError
+from functools import partial
+from math import isqrt
 import unittest
 import random
 
 class Test_LDE(unittest.TestCase):
     """Test de la clase ListaDobleEnlazada"""
 
+    # Clase bajo prueba; las variantes de la lista heredan este test y la reemplazan
+    clase_lista = ListaDobleEnlazada
+
     def setUp(self):
         self.n_elementos = 200
         """ LDE vacía """
-        self.lde_1 = ListaDobleEnlazada()
+        self.lde_1 = self.clase_lista()
 
         """ LDE con elementos repetidos con lista auxiliar"""
-        self.lde_2 = ListaDobleEnlazada()
+        self.lde_2 = self.clase_lista()
         self.lista_aux_2 = random.choices(range(-self.n_elementos // 2, self.n_elementos // 2), k=self.n_elementos)
         for item in self.lista_aux_2:
             self.lde_2.agregar_al_final(item)
 
         """LDE de elementos no repetidos con lista auxiliar"""
-        self.lde_3 = ListaDobleEnlazada()
+        self.lde_3 = self.clase_lista()
         self.lista_aux_3 = random.sample(range(-self.n_elementos, self.n_elementos), self.n_elementos)
         for item in self.lista_aux_3:
             self.lde_3.agregar_al_final(item)
@@ -447,5 +452,454 @@ class Test_LDE(unittest.TestCase):
             nodo = nodo.siguiente
 
 
+class Test_PoolNodos(unittest.TestCase):
+    """Test de la reutilización de nodos con PoolNodos"""
+
+    def setUp(self):
+        self.pool = PoolNodos()
+        self.lde = ListaDobleEnlazada(self.pool)
+        for item in range(10):
+            self.lde.agregar_al_final(item)
+
+    def test_extraer_devuelve_nodos_al_pool(self):
+        """los nodos extraídos quedan en el pool sin retener el dato"""
+        nodo_medio = self.lde.cabeza.siguiente.siguiente
+        self.assertEqual(self.lde.extraer(2), 2)
+        self.assertEqual(self.lde.extraer(0), 0)
+        self.assertEqual(self.lde.extraer(), 9)
+        self.assertEqual(len(self.pool), 3)
+        self.assertIsNone(nodo_medio.dato,
+                          "El pool no debe retener referencias a los datos extraídos")
+        self.assertEqual(list(self.lde), [1, 3, 4, 5, 6, 7, 8])
+
+    def test_agregar_reutiliza_nodos(self):
+        """al agregar se reutilizan primero los nodos liberados"""
+        nodo_cola = self.lde.cola
+        self.lde.extraer()
+        self.lde.agregar_al_inicio(-1)
+        self.assertIs(self.lde.cabeza, nodo_cola)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(list(self.lde), [-1] + list(range(9)))
+        self.assertIsNone(self.lde.cabeza.anterior)
+        self.assertIs(self.lde.cabeza.siguiente.anterior, self.lde.cabeza)
+
+    def test_capacidad(self):
+        """el pool no retiene más nodos que su capacidad"""
+        pool = PoolNodos(capacidad=2)
+        lde = ListaDobleEnlazada(pool)
+        for item in range(5):
+            lde.agregar_al_final(item)
+        while len(lde):
+            lde.extraer()
+        self.assertEqual(len(pool), 2)
+
+    def test_copia_comparte_pool(self):
+        """la copia de una lista usa el mismo pool que la original"""
+        copia = self.lde.copiar()
+        copia.extraer()
+        self.lde.agregar_al_final(10)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(list(copia), list(range(9)))
+
+
+class Test_LDE_Concatenacion(unittest.TestCase):
+    """Test de concatenar moviendo nodos y de la suma diferida (copy-on-write)"""
+
+    def setUp(self):
+        self.lde_a = ListaDobleEnlazada()
+        self.lde_b = ListaDobleEnlazada()
+        for item in range(5):
+            self.lde_a.agregar_al_final(item)
+            self.lde_b.agregar_al_final(item + 10)
+
+    def test_concatenar_moviendo(self):
+        """con mover=True los nodos pasan a la lista y la donante queda vacía"""
+        cabeza_b = self.lde_b.cabeza
+        cola_b = self.lde_b.cola
+        self.lde_a.concatenar(self.lde_b, mover=True)
+
+        self.assertEqual(list(self.lde_a), list(range(5)) + list(range(10, 15)))
+        self.assertEqual(len(self.lde_a), 10)
+        self.assertIs(self.lde_a.cabeza.siguiente.siguiente.siguiente.siguiente.siguiente, cabeza_b,
+                      "Los nodos deben enlazarse, no copiarse")
+        self.assertIs(self.lde_a.cola, cola_b)
+        self.assertIs(cabeza_b.anterior.dato, 4)
+
+        self.assertEqual(len(self.lde_b), 0)
+        self.assertTrue(self.lde_b.esta_vacia())
+        self.assertIsNone(self.lde_b.cabeza)
+        self.assertIsNone(self.lde_b.cola)
+
+        # la donante sigue siendo usable
+        self.lde_b.agregar_al_final(99)
+        self.assertEqual(list(self.lde_b), [99])
+        self.assertEqual(len(self.lde_a), 10)
+
+    def test_concatenar_moviendo_extremos_vacios(self):
+        """mover desde o hacia una lista vacía"""
+        vacia = ListaDobleEnlazada()
+        vacia.concatenar(self.lde_a, mover=True)
+        self.assertEqual(list(vacia), list(range(5)))
+        self.assertIsNone(vacia.cabeza.anterior)
+        vacia.concatenar(ListaDobleEnlazada(), mover=True)
+        self.assertEqual(list(vacia), list(range(5)))
+        self.assertRaises(ValueError, vacia.concatenar, vacia, True)
+
+    def test_concatenar_consigo_misma(self):
+        """concatenar copiando una lista consigo misma duplica sus ítems"""
+        self.lde_a.concatenar(self.lde_a)
+        self.assertEqual(list(self.lde_a), list(range(5)) * 2)
+
+    def test_suma_diferida(self):
+        """la suma no copia nodos hasta que hace falta"""
+        suma = self.lde_a + self.lde_b
+        self.assertIsNotNone(suma._diferida, "La suma debe ser diferida")
+        self.assertEqual(len(suma), 10)
+        self.assertEqual(list(suma), list(range(5)) + list(range(10, 15)))
+        self.assertIsNotNone(suma._diferida, "Recorrer la suma no debe copiar los nodos")
+
+        suma.agregar_al_inicio(-1)
+        self.assertIsNone(suma._diferida)
+        self.assertEqual(list(suma), [-1] + list(range(5)) + list(range(10, 15)))
+        self.assertEqual(list(self.lde_a), list(range(5)))
+
+    def test_leer_nodos_de_un_operando(self):
+        """leer cabeza/cola de un operando no copia la suma pendiente"""
+        suma = self.lde_a + self.lde_b
+        self.assertEqual(self.lde_a.cabeza.dato, 0)
+        self.assertEqual(self.lde_b.cola.dato, 14)
+        self.assertEqual([nodo.dato for nodo in self._nodos(self.lde_a)], list(range(5)))
+        self.assertIsNotNone(suma._diferida, "Leer los nodos de un operando no debe copiar la suma")
+        self.assertEqual(list(suma), list(range(5)) + list(range(10, 15)))
+
+    @staticmethod
+    def _nodos(lista):
+        nodo = lista.cabeza
+        while nodo is not None:
+            yield nodo
+            nodo = nodo.siguiente
+
+    def test_suma_al_modificar_operando(self):
+        """modificar un operando no debe alterar una suma ya calculada"""
+        suma = self.lde_a + self.lde_b
+        doble = suma + suma
+        self.lde_a.extraer(0)
+        self.lde_b.invertir()
+        self.lde_b.concatenar(self.lde_a, mover=True)
+
+        esperado = list(range(5)) + list(range(10, 15))
+        self.assertEqual(list(suma), esperado)
+        self.assertEqual(list(doble), esperado * 2)
+        self.assertEqual(list(self.lde_a), [])
+        self.assertEqual(list(self.lde_b), [14, 13, 12, 11, 10, 1, 2, 3, 4])
+
+    def test_copiar_suma(self):
+        """la copia de una suma es independiente de la suma"""
+        suma = self.lde_a + self.lde_b
+        copia = suma.copiar()
+        suma.extraer()
+        self.assertEqual(len(copia), 10)
+        self.assertEqual(copia.cola.dato, 14)
+        self.assertIsNot(copia.cola, suma.cola)
+
+
+class Test_LDE_Indexada(Test_LDE):
+    """Corre el test de ListaDobleEnlazada con el índice por bloques activado"""
+
+    clase_lista = partial(ListaDobleEnlazada, indexada=True)
+
+    def verificar_indice(self, lista):
+        """Comprueba que el índice por bloques coincida con los nodos de la lista"""
+        indice = lista._indice
+        self.assertEqual(indice.total, len(lista))
+        self.assertEqual(sum(indice.cantidades), len(lista))
+        nodo = lista.cabeza
+        for inicio, cantidad in zip(indice.inicios, indice.cantidades):
+            self.assertGreater(cantidad, 0, "No debe haber bloques vacíos")
+            self.assertIs(nodo, inicio, "El inicio del bloque no coincide con el nodo de la lista")
+            for _ in range(cantidad):
+                nodo = nodo.siguiente
+        self.assertIsNone(nodo)
+
+    def test_operaciones_aleatorias(self):
+        """
+        aplico inserciones y extracciones en posiciones aleatorias, inversiones
+        y concatenaciones, y comparo contra una lista de Python
+        """
+        lista = ListaDobleEnlazada(indexada=True)
+        referencia = []
+        for paso in range(3000):
+            operacion = random.random()
+            if operacion < 0.45 or not referencia:
+                posicion = random.randint(0, len(referencia))
+                lista.insertar(paso, posicion)
+                referencia.insert(posicion, paso)
+            elif operacion < 0.9:
+                posicion = random.randrange(len(referencia))
+                self.assertEqual(lista.extraer(posicion), referencia.pop(posicion))
+            elif operacion < 0.95:
+                lista.invertir()
+                referencia.reverse()
+            else:
+                otra = ListaDobleEnlazada(indexada=random.random() < 0.5)
+                for item in range(random.randint(0, 50)):
+                    otra.agregar_al_final(-item)
+                referencia.extend(otra)
+                lista.concatenar(otra, mover=random.random() < 0.5)
+            if paso % 100 == 0:
+                self.verificar_indice(lista)
+        self.verificar_indice(lista)
+        self.assertEqual(list(lista), referencia)
+        self.recorrer_lista(lista)
+
+    def test_acceso_por_posicion(self):
+        """el nodo devuelto por el índice es el de la posición pedida"""
+        for posicion in range(-len(self.lde_3), len(self.lde_3)):
+            self.assertEqual(self.lde_3._obtener_nodo(posicion).dato, self.lista_aux_3[posicion])
+
+    def test_bloques_al_agregar_de_a_poco(self):
+        """extender, concatenar o mover listas chicas muchas veces no debe llenar el índice de bloques"""
+        for forma in ('extender', 'concatenar', 'mover'):
+            lista = ListaDobleEnlazada(indexada=True)
+            for item in range(5000):
+                if forma == 'extender':
+                    lista.extender([item])
+                else:
+                    otra = ListaDobleEnlazada.desde_iterable([item], indexada=True)
+                    lista.concatenar(otra, mover=forma == 'mover')
+            self.verificar_indice(lista)
+            self.assertLessEqual(len(lista._indice.cantidades), 2 * isqrt(len(lista)) + 1,
+                                 "Debe haber O(√n) bloques")
+            self.assertEqual(list(lista), list(range(5000)))
+
+    def test_indexar_lista_existente(self):
+        """se puede activar el índice sobre una lista ya cargada"""
+        lista = ListaDobleEnlazada()
+        for item in range(1000):
+            lista.agregar_al_final(item)
+        lista.indexar()
+        self.assertTrue(lista.indexada)
+        self.verificar_indice(lista)
+        self.assertEqual(lista.extraer(500), 500)
+        lista.insertar(-1, 10)
+        self.verificar_indice(lista)
+        lista.indexar(False)
+        self.assertFalse(lista.indexada)
+        self.assertEqual(lista.extraer(10), -1)
+
+
+class Test_Cursor(unittest.TestCase):
+    """Test del cursor de ListaDobleEnlazada"""
+
+    recorrer_lista = Test_LDE.recorrer_lista
+    verificar_indice = Test_LDE_Indexada.verificar_indice
+
+    def setUp(self):
+        self.lde = ListaDobleEnlazada()
+        for item in range(10):
+            self.lde.agregar_al_final(item)
+
+    def test_recorrer_en_ambos_sentidos(self):
+        """avanzar y retroceder devuelven los ítems en orden"""
+        cursor = self.lde.cursor()
+        vistos = []
+        while not cursor.en_final():
+            vistos.append(cursor.dato)
+            cursor.avanzar()
+        self.assertEqual(vistos, list(range(10)))
+        self.assertEqual(cursor.posicion, 10)
+        self.assertRaises(IndexError, cursor.avanzar)
+
+        vistos = []
+        while cursor.posicion > 0:
+            cursor.retroceder()
+            vistos.append(cursor.dato)
+        self.assertEqual(vistos, list(range(9, -1, -1)))
+        self.assertRaises(IndexError, cursor.retroceder)
+
+    def test_cursor_en_posicion(self):
+        """se puede ubicar el cursor en cualquier posición, incluso al final"""
+        self.assertEqual(self.lde.cursor(4).dato, 4)
+        self.assertEqual(self.lde.cursor(-1).dato, 9)
+        self.assertTrue(self.lde.cursor(10).en_final())
+        self.assertRaises(IndexError, self.lde.cursor, 11)
+        self.assertTrue(ListaDobleEnlazada().cursor().en_final())
+
+    def test_insertar_y_extraer(self):
+        """insertar va antes del ítem actual y extraer avanza al siguiente"""
+        cursor = self.lde.cursor(3)
+        cursor.insertar('a')
+        self.assertEqual(cursor.dato, 3)
+        self.assertEqual(cursor.posicion, 4)
+        self.assertEqual(cursor.extraer(), 3)
+        self.assertEqual(cursor.dato, 4)
+        self.assertEqual(cursor.posicion, 4)
+
+        inicio = self.lde.cursor(0)
+        inicio.insertar('inicio')
+        fin = self.lde.cursor(len(self.lde))
+        fin.insertar('fin')
+        self.assertTrue(fin.en_final())
+        self.assertEqual(list(self.lde), ['inicio', 0, 1, 2, 'a', 4, 5, 6, 7, 8, 9, 'fin'])
+        self.recorrer_lista(self.lde)
+
+        ultimo = self.lde.cursor(-1)
+        self.assertEqual(ultimo.extraer(), 'fin')
+        self.assertTrue(ultimo.en_final())
+        self.assertRaises(IndexError, ultimo.extraer)
+        self.recorrer_lista(self.lde)
+
+    def test_edicion_en_una_pasada(self):
+        """saco los pares y duplico los impares en un solo recorrido"""
+        cursor = self.lde.cursor()
+        while not cursor.en_final():
+            if cursor.dato % 2 == 0:
+                cursor.extraer()
+            else:
+                cursor.insertar(cursor.dato)
+                cursor.avanzar()
+        self.assertEqual(list(self.lde), [1, 1, 3, 3, 5, 5, 7, 7, 9, 9])
+        self.recorrer_lista(self.lde)
+
+        cursor = self.lde.cursor()
+        while not cursor.en_final():
+            cursor.extraer()
+        self.assertTrue(self.lde.esta_vacia())
+        self.assertIsNone(self.lde.cabeza)
+        self.assertIsNone(self.lde.cola)
+
+    def test_invalidacion(self):
+        """modificar la lista por otro medio invalida el cursor"""
+        cursor = self.lde.cursor(2)
+        otro = self.lde.cursor(5)
+        cursor.extraer()
+        self.assertRaises(CursorInvalidoError, otro.avanzar)
+        self.assertRaises(CursorInvalidoError, lambda: otro.dato)
+
+        cursor.avanzar()
+        self.lde.agregar_al_final(10)
+        self.assertRaises(CursorInvalidoError, cursor.insertar, 0)
+
+        cursor = self.lde.cursor()
+        self.lde.invertir()
+        self.assertRaises(CursorInvalidoError, cursor.en_final)
+
+        cursor = self.lde.cursor()
+        self.lde.concatenar(ListaDobleEnlazada())
+        self.assertRaises(CursorInvalidoError, cursor.extraer)
+
+        # leer la lista no invalida el cursor
+        cursor = self.lde.cursor()
+        list(self.lde)
+        len(self.lde)
+        self.lde.copiar()
+        self.assertEqual(cursor.dato, 10)
+
+    def test_cambiar_dato_con_suma_pendiente(self):
+        """cambiar el dato con un cursor no altera una suma ya calculada"""
+        antes = self.lde.cursor(0)
+        suma = self.lde + self.lde
+        despues = self.lde.cursor(1)
+        antes.dato = 'a'
+        despues.dato = 'b'
+        self.assertEqual(list(self.lde), ['a', 'b'] + list(range(2, 10)))
+        self.assertEqual(list(suma), list(range(10)) * 2)
+
+        cursor = suma.cursor(10)
+        cursor.dato = 'c'
+        self.assertEqual(suma.extraer(10), 'c')
+        self.assertEqual(self.lde.cabeza.dato, 'a')
+
+    def test_cursor_en_lista_indexada(self):
+        """las ediciones con cursor mantienen el índice por bloques"""
+        lista = ListaDobleEnlazada(indexada=True)
+        for item in range(2000):
+            lista.agregar_al_final(item)
+        cursor = lista.cursor(1)
+        while not cursor.en_final():
+            if cursor.dato % 3 == 0:
+                cursor.extraer()
+            else:
+                cursor.insertar(-1)
+                cursor.avanzar()
+        self.verificar_indice(lista)
+        esperado = list(lista)[1000]
+        self.assertEqual(lista.extraer(1000), esperado)
+
+    def test_cursor_con_pool(self):
+        """extraer con cursor devuelve el nodo al pool y sigue en el siguiente"""
+        pool = PoolNodos()
+        lista = ListaDobleEnlazada(pool)
+        for item in range(5):
+            lista.agregar_al_final(item)
+        cursor = lista.cursor(1)
+        self.assertEqual(cursor.extraer(), 1)
+        self.assertEqual(cursor.dato, 2)
+        self.assertEqual(len(pool), 1)
+
+
+class Test_LDE_Masivo(unittest.TestCase):
+    """Test de los constructores y exportadores masivos"""
+
+    recorrer_lista = Test_LDE.recorrer_lista
+
+    def test_desde_iterable(self):
+        """desde_iterable enlaza todos los ítems en orden"""
+        lista = ListaDobleEnlazada.desde_iterable(range(1000))
+        self.recorrer_lista(lista)
+        self.assertEqual(list(lista), list(range(1000)))
+        self.assertEqual(len(ListaDobleEnlazada.desde_iterable([])), 0)
+        self.assertIsNone(ListaDobleEnlazada.desde_iterable(iter(())).cabeza)
+
+    def test_desde_iterable_con_pool_e_indice(self):
+        """desde_iterable respeta el pool y el índice por bloques"""
+        pool = PoolNodos()
+        lista = ListaDobleEnlazada.desde_iterable(range(10), pool=pool)
+        lista.extraer()
+        otra = ListaDobleEnlazada.desde_iterable(range(500), pool=pool, indexada=True)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(otra.extraer(250), 250)
+        self.recorrer_lista(otra)
+
+    def test_extender(self):
+        """extender agrega al final, incluso con la propia lista o un generador"""
+        lista = ListaDobleEnlazada.desde_iterable([1, 2])
+        lista.extender(x * 10 for x in range(3))
+        lista.extender(lista)
+        self.assertEqual(list(lista), [1, 2, 0, 10, 20] * 2)
+        self.recorrer_lista(lista)
+
+    def test_extender_con_error(self):
+        """si el iterable falla a mitad de camino la lista queda bien enlazada"""
+        def generador():
+            yield 1
+            yield 2
+            raise ValueError("falla")
+
+        lista = ListaDobleEnlazada.desde_iterable([0])
+        self.assertRaises(ValueError, lista.extender, generador())
+        self.assertEqual(list(lista), [0, 1, 2])
+        self.recorrer_lista(lista)
+
+    def test_a_lista(self):
+        """a_lista devuelve los ítems en orden, también para sumas diferidas"""
+        lista = ListaDobleEnlazada.desde_iterable(range(100))
+        self.assertEqual(lista.a_lista(), list(range(100)))
+        self.assertEqual((lista + lista).a_lista(), list(range(100)) * 2)
+        self.assertEqual(ListaDobleEnlazada().a_lista(), [])
+
+    def test_a_numpy(self):
+        """a_numpy respeta el dtype pedido"""
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy no está instalado")
+        lista = ListaDobleEnlazada.desde_iterable(range(100))
+        arreglo = lista.a_numpy(np.int32)
+        self.assertEqual(arreglo.dtype, np.int32)
+        self.assertEqual(arreglo.tolist(), list(range(100)))
+        self.assertEqual(lista.a_numpy().tolist(), list(range(100)))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,19 +1,80 @@
 class Nodo:
-    """Nodo para lista doblemente enlazada"""
+    """Nodo para lista doblemente enlazada.
+
+    Usa __slots__ para no reservar un __dict__ por instancia: cada nodo
+    ocupa 56 bytes en lugar de ~96 (ver proyecto_1/modules/benchmark_memoria.py).
+    """
+    __slots__ = ('dato', 'siguiente', 'anterior')
+
     def __init__(self, dato):
         self.dato = dato
         self.siguiente = None
         self.anterior = None
 
 
+class PoolNodos:
+    """
+    Lista libre (free-list) de nodos liberados por extraer.
+
+    Los nodos devueltos al pool se encadenan entre sí por el campo
+    'siguiente', así que el pool no necesita memoria adicional. Al pedir
+    un nodo se reutiliza uno libre si lo hay y sólo se crea uno nuevo
+    cuando el pool está vacío. Puede compartirse entre varias listas.
+    """
+    __slots__ = ('_libre', '_cantidad', 'capacidad')
+
+    def __init__(self, capacidad=None):
+        """Crea un pool vacío. 'capacidad' limita los nodos retenidos (None = sin límite)"""
+        self._libre = None
+        self._cantidad = 0
+        self.capacidad = capacidad
+
+    def obtener(self, dato):
+        """Devuelve un nodo con 'dato', reutilizando uno libre si existe - O(1)"""
+        nodo = self._libre
+        if nodo is None:
+            return Nodo(dato)
+        self._libre = nodo.siguiente
+        self._cantidad -= 1
+        nodo.dato = dato
+        nodo.siguiente = None
+        return nodo
+
+    def liberar(self, nodo):
+        """Devuelve un nodo desenlazado al pool - O(1)"""
+        if self.capacidad is not None and self._cantidad >= self.capacidad:
+            return
+        # Soltar la referencia al dato para no retenerlo en memoria
+        nodo.dato = None
+        nodo.anterior = None
+        nodo.siguiente = self._libre
+        self._libre = nodo
+        self._cantidad += 1
+
+    def __len__(self):
+        """Cantidad de nodos disponibles para reutilizar - O(1)"""
+        return self._cantidad
+
+
 class ListaDobleEnlazada:
     """Implementación de TAD Lista Doblemente Enlazada"""
 
-    def __init__(self):
-        """Inicializa una lista vacía"""
+    def __init__(self, pool=None):
+        """
+        Inicializa una lista vacía.
+        Si se indica un PoolNodos, los nodos se toman de él y los nodos
+        extraídos se le devuelven para ser reutilizados.
+        """
         self.cabeza = None
         self.cola = None
         self.tamanio = 0
+        self._pool = pool
+
+    def _nuevo_nodo(self, item):
+        """Crea un nodo para 'item' o lo toma del pool si la lista usa uno"""
+        if self._pool is None:
+            return Nodo(item)
+        return self._pool.obtener(item)
 
     def esta_vacia(self):
         """Devuelve True si la lista está vacía - O(1)"""
@@ -21,7 +82,7 @@ class ListaDobleEnlazada:
 
     def agregar_al_inicio(self, item):
         """Agrega un nuevo ítem al inicio de la lista - O(1)"""
-        nuevo_nodo = Nodo(item)
+        nuevo_nodo = self._nuevo_nodo(item)
 
         if self.esta_vacia():
             self.cabeza = nuevo_nodo
@@ -35,7 +96,7 @@ class ListaDobleEnlazada:
 
     def agregar_al_final(self, item):
         """Agrega un nuevo ítem al final de la lista - O(1)"""
-        nuevo_nodo = Nodo(item)
+        nuevo_nodo = self._nuevo_nodo(item)
 
         if self.esta_vacia():
             self.cabeza = nuevo_nodo
@@ -88,7 +149,7 @@ class ListaDobleEnlazada:
         elif posicion == self.tamanio:
             self.agregar_al_final(item)
         else:
-            nuevo_nodo = Nodo(item)
+            nuevo_nodo = self._nuevo_nodo(item)
             nodo_actual = self._obtener_nodo(posicion)
 
             nuevo_nodo.siguiente = nodo_actual
@@ -116,40 +177,38 @@ class ListaDobleEnlazada:
         # Casos especiales para O(1) en los extremos
         if posicion == 0:
             # Extraer del inicio - O(1)
-            dato = self.cabeza.dato
-            self.cabeza = self.cabeza.siguiente
+            nodo_a_extraer = self.cabeza
+            self.cabeza = nodo_a_extraer.siguiente
             if self.cabeza:
                 self.cabeza.anterior = None
             else:
                 self.cola = None
-            self.tamanio -= 1
-            return dato
 
         elif posicion == self.tamanio - 1:
             # Extraer del final - O(1)
-            dato = self.cola.dato
-            self.cola = self.cola.anterior
+            nodo_a_extraer = self.cola
+            self.cola = nodo_a_extraer.anterior
             if self.cola:
                 self.cola.siguiente = None
             else:
                 self.cabeza = None
-            self.tamanio -= 1
-            return dato
 
         else:
             # Extraer del medio - O(n)
             nodo_a_extraer = self._obtener_nodo(posicion)
-            dato = nodo_a_extraer.dato
 
             nodo_a_extraer.anterior.siguiente = nodo_a_extraer.siguiente
             nodo_a_extraer.siguiente.anterior = nodo_a_extraer.anterior
 
-            self.tamanio -= 1
-            return dato
+        self.tamanio -= 1
+        dato = nodo_a_extraer.dato
+        if self._pool is not None:
+            self._pool.liberar(nodo_a_extraer)
+        return dato
 
     def copiar(self):
         """Realiza una copia de la lista - O(n)"""
-        nueva_lista = ListaDobleEnlazada()
+        nueva_lista = ListaDobleEnlazada(self._pool)
         actual = self.cabeza
 
         while actual is not None:
@@ -1,30 +1,133 @@
+# Modos disponibles: 'clasico' hace siempre n pasadas completas; 'adaptativo' corta cuando
+# una pasada no intercambia nada y no vuelve a recorrer lo que quedó detrás del último
+# intercambio; 'cocktail' hace lo mismo recorriendo en los dos sentidos; 'comb' compara
+# primero elementos separados por un salto que se achica (no es estable).
+MODOS = ('clasico', 'adaptativo', 'cocktail', 'comb')
+
+# Factor por el que se divide el salto de comb sort en cada pasada
+FACTOR_COMB = 1.3
+
+
+def burbuja_clasica(lista):
+    """
+    n pasadas completas (la i-ésima hasta n-i) - O(n²) siempre.
+    Devuelve (comparaciones, intercambios).
+    """
+    comparaciones = intercambios = 0
+    n = len(lista)
+    for contador in range(n):
+        tamaño_lista = n - contador
+        for i in range(1, tamaño_lista):
+            if lista[i] < lista[i - 1]:
+                lista[i], lista[i - 1] = lista[i - 1], lista[i]
+                intercambios += 1
+        comparaciones += max(tamaño_lista - 1, 0)
+    return comparaciones, intercambios
+
+
+def burbuja_adaptativa(lista):
+    """
+    Después del último intercambio de una pasada todo está en su lugar definitivo, así que
+    la pasada siguiente termina ahí; si no hubo intercambios, la lista ya está ordenada.
+    - O(n²), O(n) si ya está ordenada. Devuelve (comparaciones, intercambios).
+    """
+    comparaciones = intercambios = 0
+    fin = len(lista) - 1  # Último índice i que se compara con i-1
+    while fin > 0:
+        ultimo = 0
+        for i in range(1, fin + 1):
+            if lista[i] < lista[i - 1]:
+                lista[i], lista[i - 1] = lista[i - 1], lista[i]
+                intercambios += 1
+                ultimo = i
+        comparaciones += fin
+        fin = ultimo - 1
+    return comparaciones, intercambios
+
+
+def burbuja_cocktail(lista):
+    """
+    Como la adaptativa, pero alternando pasadas hacia adelante (llevan el mayor al final)
+    y hacia atrás (llevan el menor al principio): un elemento chico cerca del final ya no
+    tarda n pasadas en llegar a su lugar. - O(n²), O(n) si ya está ordenada.
+    Devuelve (comparaciones, intercambios).
+    """
+    comparaciones = intercambios = 0
+    inicio, fin = 1, len(lista) - 1  # Se comparan los pares (i-1, i) con inicio <= i <= fin
+    while inicio <= fin:
+        ultimo = 0
+        for i in range(inicio, fin + 1):
+            if lista[i] < lista[i - 1]:
+                lista[i], lista[i - 1] = lista[i - 1], lista[i]
+                intercambios += 1
+                ultimo = i
+        comparaciones += fin - inicio + 1
+        if not ultimo:
+            break
+        fin = ultimo - 1
+
+        primero = 0
+        for i in range(fin, inicio - 1, -1):
+            if lista[i] < lista[i - 1]:
+                lista[i], lista[i - 1] = lista[i - 1], lista[i]
+                intercambios += 1
+                primero = i
+        comparaciones += max(fin - inicio + 1, 0)
+        if not primero:
+            break
+        inicio = primero + 1
+    return comparaciones, intercambios
+
+
+def comb_sort(lista):
+    """
+    Burbuja con salto: compara lista[i] con lista[i-salto] y achica el salto por FACTOR_COMB
+    en cada pasada, así los elementos chicos del final ("tortugas") viajan lejos de una vez.
+    Con salto 1 sigue como la adaptativa hasta una pasada sin intercambios.
+    - O(n²) en el peor caso, en la práctica cerca de O(n log n). No es estable.
+    Devuelve (comparaciones, intercambios).
+    """
+    comparaciones = intercambios = 0
+    n = len(lista)
+    salto = n
+    while salto > 1:
+        salto = int(salto / FACTOR_COMB)
+        if salto <= 1:
+            break
+        for i in range(salto, n):
+            if lista[i] < lista[i - salto]:
+                lista[i], lista[i - salto] = lista[i - salto], lista[i]
+                intercambios += 1
+        comparaciones += n - salto
+    comparaciones_finales, intercambios_finales = burbuja_adaptativa(lista)
+    return comparaciones + comparaciones_finales, intercambios + intercambios_finales
+
+
+ORDENAMIENTOS = {
+    'clasico': burbuja_clasica,
+    'adaptativo': burbuja_adaptativa,
+    'cocktail': burbuja_cocktail,
+    'comb': comb_sort,
+}
+
+
 class Burbuja:
-    def __init__(self, lista):
+    def __init__(self, lista, modo='adaptativo'):
+        # 'modo' elige la variante (ver MODOS). Después de ordenar, 'comparaciones' e
+        # 'intercambios' quedan con lo que hizo la última llamada a ordenar_lista.
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconocido {modo!r}; opciones: {', '.join(MODOS)}")
         self.__lista=lista
+        self.__modo = modo
+        self.comparaciones = 0
+        self.intercambios = 0
+
 
-    
     def ordenar_lista(self):
         """ordena una lista de manera ascedente"""
-        contador=0
-        while contador<len(self.__lista):
-            #burbuja= self.__lista[0] 
-            tamaño_lista = len(self.__lista)-contador
-            for i in range(1,tamaño_lista):
-                if self.__lista[i]<self.__lista[i-1]:
-                    aux=self.__lista[i]
-                    self.__lista[i]=self.__lista[i-1]
-                    self.__lista[i-1]=aux
-
-                #     burbuja=self.__lista[i]
-                # elif self.__lista[i]==burbuja:
-                #     pass
-                # else: 
-                #     self.__lista[i-1] = self.__lista[i]
-                #     self.__lista[i]=burbuja  
-            contador+=1                  
+        self.comparaciones, self.intercambios = ORDENAMIENTOS[self.__modo](self.__lista)
         return self.__lista
-    
+
     @property
     def __str__(self):
         return f"{self.__lista}"
-
@@ -0,0 +1,81 @@
+from modules.radix_sort import es_arreglo_numpy
+
+# Rango máximo (máximo - mínimo) que se acepta: el arreglo de conteos ocupa una posición por valor
+RANGO_MAXIMO = 1 << 24
+
+
+def ordenar_por_conteo(lista, rango_maximo=RANGO_MAXIMO):
+    """
+    Devuelve una lista nueva con los enteros de 'lista' ordenados por counting sort:
+    cuenta cuántas veces aparece cada valor entre el mínimo y el máximo y los vuelve a
+    escribir en orden. - O(n + k), con k = máximo - mínimo + 1
+    """
+    elementos = list(lista)
+    if not elementos:
+        return elementos
+    if not all(isinstance(elemento, int) for elemento in elementos):
+        raise TypeError("Counting_sort sólo ordena enteros")
+    minimo = min(elementos)
+    rango = max(elementos) - minimo
+    if rango > rango_maximo:
+        raise ValueError(f"El rango de valores ({rango}) supera {rango_maximo}; usar Radix_sort")
+
+    conteo = [0] * (rango + 1)
+    for elemento in elementos:
+        conteo[elemento - minimo] += 1
+
+    resultado = []
+    for valor, veces in enumerate(conteo, minimo):
+        if veces:
+            resultado += [valor] * veces
+    return resultado
+
+
+def ordenar_por_conteo_numpy(arreglo, rango_maximo=RANGO_MAXIMO):
+    """
+    Counting sort vectorizado de un arreglo de NumPy de enteros (o bool): np.bincount
+    cuenta cada valor y np.repeat escribe cada uno tantas veces como apareció. - O(n + k)
+    """
+    import numpy as np
+
+    if arreglo.ndim != 1:
+        raise ValueError("Sólo se ordenan arreglos de una dimensión")
+    if arreglo.dtype.kind not in 'biu':
+        raise TypeError(f"Counting_sort no ordena arreglos de tipo {arreglo.dtype}")
+    if len(arreglo) == 0:
+        return arreglo.copy()
+    if arreglo.dtype.kind == 'b':
+        return ordenar_por_conteo_numpy(arreglo.view(np.uint8), rango_maximo).view(arreglo.dtype)
+
+    minimo, maximo = int(arreglo.min()), int(arreglo.max())
+    if maximo - minimo > rango_maximo:
+        raise ValueError(f"El rango de valores ({maximo - minimo}) supera {rango_maximo};"
+                         f" usar Radix_sort")
+    # Los desplazamientos se restan sin signo y en el mismo ancho del arreglo: la resta
+    # modular no desborda (ni con int8 ni con uint64 >= 2**63) y el rango ya está acotado
+    sin_signo = np.dtype(f'u{arreglo.itemsize}')
+    base = arreglo.min().view(sin_signo)
+    desplazamientos = (arreglo.view(sin_signo) - base).astype(np.intp)
+    conteo = np.bincount(desplazamientos, minlength=maximo - minimo + 1)
+    valores = (np.arange(maximo - minimo + 1, dtype=sin_signo) + base).view(arreglo.dtype)
+    return np.repeat(valores, conteo)
+
+
+class Counting_sort:
+    def __init__(self, lista, rango_maximo=RANGO_MAXIMO):
+        # Inicializa la clase con una lista de enteros (o un arreglo de NumPy de enteros).
+        # 'rango_maximo' limita la diferencia entre el máximo y el mínimo, que define
+        # el tamaño del arreglo de conteos.
+        self.__lista = lista
+        self.__rango_maximo = rango_maximo
+
+    def ordenar(self):
+        # Devuelve una lista (o un arreglo) nueva con los elementos ordenados
+        if es_arreglo_numpy(self.__lista):
+            self.__lista = ordenar_por_conteo_numpy(self.__lista, self.__rango_maximo)
+        else:
+            self.__lista = ordenar_por_conteo(self.__lista, self.__rango_maximo)
+        return self.__lista
+
+    def __str__(self):
+        return f"{self.__lista}"
@@ -0,0 +1,183 @@
+import sys
+import tracemalloc
+from collections import Counter
+
+from modules.radix_sort import Radix_sort
+
+# Campos del reporte, en el orden en que se imprimen
+CAMPOS = ('algoritmo', 'n', 'comparaciones', 'movimientos', 'memoria_adicional',
+          'profundidad_maxima', 'llamadas')
+
+
+class Contadores:
+    """Contadores compartidos por los elementos y la lista instrumentados de una medición"""
+    __slots__ = ('comparaciones', 'movimientos')
+
+    def __init__(self):
+        self.comparaciones = 0
+        self.movimientos = 0
+
+
+class Contado:
+    """Envuelve un elemento y cuenta cada comparación que se hace con él"""
+    __slots__ = ('valor', 'contadores')
+
+    def __init__(self, valor, contadores):
+        self.valor = valor
+        self.contadores = contadores
+
+    def __lt__(self, otro):
+        self.contadores.comparaciones += 1
+        return self.valor < otro.valor
+
+    def __le__(self, otro):
+        self.contadores.comparaciones += 1
+        return self.valor <= otro.valor
+
+    def __gt__(self, otro):
+        self.contadores.comparaciones += 1
+        return self.valor > otro.valor
+
+    def __ge__(self, otro):
+        self.contadores.comparaciones += 1
+        return self.valor >= otro.valor
+
+    def __eq__(self, otro):
+        self.contadores.comparaciones += 1
+        return self.valor == otro.valor
+
+    __hash__ = None
+
+
+class ListaInstrumentada(list):
+    """Lista que cuenta cada elemento que se escribe en ella (un intercambio son dos)"""
+
+    def __init__(self, elementos, contadores):
+        super().__init__(elementos)
+        self.contadores = contadores
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valor = list(valor)
+            self.contadores.movimientos += len(valor)
+        else:
+            self.contadores.movimientos += 1
+        super().__setitem__(indice, valor)
+
+
+class Reporte:
+    """
+    Operaciones que hizo un algoritmo al ordenar una entrada. No dependen de la máquina
+    ni de la carga: la misma entrada da siempre las mismas cuentas (la memoria puede
+    variar unos pocos bytes entre versiones de Python).
+      - comparaciones: entre elementos (None si el algoritmo no compara, como radix)
+      - movimientos: elementos escritos en la lista o en los buffers del algoritmo
+      - memoria_adicional: pico de bytes pedidos durante el ordenamiento (sin la entrada)
+      - profundidad_maxima: mayor cantidad de llamadas anidadas de una misma función
+        (la profundidad de recursión; 1 si no hay recursión)
+      - llamadas: cantidad de llamadas a cada función de 'modules'
+    """
+    __slots__ = CAMPOS
+
+    def __init__(self, algoritmo, n):
+        self.algoritmo = algoritmo
+        self.n = n
+        self.comparaciones = None
+        self.movimientos = 0
+        self.memoria_adicional = 0
+        self.profundidad_maxima = 0
+        self.llamadas = {}
+
+    def como_diccionario(self):
+        return {campo: getattr(self, campo) for campo in CAMPOS}
+
+    def __str__(self):
+        return ', '.join(f"{campo}={valor}" for campo, valor in self.como_diccionario().items())
+
+
+def _perfilador(llamadas, activas, reporte):
+    """Función para sys.setprofile que cuenta llamadas y anidamiento de las funciones de 'modules'"""
+    def perfilar(frame, evento, argumento):
+        if evento == 'call':
+            if not frame.f_globals.get('__name__', '').startswith('modules.') \
+                    or frame.f_globals is globals():
+                return
+            codigo = frame.f_code
+            llamadas[codigo.co_name] += 1
+            activas[codigo] += 1
+            if activas[codigo] > reporte.profundidad_maxima:
+                reporte.profundidad_maxima = activas[codigo]
+        elif evento == 'return' and frame.f_code in activas:
+            activas[frame.f_code] -= 1
+    return perfilar
+
+
+def _ordenar(clase, lista, opciones):
+    ordenador = clase(lista, **opciones)
+    ordenar = getattr(ordenador, 'ordenar', None) or ordenador.ordenar_lista
+    return ordenador, ordenar()
+
+
+def memoria_adicional(clase, lista, **opciones):
+    """Pico de bytes que pide clase(copia de lista, **opciones) al ordenar, sin contar la copia"""
+    copia = list(lista)
+    ya_trazaba = tracemalloc.is_tracing()
+    if not ya_trazaba:
+        tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _ordenar(clase, copia, opciones)
+        return max(tracemalloc.get_traced_memory()[1] - base, 0)
+    finally:
+        if not ya_trazaba:
+            tracemalloc.stop()
+
+
+def instrumentar(clase, lista, **opciones):
+    """
+    Ordena una copia de 'lista' con clase(copia, **opciones) (Burbuja, Quicksort o
+    Radix_sort) y devuelve (ordenada, Reporte). La instrumentación no toca el código de
+    los algoritmos: a los comparativos se les pasa una ListaInstrumentada de elementos
+    Contado, y de Radix_sort se leen las pasadas y movimientos que ya cuenta; las llamadas
+    y la recursión se cuentan con sys.setprofile sólo mientras dura la medición. Así, sin
+    instrumentar, los algoritmos corren igual que siempre.
+    La memoria se mide aparte, ordenando otra copia sin instrumentar (ver memoria_adicional).
+    """
+    reporte = Reporte(' '.join([clase.__name__, *map(str, opciones.values())]), len(lista))
+    contadores = Contadores()
+    comparativo = not issubclass(clase, Radix_sort)
+    if comparativo:
+        entrada = ListaInstrumentada([Contado(elemento, contadores) for elemento in lista],
+                                     contadores)
+    else:
+        entrada = list(lista)
+
+    llamadas, activas = Counter(), Counter()
+    perfil_anterior = sys.getprofile()
+    sys.setprofile(_perfilador(llamadas, activas, reporte))
+    try:
+        ordenador, ordenada = _ordenar(clase, entrada, opciones)
+    finally:
+        sys.setprofile(perfil_anterior)
+
+    reporte.llamadas = dict(llamadas)
+    reporte.memoria_adicional = memoria_adicional(clase, lista, **opciones)
+    if comparativo:
+        reporte.comparaciones = contadores.comparaciones
+        reporte.movimientos = contadores.movimientos
+        ordenada = [elemento.valor for elemento in ordenada]
+    else:
+        reporte.movimientos = ordenador.movimientos
+        ordenada = list(ordenada)
+    return ordenada, reporte
+
+
+def imprimir_reportes(reportes, archivo=None):
+    """Imprime una fila por Reporte con las métricas principales"""
+    print(f"{'algoritmo':<28}{'n':>9}{'comparaciones':>15}{'movimientos':>13}"
+          f"{'memoria':>11}{'profundidad':>13}", file=archivo)
+    for reporte in reportes:
+        comparaciones = '-' if reporte.comparaciones is None else reporte.comparaciones
+        print(f"{reporte.algoritmo:<28}{reporte.n:>9}{comparaciones:>15}{reporte.movimientos:>13}"
+              f"{reporte.memoria_adicional:>11}{reporte.profundidad_maxima:>13}", file=archivo)
@@ -0,0 +1,177 @@
+import bisect
+import itertools
+import operator
+
+from modules.counting_sort import RANGO_MAXIMO, ordenar_por_conteo
+from modules.quicksort import introsort, ordenar_por_insercion
+from modules.radix_sort import BITS_POR_DIGITO, ordenar_por_digitos
+
+# Estrategias posibles, de la más específica a la más general
+ESTRATEGIAS = ('insercion', 'corridas', 'conteo', 'radix', 'tres_vias', 'introsort')
+
+# Hasta este largo se ordena por inserción (con la lista ya casi ordenada, hasta el doble)
+UMBRAL_INSERCION = 32
+# Largo medio de corrida a partir del cual conviene intercalar las corridas existentes
+LARGO_MEDIO_CORRIDA = 32
+# Counting sort si el rango de valores es a lo sumo este múltiplo del largo
+FACTOR_RANGO_CONTEO = 4
+# Radix si el rango entra en esta cantidad de pasadas (más pasadas pierden contra introsort)
+PASADAS_RADIX = 3
+# Cantidad aproximada de elementos de la muestra con que se estima la cardinalidad
+TAMANIO_MUESTRA = 1024
+# Partición en tres vías si la muestra tiene a lo sumo esta fracción de valores distintos
+FRACCION_POCOS_DISTINTOS = 1 / 16
+
+
+class Decision:
+    """Estrategia elegida para una entrada, con el motivo y las estadísticas en que se basa"""
+    __slots__ = ('estrategia', 'motivo', 'estadisticas')
+
+    def __init__(self, estrategia, motivo, estadisticas):
+        self.estrategia = estrategia
+        self.motivo = motivo
+        self.estadisticas = estadisticas
+
+    def __str__(self):
+        detalle = ', '.join(f"{clave}={valor}" for clave, valor in self.estadisticas.items())
+        return f"{self.estrategia}: {self.motivo} ({detalle})"
+
+
+def analizar_entrada(lista):
+    """
+    Calcula las estadísticas de la entrada y elige la estrategia. Las corridas y el tipo
+    se miden sobre toda la lista (un recorrido en C); la cardinalidad, sobre una muestra
+    de unos TAMANIO_MUESTRA elementos equiespaciados. - O(n)
+    """
+    n = len(lista)
+    estadisticas = {'n': n}
+    if n <= UMBRAL_INSERCION:
+        return Decision('insercion', f"lista de a lo sumo {UMBRAL_INSERCION} elementos", estadisticas)
+
+    # descensos: posiciones i con lista[i+1] < lista[i]; ascensos: con lista[i] < lista[i+1]
+    siguientes = lista[1:]
+    descensos = sum(map(operator.lt, siguientes, lista))
+    ascensos = sum(map(operator.lt, lista, siguientes))
+    del siguientes
+    # Se cuentan las corridas en el sentido con menos cortes (las descendentes se invierten)
+    corridas = min(descensos, ascensos) + 1
+    estadisticas.update(descensos=descensos, ascensos=ascensos, corridas=corridas)
+
+    if n <= 2 * UMBRAL_INSERCION and descensos <= 2:
+        return Decision('insercion', "lista corta y casi ordenada", estadisticas)
+    if n / corridas >= LARGO_MEDIO_CORRIDA:
+        return Decision('corridas', f"corridas de {n // corridas} elementos en promedio",
+                        estadisticas)
+
+    tipos = set(map(type, lista))
+    estadisticas['tipos'] = '/'.join(sorted(tipo.__name__ for tipo in tipos))
+    if tipos == {int}:
+        rango = max(lista) - min(lista)
+        estadisticas['rango'] = rango
+        if rango <= min(FACTOR_RANGO_CONTEO * n, RANGO_MAXIMO):
+            return Decision('conteo', f"enteros con rango de a lo sumo {FACTOR_RANGO_CONTEO}·n",
+                            estadisticas)
+        if rango.bit_length() <= PASADAS_RADIX * BITS_POR_DIGITO:
+            return Decision('radix', f"enteros de hasta {PASADAS_RADIX * BITS_POR_DIGITO} bits de rango",
+                            estadisticas)
+
+    muestra = lista[::max(1, n // TAMANIO_MUESTRA)]
+    distintos = len(set(muestra))
+    estadisticas['distintos_en_muestra'] = f"{distintos}/{len(muestra)}"
+    if distintos <= FRACCION_POCOS_DISTINTOS * len(muestra):
+        return Decision('tres_vias', "pocas claves distintas", estadisticas)
+    return Decision('introsort', "caso general", estadisticas)
+
+
+def intercalar(a, b):
+    """
+    Intercala dos listas ordenadas de forma estable (ante empates va primero 'a'),
+    copiando de a bloques: con búsqueda binaria se ubica hasta dónde sigue cada lista
+    antes de que le toque a la otra. - O(n) con pocos bloques, O(n log n) en el peor caso
+    """
+    resultado = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        fin = bisect.bisect_right(a, b[j], i)
+        resultado += a[i:fin]
+        i = fin
+        if i == len(a):
+            break
+        fin = bisect.bisect_left(b, a[i], j)
+        resultado += b[j:fin]
+        j = fin
+    resultado += a[i:]
+    resultado += b[j:]
+    return resultado
+
+
+def fusionar_corridas(lista):
+    """
+    Ordenamiento natural: separa la lista en corridas no decrecientes o, si predominan
+    los descensos, estrictamente decrecientes (que se invierten sin romper la
+    estabilidad) y las intercala de a pares. - O(n log r) con r corridas
+    """
+    n = len(lista)
+    siguientes = lista[1:]
+    descensos = list(map(operator.lt, siguientes, lista))
+    if sum(descensos) <= n - 1 - sum(descensos):
+        cortes = itertools.compress(range(1, n), descensos)
+        ascendente = True
+    else:
+        cortes = itertools.compress(range(1, n), map(operator.not_, descensos))
+        ascendente = False
+    del siguientes, descensos
+    limites = [0, *cortes, n]
+    corridas = [lista[inicio:fin] if ascendente else lista[inicio:fin][::-1]
+                for inicio, fin in zip(limites, limites[1:]) if inicio < fin]
+    while len(corridas) > 1:
+        # Se intercalan corridas vecinas para que los iguales conserven su orden
+        pares = [intercalar(corridas[k], corridas[k + 1]) for k in range(0, len(corridas) - 1, 2)]
+        if len(corridas) % 2:
+            pares.append(corridas[-1])
+        corridas = pares
+    return corridas[0] if corridas else []
+
+
+def ordenar_con_estrategia(estrategia, lista):
+    """Devuelve una lista nueva con 'lista' ordenada según 'estrategia' (ver ESTRATEGIAS)"""
+    if estrategia == 'insercion':
+        copia = list(lista)
+        ordenar_por_insercion(copia, 0, len(copia) - 1)
+        return copia
+    if estrategia == 'corridas':
+        return fusionar_corridas(lista)
+    if estrategia == 'conteo':
+        return ordenar_por_conteo(lista)
+    if estrategia == 'radix':
+        return ordenar_por_digitos(lista)
+    if estrategia in ('tres_vias', 'introsort'):
+        particion = 'tres_vias' if estrategia == 'tres_vias' else 'hoare'
+        return introsort(list(lista), particion=particion)
+    raise ValueError(f"Estrategia desconocida {estrategia!r}; opciones: {', '.join(ESTRATEGIAS)}")
+
+
+class Ordenamiento_adaptativo:
+    def __init__(self, lista, traza=None):
+        # Inicializa la clase con la lista a ordenar; la lista original no se modifica.
+        # Si se pasa 'traza' (un archivo, por ejemplo sys.stderr) se escribe ahí la
+        # estrategia elegida y por qué cada vez que se ordena.
+        self.__lista = lista
+        self.__traza = traza
+        self.decision = None
+
+    def explicar(self):
+        # Analiza la entrada sin ordenarla y devuelve la Decision que se tomaría.
+        # Después de ordenar, 'decision' queda con la que se usó.
+        self.decision = analizar_entrada(self.__lista)
+        return self.decision
+
+    def ordenar(self):
+        decision = self.explicar()
+        if self.__traza is not None:
+            print(f"Ordenamiento_adaptativo -> {decision}", file=self.__traza)
+        self.__lista = ordenar_con_estrategia(decision.estrategia, self.__lista)
+        return self.__lista
+
+    def __str__(self):
+        return f"{self.__lista}"
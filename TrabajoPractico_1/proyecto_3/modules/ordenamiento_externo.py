@@ -0,0 +1,134 @@
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+
+from modules.ordenamiento_paralelo import ALGORITMOS, ordenar_con
+
+# Memoria por defecto para ordenar (64 MiB)
+MEMORIA = 64 * 2 ** 20
+# Bytes que ocupa cada número en el pico de memoria al ordenar una corrida (medidos con
+# tracemalloc para enteros de 63 bits): el objeto de Python (24 a 36), el puntero en la lista
+# (8) y las copias que hace cada algoritmo. Para un algoritmo propio se usa el de sorted.
+BYTES_POR_ELEMENTO = {'sorted': 64, 'quicksort': 56, 'radix': 112}
+# Buffer mínimo de lectura por corrida al intercalar; con más corridas se intercala por etapas
+BUFFER_MINIMO = 64 * 2 ** 10
+
+
+def leer_numeros(ruta, tipo='q', elementos_por_bloque=2 ** 16):
+    """Genera los números guardados en 'ruta' como arreglo binario de tipo 'tipo' (ver array), por bloques"""
+    with open(ruta, 'rb') as archivo:
+        yield from _leer_bloques(archivo, tipo, elementos_por_bloque)
+
+
+def _leer_bloques(archivo, tipo, elementos_por_bloque):
+    while True:
+        bloque = array(tipo)
+        try:
+            bloque.fromfile(archivo, elementos_por_bloque)
+        except EOFError:
+            # fromfile deja en 'bloque' lo que llegó a leer antes del final del archivo
+            pass
+        if not bloque:
+            return
+        yield from bloque
+
+
+def escribir_numeros(ruta, numeros, tipo='q', elementos_por_bloque=2 ** 16):
+    """Escribe los números de un iterable en 'ruta' como arreglo binario, sin tenerlos todos en memoria"""
+    numeros = iter(numeros)
+    with open(ruta, 'wb') as archivo:
+        while True:
+            bloque = array(tipo, islice(numeros, elementos_por_bloque))
+            if not bloque:
+                return
+            bloque.tofile(archivo)
+
+
+class Ordenamiento_externo:
+    def __init__(self, ruta_entrada, ruta_salida, algoritmo='sorted', memoria=MEMORIA, tipo='q',
+                 carpeta_temporal=None, bytes_por_elemento=None):
+        # Ordena archivos que no entran en memoria. La entrada y la salida son arreglos binarios
+        # con el código de tipo 'tipo' del módulo array ('q' enteros de 64 bits, 'd' float...).
+        # 'algoritmo' ordena cada corrida en memoria: uno de ALGORITMOS o una función que
+        # recibe una lista y devuelve la lista ordenada. 'memoria' es el presupuesto en bytes
+        # y las corridas parciales se guardan en 'carpeta_temporal' (por defecto, la del sistema).
+        # 'bytes_por_elemento' reemplaza la estimación de BYTES_POR_ELEMENTO.
+        if not callable(algoritmo) and algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido {algoritmo!r}; opciones: {', '.join(ALGORITMOS)}")
+        if bytes_por_elemento is None:
+            bytes_por_elemento = BYTES_POR_ELEMENTO.get(algoritmo, BYTES_POR_ELEMENTO['sorted'])
+        self.__elementos_por_corrida = memoria // bytes_por_elemento
+        if self.__elementos_por_corrida < 2 or memoria < 3 * BUFFER_MINIMO:
+            raise ValueError(f"Hacen falta al menos {3 * BUFFER_MINIMO} bytes de memoria")
+        self.__entrada = ruta_entrada
+        self.__salida = ruta_salida
+        self.__algoritmo = algoritmo
+        self.__memoria = memoria
+        self.__tipo = tipo
+        self.__carpeta_temporal = carpeta_temporal
+        self.corridas = 0
+        self.etapas = 0
+
+    def ordenar(self):
+        # Devuelve la ruta del archivo ordenado. Deja en 'corridas' cuántas corridas se
+        # ordenaron en memoria y en 'etapas' cuántas pasadas de intercalación hicieron falta.
+        with tempfile.TemporaryDirectory(dir=self.__carpeta_temporal) as carpeta:
+            corridas = self.__generar_corridas(carpeta)
+            self.corridas = len(corridas)
+            self.etapas = 0
+            # Cada corrida abierta necesita su buffer de lectura, y uno más para la salida
+            grado = max(2, self.__memoria // BUFFER_MINIMO - 1)
+            while len(corridas) > grado:
+                corridas = [self.__intercalar(corridas[i:i + grado], self.__temporal(carpeta))
+                            for i in range(0, len(corridas), grado)]
+                self.etapas += 1
+            self.__intercalar(corridas, self.__salida)
+            self.etapas += 1
+        return self.__salida
+
+    def __temporal(self, carpeta):
+        descriptor, ruta = tempfile.mkstemp(dir=carpeta, suffix='.corrida')
+        os.close(descriptor)
+        return ruta
+
+    def __generar_corridas(self, carpeta):
+        """Lee la entrada de a una corrida, la ordena en memoria y la guarda en un archivo temporal"""
+        rutas = []
+        with open(self.__entrada, 'rb') as archivo:
+            while True:
+                bloque = array(self.__tipo)
+                try:
+                    bloque.fromfile(archivo, self.__elementos_por_corrida)
+                except EOFError:
+                    pass
+                if not bloque:
+                    return rutas
+                lista = bloque.tolist()
+                del bloque
+                if callable(self.__algoritmo):
+                    ordenada = self.__algoritmo(lista)
+                else:
+                    ordenada = ordenar_con(self.__algoritmo, lista)
+                del lista
+                rutas.append(self.__temporal(carpeta))
+                with open(rutas[-1], 'wb') as corrida:
+                    array(self.__tipo, ordenada).tofile(corrida)
+                # Se libera antes de leer la siguiente corrida para no tener dos en memoria
+                del ordenada
+
+    def __intercalar(self, rutas, ruta_salida):
+        """Intercala con un montículo las corridas ordenadas de 'rutas' en 'ruta_salida' y las borra"""
+        itemsize = array(self.__tipo).itemsize
+        elementos_por_buffer = max(1, self.__memoria // (len(rutas) + 1) // itemsize)
+        archivos = [open(ruta, 'rb') for ruta in rutas]
+        try:
+            corridas = [_leer_bloques(archivo, self.__tipo, elementos_por_buffer) for archivo in archivos]
+            escribir_numeros(ruta_salida, heapq.merge(*corridas), self.__tipo, elementos_por_buffer)
+        finally:
+            for archivo in archivos:
+                archivo.close()
+        for ruta in rutas:
+            os.remove(ruta)
+        return ruta_salida
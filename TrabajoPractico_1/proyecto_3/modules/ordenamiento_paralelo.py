@@ -0,0 +1,123 @@
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from modules.quicksort import Quicksort
+from modules.radix_sort import Radix_sort
+
+# Algoritmo con que cada proceso ordena su trozo
+ALGORITMOS = ('sorted', 'quicksort', 'radix')
+
+
+def ordenar_con(algoritmo, lista):
+    """Ordena 'lista' con el algoritmo indicado (ver ALGORITMOS) y devuelve la lista ordenada"""
+    if algoritmo == 'sorted':
+        return sorted(lista)
+    if algoritmo == 'quicksort':
+        return Quicksort(lista).ordenar()
+    if algoritmo == 'radix':
+        return Radix_sort(lista).ordenar()
+    raise ValueError(f"Algoritmo desconocido {algoritmo!r}; opciones: {', '.join(ALGORITMOS)}")
+
+
+def _tipo_de(lista):
+    """Código de array ('q' o 'd') con que los elementos viajan por la memoria compartida"""
+    tipos = set(map(type, lista))
+    if tipos <= {int}:
+        return 'q'
+    if tipos <= {float}:
+        return 'd'
+    raise TypeError("El ordenamiento en paralelo sólo admite listas de int o de float (sin mezclar)")
+
+
+def _ordenar_trozo(nombre, tipo, inicio, fin, algoritmo):
+    """Tarea de cada proceso: ordena en el lugar los elementos [inicio, fin) de la memoria compartida"""
+    # La memoria la crea y la borra el padre; el hijo sólo la abre y la cierra
+    memoria = shared_memory.SharedMemory(name=nombre)
+    vista = memoria.buf.cast(tipo)
+    try:
+        vista[inicio:fin] = array(tipo, ordenar_con(algoritmo, vista[inicio:fin].tolist()))
+    finally:
+        vista.release()
+        memoria.close()
+
+
+def ordenar_en_paralelo(lista, algoritmo='sorted', procesos=None, ejecutor=None):
+    """
+    Devuelve una lista nueva con los elementos de 'lista' (int de 64 bits o float)
+    ordenados: se copian una vez a memoria compartida, cada uno de 'procesos' procesos
+    ordena un trozo contiguo en el lugar con 'algoritmo' y los trozos ordenados se
+    intercalan con un montículo (heapq.merge). Sólo viajan entre procesos el nombre de
+    la memoria y los límites de cada trozo, no los datos.
+
+    'ejecutor' es un ProcessPoolExecutor para reutilizar entre llamadas; si no se pasa
+    se crea uno por llamada. Con un solo proceso se ordena en este mismo.
+    - O(n/p · costo del algoritmo + n log p)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 and ejecutor is None:
+        return ordenar_con(algoritmo, list(lista))
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido {algoritmo!r}; opciones: {', '.join(ALGORITMOS)}")
+
+    tipo = _tipo_de(lista)
+    try:
+        valores = array(tipo, lista)
+    except OverflowError:
+        raise TypeError("El ordenamiento en paralelo sólo admite enteros de 64 bits") from None
+    n = len(valores)
+    if n < 2:
+        return valores.tolist()
+
+    memoria = shared_memory.SharedMemory(create=True, size=n * valores.itemsize)
+    vista = memoria.buf.cast(tipo)
+    try:
+        vista[:n] = valores
+        del valores
+        limites = [n * i // procesos for i in range(procesos + 1)]
+        trozos = [(inicio, fin) for inicio, fin in zip(limites, limites[1:]) if fin > inicio]
+
+        propio = ejecutor is None
+        if propio:
+            ejecutor = ProcessPoolExecutor(procesos)
+        try:
+            futuros = [ejecutor.submit(_ordenar_trozo, memoria.name, tipo, inicio, fin, algoritmo)
+                       for inicio, fin in trozos]
+            for futuro in futuros:
+                futuro.result()
+        finally:
+            if propio:
+                ejecutor.shutdown()
+
+        corridas = [vista[inicio:fin].tolist() for inicio, fin in trozos]
+    finally:
+        vista.release()
+        memoria.close()
+        memoria.unlink()
+    return list(heapq.merge(*corridas))
+
+
+class Ordenamiento_paralelo:
+    def __init__(self, lista, algoritmo='sorted', procesos=None, ejecutor=None):
+        # Inicializa la clase con la lista a ordenar (int de 64 bits o float).
+        # 'procesos' es la cantidad de trozos y procesos (por defecto, uno por núcleo) y
+        # 'ejecutor' un ProcessPoolExecutor opcional para no crear procesos en cada llamada.
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido {algoritmo!r}; opciones: {', '.join(ALGORITMOS)}")
+        if procesos is not None and procesos < 1:
+            raise ValueError("Hace falta al menos un proceso")
+        self.__lista = lista
+        self.__algoritmo = algoritmo
+        self.__procesos = procesos
+        self.__ejecutor = ejecutor
+
+    def ordenar(self):
+        # Devuelve una lista nueva con los elementos ordenados
+        self.__lista = ordenar_en_paralelo(self.__lista, self.__algoritmo, self.__procesos,
+                                           self.__ejecutor)
+        return self.__lista
+
+    def __str__(self):
+        return f"{self.__lista}"
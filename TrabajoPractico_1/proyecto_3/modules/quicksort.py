@@ -1,13 +1,189 @@
+# Motores disponibles: 'clasico' es el quicksort recursivo con el primer elemento como pivote
+# e 'introsort' la versión iterativa con mediana de tres, inserción y heapsort (ver introsort).
+MOTORES = ('clasico', 'introsort')
+# Particiones del motor introsort: 'hoare' separa en menores y mayores que el pivote y
+# 'tres_vias' junta además todos los iguales al pivote, que ya no se vuelven a tocar.
+PARTICIONES = ('hoare', 'tres_vias')
+
+# Particiones de hasta este tamaño se terminan de ordenar por inserción
+UMBRAL_INSERCION = 16
+# Desde este tamaño el pivote es el "ninther" de Tukey (mediana de tres medianas de tres)
+UMBRAL_NINTHER = 128
+
+
+def ordenar_por_insercion(lista, inicio, fin):
+    """Ordena lista[inicio..fin] (inclusive) por inserción - O(k²), O(k) si ya está casi ordenada"""
+    for i in range(inicio + 1, fin + 1):
+        elemento = lista[i]
+        j = i - 1
+        while j >= inicio and elemento < lista[j]:
+            lista[j + 1] = lista[j]
+            j -= 1
+        lista[j + 1] = elemento
+
+
+def heapsort(lista, inicio, fin):
+    """Ordena lista[inicio..fin] (inclusive) con un montículo de máximo - O(k log k)"""
+    def hundir(raiz, ultimo):
+        # Baja lista[inicio + raiz] hasta que sea mayor que sus hijos (índices relativos a inicio)
+        elemento = lista[inicio + raiz]
+        hijo = 2 * raiz + 1
+        while hijo <= ultimo:
+            if hijo < ultimo and lista[inicio + hijo] < lista[inicio + hijo + 1]:
+                hijo += 1
+            if not elemento < lista[inicio + hijo]:
+                break
+            lista[inicio + raiz] = lista[inicio + hijo]
+            raiz = hijo
+            hijo = 2 * raiz + 1
+        lista[inicio + raiz] = elemento
+
+    ultimo = fin - inicio
+    for raiz in range((ultimo - 1) // 2, -1, -1):
+        hundir(raiz, ultimo)
+    for ultimo in range(ultimo, 0, -1):
+        lista[inicio], lista[inicio + ultimo] = lista[inicio + ultimo], lista[inicio]
+        hundir(0, ultimo - 1)
+
+
+def _mediana_de_tres(lista, a, b, c):
+    """Devuelve el índice (a, b o c) cuyo elemento es la mediana de los tres"""
+    if lista[a] < lista[b]:
+        if lista[b] < lista[c]:
+            return b
+        return c if lista[a] < lista[c] else a
+    if lista[a] < lista[c]:
+        return a
+    return c if lista[b] < lista[c] else b
+
+
+def elegir_pivote(lista, inicio, fin):
+    """Índice del pivote: mediana de tres (extremos y medio) o ninther en particiones grandes"""
+    medio = (inicio + fin) // 2
+    if fin - inicio + 1 < UMBRAL_NINTHER:
+        return _mediana_de_tres(lista, inicio, medio, fin)
+    paso = (fin - inicio + 1) // 8
+    return _mediana_de_tres(
+        lista,
+        _mediana_de_tres(lista, inicio, inicio + paso, inicio + 2 * paso),
+        _mediana_de_tres(lista, medio - paso, medio, medio + paso),
+        _mediana_de_tres(lista, fin - 2 * paso, fin - paso, fin))
+
+
+def particionar(lista, inicio, fin):
+    """
+    Partición de Hoare con el pivote elegido por elegir_pivote: deja el pivote en su
+    lugar definitivo y devuelve su posición. Los índices se detienen en los elementos
+    iguales al pivote, así las claves repetidas se reparten entre los dos lados. - O(k)
+    """
+    indice_pivote = elegir_pivote(lista, inicio, fin)
+    lista[inicio], lista[indice_pivote] = lista[indice_pivote], lista[inicio]
+    pivote = lista[inicio]
+    izquierda, derecha = inicio + 1, fin
+    while True:
+        while izquierda <= derecha and lista[izquierda] < pivote:
+            izquierda += 1
+        # lista[inicio] es el pivote y frena a 'derecha' sin chequear el índice
+        while pivote < lista[derecha]:
+            derecha -= 1
+        if izquierda >= derecha:
+            break
+        lista[izquierda], lista[derecha] = lista[derecha], lista[izquierda]
+        izquierda += 1
+        derecha -= 1
+    lista[inicio], lista[derecha] = lista[derecha], lista[inicio]
+    return derecha
+
+
+def particionar_tres_vias(lista, inicio, fin):
+    """
+    Partición de Dijkstra (bandera holandesa) con el pivote elegido por elegir_pivote:
+    deja lista[inicio..menor-1] < pivote, lista[menor..mayor] == pivote y
+    lista[mayor+1..fin] > pivote en una sola pasada y devuelve (menor, mayor).
+    Con pocas claves distintas cada pasada deja fuera todas las copias del pivote. - O(k)
+    """
+    pivote = lista[elegir_pivote(lista, inicio, fin)]
+    menor, i, mayor = inicio, inicio, fin
+    while i <= mayor:
+        elemento = lista[i]
+        if elemento < pivote:
+            lista[i] = lista[menor]
+            lista[menor] = elemento
+            menor += 1
+            i += 1
+        elif pivote < elemento:
+            lista[i] = lista[mayor]
+            lista[mayor] = elemento
+            mayor -= 1
+        else:
+            i += 1
+    return menor, mayor
+
+
+def introsort(lista, inicio=0, fin=None, particion='hoare'):
+    """
+    Ordena lista[inicio..fin] (inclusive) en el lugar sin recursión: particiona siempre
+    la parte más chica y apila la más grande, así la pila nunca pasa de O(log n)
+    entradas. Si una parte se particiona más de 2·log2(n) veces (pivotes malos) se
+    ordena con heapsort, y las partes chicas se terminan por inserción. 'particion'
+    elige entre particionar y particionar_tres_vias (ver PARTICIONES).
+    - O(n log n) en el peor caso, O(n·k) con k claves distintas en 'tres_vias'
+    """
+    tres_vias = particion == 'tres_vias'
+    if fin is None:
+        fin = len(lista) - 1
+    if fin - inicio < 1:
+        return lista
+    pila = [(inicio, fin, 2 * (fin - inicio + 1).bit_length())]
+    while pila:
+        inicio, fin, profundidad = pila.pop()
+        while fin - inicio + 1 > UMBRAL_INSERCION:
+            if profundidad == 0:
+                heapsort(lista, inicio, fin)
+                break
+            profundidad -= 1
+            # lista[menor..mayor] ya está en su lugar: el pivote o todos sus iguales
+            if tres_vias:
+                menor, mayor = particionar_tres_vias(lista, inicio, fin)
+            else:
+                menor = mayor = particionar(lista, inicio, fin)
+            if menor - inicio < fin - mayor:
+                pila.append((mayor + 1, fin, profundidad))
+                fin = menor - 1
+            else:
+                pila.append((inicio, menor - 1, profundidad))
+                inicio = mayor + 1
+        else:
+            ordenar_por_insercion(lista, inicio, fin)
+    return lista
+
+
 class Quicksort:
-    def __init__(self, lista):
+    def __init__(self, lista, motor='introsort', particion='hoare'):
         # Constructor que inicializa el objeto con la lista que se desea ordenar.
         # La lista se almacena como un atributo privado (__lista) del objeto.
+        # 'motor' elige el algoritmo (ver MOTORES): el clásico llega al límite de recursión
+        # con listas ya ordenadas de unos 1000 elementos; introsort no.
+        # 'particion' (ver PARTICIONES) conviene en 'tres_vias' con muchas claves repetidas.
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconocido {motor!r}; opciones: {', '.join(MOTORES)}")
+        if particion not in PARTICIONES:
+            raise ValueError(f"Partición desconocida {particion!r}; opciones: {', '.join(PARTICIONES)}")
+        if motor == 'clasico' and particion != 'hoare':
+            raise ValueError("El motor clásico sólo tiene la partición 'hoare'")
         self.__lista = lista
+        self.__motor = motor
+        self.__particion = particion
 
     def ordenar(self, indice_inicio=None, indice_final=None, lista=None):
         # Método que implementa el algoritmo de Quicksort para ordenar la lista.
         # Si no se pasan índices de inicio y final, ni una lista, se usan los valores por defecto.
 
+        if self.__motor == 'introsort':
+            introsort(self.__lista if lista is None else lista,
+                      0 if indice_inicio is None else indice_inicio, indice_final, self.__particion)
+            return self.__lista
+
         if lista is None:
             # Si no se pasa una lista al método, se usa la lista almacenada en el objeto.
             lista = self.__lista
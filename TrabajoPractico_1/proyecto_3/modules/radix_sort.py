@@ -1,10 +1,242 @@
+import sys
+from array import array
+from itertools import accumulate
+
+# Motores disponibles: 'cadenas' ordena por los dígitos decimales del texto de cada número
+# y 'aritmetico' extrae los dígitos en base 2**bits_por_digito con desplazamientos y máscaras.
+MOTORES = ('cadenas', 'aritmetico')
+BITS_POR_DIGITO = 11
+
+SIGNO_64 = 1 << 63
+MASCARA_64 = (1 << 64) - 1
+
+
+def pasada_por_conteo(origen, destino, desplazamiento, mascara, claves=None):
+    """
+    Pasada estable de counting sort de 'origen' en 'destino' (del mismo largo) por el
+    dígito (x >> desplazamiento) & mascara. Con 'claves', 'origen' tiene índices y el
+    dígito sale de claves[x]. Devuelve False sin tocar 'destino' si todos los elementos
+    tienen el mismo dígito y la pasada no cambiaría nada. - O(n + cubetas)
+    """
+    if claves is None:
+        digitos = [(x >> desplazamiento) & mascara for x in origen]
+    else:
+        digitos = [(claves[x] >> desplazamiento) & mascara for x in origen]
+    # Cantidad de elementos por dígito, en una lista del tamaño de la base
+    conteo = [0] * (mascara + 1)
+    for digito in digitos:
+        conteo[digito] += 1
+    if not digitos or conteo[digitos[0]] == len(digitos):
+        return False
+
+    # Posición inicial de cada dígito en 'destino': suma acumulada de los conteos anteriores
+    inicio = list(accumulate(conteo, initial=0))
+
+    # Se recorre en orden y cada elemento va al siguiente lugar libre de su dígito (estable)
+    for elemento, digito in zip(origen, digitos):
+        posicion = inicio[digito]
+        destino[posicion] = elemento
+        inicio[digito] = posicion + 1
+    return True
+
+
+def contar_pasada(estadisticas, movimientos):
+    """Suma una pasada que escribió 'movimientos' elementos a 'estadisticas', si se pasó"""
+    if estadisticas is not None:
+        estadisticas['pasadas'] = estadisticas.get('pasadas', 0) + 1
+        estadisticas['movimientos'] = estadisticas.get('movimientos', 0) + movimientos
+
+
+def _ordenar_enteros(origen, bits_por_digito, claves=None, estadisticas=None):
+    """
+    Radix LSD sobre 'origen' (que se reutiliza como buffer) alternando con otro del mismo
+    largo. Sin 'claves' ordena los enteros no negativos de 'origen'; con 'claves' ordena
+    los índices de 'origen' según esos enteros no negativos.
+    """
+    destino = [0] * len(origen)
+    mascara = (1 << bits_por_digito) - 1
+    maximo = max(origen if claves is None else claves)
+    for desplazamiento in range(0, maximo.bit_length(), bits_por_digito):
+        if pasada_por_conteo(origen, destino, desplazamiento, mascara, claves):
+            origen, destino = destino, origen
+            contar_pasada(estadisticas, len(origen))
+    return origen
+
+
+def transformar_claves(claves):
+    """
+    Devuelve enteros no negativos que se ordenan igual que 'claves' (int o float).
+    A los enteros se les resta el mínimo si hay negativos. Los flotantes se reinterpretan
+    como sus 64 bits IEEE-754 invirtiendo el bit de signo de los positivos y todos los bits
+    de los negativos, así el orden de los enteros sin signo coincide con el de los números.
+    Lanza TypeError con claves de otros tipos y ValueError con NaN. - O(n)
+    """
+    tipos = set(map(type, claves))
+    if all(issubclass(tipo, int) for tipo in tipos):
+        minimo = min(claves, default=0)
+        return list(claves) if minimo >= 0 else [c - minimo for c in claves]
+    if not all(issubclass(tipo, (int, float)) for tipo in tipos):
+        raise TypeError("Radix_sort sólo ordena claves enteras o de punto flotante")
+
+    if any(issubclass(tipo, int) for tipo in tipos):
+        # Con enteros y flotantes mezclados se comparan como float: tienen que ser exactos
+        for c in claves:
+            if isinstance(c, int) and int(float(c)) != c:
+                raise ValueError(f"El entero {c} no se puede representar exactamente como float")
+    # Sumar 0.0 convierte los int a float y -0.0 en 0.0, que para sorted() son iguales
+    valores = array('d', [c + 0.0 for c in claves])
+    if any(v != v for v in valores):
+        raise ValueError("No se pueden ordenar claves NaN")
+    bits = array('Q')
+    bits.frombytes(valores.tobytes())
+    return [b ^ MASCARA_64 if b & SIGNO_64 else b ^ SIGNO_64 for b in bits]
+
+
+def ordenar_por_digitos(lista, bits_por_digito=BITS_POR_DIGITO, clave=None, estadisticas=None):
+    """
+    Devuelve una lista nueva con los elementos de 'lista' ordenados en forma estable por
+    radix LSD en base 2**bits_por_digito. Los elementos (o clave(elemento), si se pasa
+    'clave') tienen que ser int o float; ver transformar_claves. Si se pasa el diccionario
+    'estadisticas' se le suman las pasadas hechas y los elementos que movieron.
+    - O(n * bits de la clave / bits_por_digito)
+    """
+    elementos = list(lista)
+    if not elementos:
+        return elementos
+    claves = transformar_claves(elementos if clave is None else [clave(e) for e in elementos])
+
+    if clave is None and all(type(e) is int for e in elementos):
+        # Enteros sin clave: se ordenan los valores desplazados y se recupera el mínimo
+        minimo = min(elementos)
+        ordenados = _ordenar_enteros(claves, bits_por_digito, estadisticas=estadisticas)
+        return ordenados if minimo >= 0 else [c + minimo for c in ordenados]
+
+    # En el resto de los casos se ordenan los índices y al final se toman los elementos,
+    # así se devuelven los mismos objetos y los iguales quedan en el orden original
+    orden = _ordenar_enteros(list(range(len(elementos))), bits_por_digito, claves, estadisticas)
+    return [elementos[i] for i in orden]
+
+
+def es_arreglo_numpy(objeto):
+    """True si 'objeto' es un ndarray. Si nadie importó NumPy no puede serlo, así que no se importa"""
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(objeto, np.ndarray)
+
+
+def claves_numpy(arreglo):
+    """
+    Versión vectorizada de transformar_claves para un arreglo de NumPy de una dimensión
+    (bool, entero o flotante): devuelve un arreglo de enteros sin signo del mismo ancho
+    que se ordena igual, ya desplazado para que el mínimo sea 0. - O(n)
+    """
+    import numpy as np
+
+    if arreglo.ndim != 1:
+        raise ValueError("Sólo se ordenan arreglos de una dimensión")
+    tipo = arreglo.dtype
+    if not tipo.isnative:
+        arreglo = arreglo.astype(tipo.newbyteorder('='))
+        tipo = arreglo.dtype
+    sin_signo = np.dtype(f'u{tipo.itemsize}')
+    signo = sin_signo.type(1 << (8 * tipo.itemsize - 1))
+
+    if tipo.kind in 'bu':
+        claves = arreglo.view(sin_signo)
+    elif tipo.kind == 'i':
+        claves = arreglo.view(sin_signo) ^ signo
+    elif tipo.kind == 'f':
+        if np.isnan(arreglo).any():
+            raise ValueError("No se pueden ordenar claves NaN")
+        # Igual que en transformar_claves: sumar 0 convierte -0.0 en 0.0
+        bits = (arreglo + tipo.type(0)).view(sin_signo)
+        claves = np.where(bits & signo, ~bits, bits | signo)
+    else:
+        raise TypeError(f"Radix_sort no ordena arreglos de tipo {tipo}")
+    return claves - claves.min() if len(claves) else claves
+
+
+def ordenar_numpy(arreglo, bits_por_digito=BITS_POR_DIGITO, clave=None, estadisticas=None):
+    """
+    Radix LSD vectorizado: devuelve un arreglo nuevo con los elementos de 'arreglo'
+    ordenados en forma estable sin pasarlos a lista. 'clave', si se pasa, recibe el
+    arreglo entero y devuelve el arreglo de claves (por ejemplo, un campo de un arreglo
+    estructurado).
+
+    En cada pasada np.bincount cuenta los dígitos (y permite saltear las pasadas en que
+    todos coinciden) y la permutación estable por el dígito sale de np.argsort con
+    kind='stable', que para enteros de hasta 16 bits NumPy resuelve con counting sort.
+    Las permutaciones se componen y el arreglo se reordena una sola vez al final.
+    'estadisticas' es como en ordenar_por_digitos. - O(n * bits de la clave / bits_por_digito)
+    """
+    import numpy as np
+
+    claves = claves_numpy(arreglo if clave is None else np.asarray(clave(arreglo)))
+    if len(claves) != len(arreglo):
+        raise ValueError("La clave debe devolver un arreglo del mismo largo")
+    if len(claves) < 2:
+        return arreglo.copy()
+    if claves.dtype.itemsize < 4:
+        # La máscara de hasta 24 bits no entra en los tipos de 8 y 16 bits
+        claves = claves.astype(np.uint32)
+
+    mascara = (1 << bits_por_digito) - 1
+    tipo_digito = np.uint16 if bits_por_digito <= 16 else np.uint32
+    orden = None
+    for desplazamiento in range(0, int(claves.max()).bit_length(), bits_por_digito):
+        digitos = ((claves >> desplazamiento) & mascara).astype(tipo_digito)
+        if np.bincount(digitos, minlength=mascara + 1).max() == len(claves):
+            continue
+        permutacion = np.argsort(digitos, kind='stable')
+        claves = claves[permutacion]
+        orden = permutacion if orden is None else orden[permutacion]
+        contar_pasada(estadisticas, len(claves))
+    return arreglo.copy() if orden is None else arreglo[orden]
+
+
 class Radix_sort:
-    def __init__(self, lista):
+    def __init__(self, lista, motor='aritmetico', bits_por_digito=BITS_POR_DIGITO, clave=None):
         # Inicializa la clase con una lista de números.
         # La lista es almacenada como un atributo privado.
+        # 'motor' elige cómo se obtienen los dígitos (ver MOTORES) y 'bits_por_digito'
+        # la base del motor aritmético: 8, 11 y 16 bits son 256, 2048 y 65536 cubetas.
+        # El motor aritmético ordena también negativos, flotantes y, con 'clave', cualquier
+        # elemento cuya clave sea int o float; el de cadenas sólo enteros no negativos.
+        # Con un arreglo de NumPy el motor aritmético trabaja vectorizado (ver ordenar_numpy).
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconocido {motor!r}; opciones: {', '.join(MOTORES)}")
+        if not 1 <= bits_por_digito <= 24:
+            raise ValueError("bits_por_digito debe estar entre 1 y 24")
+        if motor == 'cadenas' and clave is not None:
+            raise ValueError("El motor de cadenas no admite 'clave'; usar motor='aritmetico'")
+        # Después de ordenar, 'pasadas' y 'movimientos' cuentan las pasadas por dígito
+        # hechas y los elementos escritos en ellas (se cuentan de a pasada, no de a elemento).
         self.__lista = lista
+        self.__motor = motor
+        self.__bits_por_digito = bits_por_digito
+        self.__clave = clave
+        self.pasadas = 0
+        self.movimientos = 0
 
     def ordenar(self):
+        estadisticas = {}
+        self.__lista = self.__ordenar(estadisticas)
+        self.pasadas = estadisticas.get('pasadas', 0)
+        self.movimientos = estadisticas.get('movimientos', 0)
+        return self.__lista
+
+    def __ordenar(self, estadisticas):
+        if es_arreglo_numpy(self.__lista):
+            if self.__motor != 'aritmetico':
+                raise ValueError("Los arreglos de NumPy sólo se ordenan con motor='aritmetico'")
+            return ordenar_numpy(self.__lista, self.__bits_por_digito, self.__clave, estadisticas)
+        if self.__motor == 'aritmetico':
+            return ordenar_por_digitos(self.__lista, self.__bits_por_digito, self.__clave,
+                                       estadisticas)
+
+        if not all(isinstance(elemento, int) and elemento >= 0 for elemento in self.__lista):
+            raise ValueError("El motor de cadenas sólo ordena enteros no negativos;"
+                             " usar motor='aritmetico'")
+
         # Determina la cantidad máxima de dígitos en los números de la lista.
         # Esto se hace buscando el número máximo de dígitos en cada número convertido a cadena.
         cantidad_de_digitos = 0
@@ -51,10 +283,10 @@ class Radix_sort:
             # - Cada número (elemento) se añade a la lista final.
             # Esto nos permite "aplanar" la lista auxiliar (lista_auxiliar) en una sola lista (lista_normalizada).
             lista_normalizada = [elemento for sublista in lista_auxiliar for elemento in sublista]
+            # Cada elemento se escribió en una sublista y de vuelta en la lista normalizada
+            contar_pasada(estadisticas, 2 * len(lista_normalizada))
 
         # Convierte las cadenas normalizadas de vuelta a números enteros.
         # El resultado final es la lista ordenada.
-        self.__lista = [int(elemento) for elemento in lista_normalizada]
-
-        return self.__lista
+        return [int(elemento) for elemento in lista_normalizada]
 
@@ -7,66 +7,62 @@
     #necesita indices.
     #usa menos operaciones pero mas memoria.
 
-import time
-import random
-import matplotlib.pyplot as plt
-from modules.burbuja import Burbuja
-from modules.quicksort import Quicksort
-from modules.radix_sort import Radix_sort
-import random
-from modules.quicksort import Quicksort
+# Mide Burbuja, Quicksort, Radix_sort, Ordenamiento_adaptativo y sorted() sobre entradas
+# aleatorias, ordenadas, inversas, casi ordenadas, en tubos de órgano, con pocos valores
+# distintos, con distribución de Zipf y con enteros grandes (suite 'matriz' de los
+# benchmarks). Cada entrada sale de una semilla fija, así dos corridas miden lo mismo.
+# No abre ventanas: guarda los resultados en JSON (y opcionalmente CSV y un gráfico PNG).
+#
+# Uso, desde la carpeta del proyecto o desde la raíz del repositorio:
+#     python tests/main.py --tamanios 1000 10000 100000 --json resultados.json
+# Sin --tamanios mide de 10^3 a 10^7 elementos, lo que tarda bastante más de una hora.
 
-for i in range (500):
-    lista = [random.randint(10000, 99999) for _ in range(500)]
-    
-ordenamiento= Burbuja(lista)
-ordenamiento1 = Quicksort(lista)
-ordenamiento2 = Radix_sort(lista)
+import argparse
+import os
+import sys
 
-def medir_tiempos():
-    tamaños = list(range(1, 1001, 100))  # Tamaños de lista de 1 a 1000, incrementos de 100
-    tiempos_burbuja = []
-    tiempos_quicksort = []
-    tiempos_radix = []
-    tiempos_sorted = []
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
 
-    for tamaño in tamaños:
-        lista = [random.randint(0, 1000) for _ in range(tamaño)]
+from benchmarks.ejecucion import ejecutar_suite
+from benchmarks.salida import escribir_csv, escribir_json, graficar, imprimir_tabla
+from benchmarks.suites import matriz
 
-        # Medir Burbuja
-        burbuja = Burbuja(lista.copy())
-        inicio = time.perf_counter()
-        burbuja.ordenar_lista()
-        tiempos_burbuja.append(time.perf_counter() - inicio)
+RESULTADOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'data', 'resultados_ordenamiento.json')
 
-        # Medir Quicksort
-        quicksort = Quicksort(lista.copy())
-        inicio = time.perf_counter()
-        quicksort.ordenar()
-        tiempos_quicksort.append(time.perf_counter() - inicio)
 
-        # Medir Radix Sort
-        radix = Radix_sort(lista.copy())
-        inicio = time.perf_counter()
-        radix.ordenar()
-        tiempos_radix.append(time.perf_counter() - inicio)
-        #print(f"Tiempos Radix: {tiempos_radix}")
-        # Medir sorted
-        inicio = time.perf_counter()
-        sorted(lista.copy())
-        tiempos_sorted.append(time.perf_counter() - inicio)
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Matriz de tiempos de los algoritmos de ordenamiento")
+    parser.add_argument('-n', '--tamanios', type=int, nargs='+', default=matriz.TAMANIOS,
+                        help="tamaños de entrada (por defecto de 10^3 a 10^7)")
+    parser.add_argument('-e', '--entradas', nargs='+', choices=list(matriz.ENTRADAS),
+                        help="formas de entrada a medir (por defecto, todas)")
+    parser.add_argument('--burbuja-maximo', type=int, default=matriz.BURBUJA_N_MAXIMO,
+                        help="tamaño más grande en que se mide Burbuja")
+    parser.add_argument('-r', '--repeticiones', type=int, default=3,
+                        help="muestras por medición (por defecto 3)")
+    parser.add_argument('--json', default=RESULTADOS, help="archivo JSON con las mediciones")
+    parser.add_argument('--csv', help="guarda además una fila de estadísticas por medición")
+    parser.add_argument('--graficar', metavar='ARCHIVO', help="guarda un gráfico PNG de los tiempos")
+    parser.add_argument('-q', '--silencioso', action='store_true', help="no muestra el progreso")
+    return parser
 
-    # Graficar resultados
-    plt.figure(figsize=(10, 6))
-    plt.plot(tamaños, tiempos_burbuja, label='Burbuja', marker='o')
-    plt.plot(tamaños, tiempos_quicksort, label='Quicksort', marker='o')
-    plt.plot(tamaños, tiempos_radix, label='Radix Sort', marker='o')
-    plt.plot(tamaños, tiempos_sorted, label='sorted() de Python', marker='o')
-    plt.xlabel('Tamaño de la lista')
-    plt.ylabel('Tiempo de ejecución (segundos)')
-    plt.title('Comparación de Tiempos de Ejecución de Algoritmos de Ordenamiento')
-    plt.legend()
-    plt.grid()
-    plt.show()
 
-medir_tiempos()
\ No newline at end of file
+def medir_tiempos(argv=None):
+    args = crear_parser().parse_args(argv)
+    matriz.BURBUJA_N_MAXIMO = args.burbuja_maximo
+    mediciones = ejecutar_suite('matriz', args.tamanios, args.entradas, args.repeticiones,
+                                progreso=None if args.silencioso else sys.stderr)
+    imprimir_tabla(mediciones)
+    escribir_json(mediciones, args.json)
+    if args.csv:
+        escribir_csv(mediciones, args.csv)
+    if args.graficar:
+        graficar(mediciones, args.graficar, 'Agg')
+    return mediciones
+
+
+if __name__ == '__main__':
+    medir_tiempos()
@@ -1,7 +1,18 @@
 # Archivo de test para realizar pruebas unitarias del modulo1
-from modules.burbuja import Burbuja
-from modules.radix_sort import Radix_sort
-from modules.quicksort import Quicksort
+from modules.burbuja import Burbuja, MODOS as MODOS_BURBUJA
+from modules.radix_sort import Radix_sort, MOTORES
+from modules.quicksort import Quicksort, heapsort
+from modules.counting_sort import Counting_sort
+from modules.ordenamiento_paralelo import ALGORITMOS, Ordenamiento_paralelo
+from modules.ordenamiento_externo import Ordenamiento_externo, escribir_numeros, leer_numeros
+from modules.instrumentacion import instrumentar
+from modules.ordenamiento_adaptativo import (ESTRATEGIAS, Ordenamiento_adaptativo,
+                                             ordenar_con_estrategia)
+import io
+import math
+import os
+import random
+import tempfile
 import unittest
 
 class TestSortingAlgorithms(unittest.TestCase):
@@ -15,6 +26,36 @@ class TestSortingAlgorithms(unittest.TestCase):
         resultado = burbuja.ordenar_lista()
         self.assertEqual(resultado, self.lista_ordenada)
 
+    def test_burbuja_modos(self):
+        generador = random.Random(5)
+        lista = [generador.randint(-50, 50) for _ in range(200)]
+        for modo in MODOS_BURBUJA:
+            burbuja = Burbuja(lista.copy(), modo)
+            self.assertEqual(burbuja.ordenar_lista(), sorted(lista))
+            self.assertEqual(Burbuja([], modo).ordenar_lista(), [])
+        with self.assertRaises(ValueError):
+            Burbuja(lista, 'shell')
+
+    def test_burbuja_adaptativa_cuenta_operaciones(self):
+        n = 100
+        ordenada = list(range(n))
+        # Ya ordenada: una sola pasada sin intercambios
+        burbuja = Burbuja(ordenada.copy())
+        burbuja.ordenar_lista()
+        self.assertEqual((burbuja.comparaciones, burbuja.intercambios), (n - 1, 0))
+        clasica = Burbuja(ordenada.copy(), 'clasico')
+        clasica.ordenar_lista()
+        self.assertEqual(clasica.comparaciones, n * (n - 1) // 2)
+        # El menor al final: la adaptativa necesita n-1 pasadas y cocktail sólo una de ida y vuelta
+        tortuga = ordenada[1:] + [0]
+        adaptativa = Burbuja(tortuga.copy())
+        adaptativa.ordenar_lista()
+        cocktail = Burbuja(tortuga.copy(), 'cocktail')
+        self.assertEqual(cocktail.ordenar_lista(), ordenada)
+        self.assertEqual(cocktail.intercambios, adaptativa.intercambios)
+        self.assertLess(cocktail.comparaciones, 4 * n)
+        self.assertEqual(adaptativa.comparaciones, n * (n - 1) // 2)
+
     def test_quicksort(self):
         quicksort = Quicksort(self.lista_desordenada.copy())
         resultado = quicksort.ordenar()
@@ -49,5 +90,266 @@ class TestSortingAlgorithms(unittest.TestCase):
         self.assertEqual(quicksort.ordenar(), [42])
         self.assertEqual(radix.ordenar(), [42])
 
+    def test_radix_motor_aritmetico(self):
+        generador = random.Random(0)
+        for n in (0, 1, 2, 50, 1000):
+            lista = [generador.randrange(10 ** generador.randint(1, 15)) for _ in range(n)]
+            for bits in (1, 8, 11, 16):
+                radix = Radix_sort(lista, motor='aritmetico', bits_por_digito=bits)
+                self.assertEqual(radix.ordenar(), sorted(lista))
+            self.assertEqual(Radix_sort(lista, motor='cadenas').ordenar(), sorted(lista))
+
+    def test_radix_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            Radix_sort([1], motor='otro')
+        with self.assertRaises(ValueError):
+            Radix_sort([1], motor='aritmetico', bits_por_digito=0)
+        with self.assertRaises(ValueError):
+            Radix_sort([1], motor='cadenas', clave=abs)
+        with self.assertRaises(ValueError):
+            Radix_sort([-1, 2], motor='cadenas').ordenar()
+        with self.assertRaises(TypeError):
+            Radix_sort(['a', 'b']).ordenar()
+        with self.assertRaises(ValueError):
+            Radix_sort([1.0, math.nan]).ordenar()
+        self.assertIn('aritmetico', MOTORES)
+
+    def test_radix_negativos_y_flotantes(self):
+        generador = random.Random(1)
+        enteros = [generador.randint(-10 ** 12, 10 ** 12) for _ in range(500)]
+        self.assertEqual(Radix_sort(enteros).ordenar(), sorted(enteros))
+        flotantes = [generador.uniform(-1e9, 1e9) for _ in range(500)]
+        flotantes += [0.0, -0.0, 5e-324, -5e-324, math.inf, -math.inf, 3, -7]
+        generador.shuffle(flotantes)
+        # repr distingue 0.0 de -0.0 y 3 de 3.0: tienen que quedar los mismos objetos, en orden estable
+        self.assertEqual(list(map(repr, Radix_sort(flotantes, bits_por_digito=8).ordenar())),
+                         list(map(repr, sorted(flotantes))))
+
+    def test_radix_clave_estable(self):
+        generador = random.Random(2)
+        registros = [(generador.randint(-20, 20), i) for i in range(1000)]
+        radix = Radix_sort(registros, clave=lambda registro: registro[0])
+        self.assertEqual(radix.ordenar(), sorted(registros, key=lambda registro: registro[0]))
+
+    def test_quicksort_introsort_entradas_adversas(self):
+        n = 5000
+        entradas = [list(range(n)), list(range(n, 0, -1)), [7] * n,
+                    list(range(n // 2)) + list(range(n // 2, 0, -1)),
+                    [random.Random(4).randint(0, 3) for _ in range(n)]]
+        for entrada in entradas:
+            lista = entrada.copy()
+            # Ordena en el lugar y devuelve la misma lista, sin llegar al límite de recursión
+            self.assertIs(Quicksort(lista).ordenar(), lista)
+            self.assertEqual(lista, sorted(entrada))
+        with self.assertRaises(ValueError):
+            Quicksort([1], motor='otro')
+
+    def test_quicksort_motores_y_subrangos(self):
+        generador = random.Random(5)
+        for n in range(0, 70):
+            entrada = [generador.randint(-50, 50) for _ in range(n)]
+            for motor in ('clasico', 'introsort'):
+                self.assertEqual(Quicksort(entrada.copy(), motor).ordenar(), sorted(entrada))
+            if n > 4:
+                lista = entrada.copy()
+                Quicksort(lista).ordenar(2, n - 3)
+                self.assertEqual(lista, entrada[:2] + sorted(entrada[2:n - 2]) + entrada[n - 2:])
+                lista = entrada.copy()
+                heapsort(lista, 1, n - 2)
+                self.assertEqual(lista, entrada[:1] + sorted(entrada[1:n - 1]) + entrada[n - 1:])
+
+    def test_quicksort_tres_vias(self):
+        generador = random.Random(6)
+        for n in (0, 1, 2, 17, 100, 3000):
+            for cantidad_de_claves in (1, 2, 10, n + 1):
+                entrada = [generador.randrange(cantidad_de_claves) for _ in range(n)]
+                lista = entrada.copy()
+                self.assertIs(Quicksort(lista, particion='tres_vias').ordenar(), lista)
+                self.assertEqual(lista, sorted(entrada))
+        with self.assertRaises(ValueError):
+            Quicksort([1], particion='otra')
+        with self.assertRaises(ValueError):
+            Quicksort([1], motor='clasico', particion='tres_vias')
+
+    def test_ordenamiento_paralelo(self):
+        generador = random.Random(7)
+        enteros = [generador.randint(-2 ** 62, 2 ** 62) for _ in range(2001)]
+        flotantes = [generador.uniform(-1, 1) for _ in range(500)]
+        for algoritmo in ALGORITMOS:
+            for procesos in (1, 3):
+                self.assertEqual(Ordenamiento_paralelo(enteros, algoritmo, procesos).ordenar(),
+                                 sorted(enteros))
+        self.assertEqual(Ordenamiento_paralelo(flotantes, 'radix', 2).ordenar(), sorted(flotantes))
+        self.assertEqual(Ordenamiento_paralelo([2, 1], procesos=4).ordenar(), [1, 2])
+        with self.assertRaises(TypeError):
+            Ordenamiento_paralelo([1, 2.5], procesos=2).ordenar()
+        with self.assertRaises(ValueError):
+            Ordenamiento_paralelo([1], algoritmo='burbuja')
+
+    def test_ordenamiento_externo(self):
+        generador = random.Random(8)
+        enteros = [generador.randint(-2 ** 63, 2 ** 63 - 1) for _ in range(40000)]
+        with tempfile.TemporaryDirectory() as carpeta:
+            entrada = os.path.join(carpeta, 'entrada.bin')
+            salida = os.path.join(carpeta, 'salida.bin')
+            escribir_numeros(entrada, enteros)
+            for algoritmo in ALGORITMOS + (sorted,):
+                # Con la memoria mínima entran 3072 números por corrida con sorted (14 corridas)
+                # y se intercalan de a 2: 14 -> 7 -> 4 -> 2 -> 1
+                externo = Ordenamiento_externo(entrada, salida, algoritmo, memoria=3 * 2 ** 16,
+                                               carpeta_temporal=carpeta)
+                self.assertEqual(externo.ordenar(), salida)
+                self.assertEqual(list(leer_numeros(salida)), sorted(enteros))
+            self.assertEqual(externo.corridas, 14)
+            self.assertEqual(externo.etapas, 4)
+            self.assertEqual(sorted(os.listdir(carpeta)), ['entrada.bin', 'salida.bin'])
+
+            flotantes = [generador.uniform(-1e9, 1e9) for _ in range(1000)]
+            escribir_numeros(entrada, flotantes, 'd')
+            Ordenamiento_externo(entrada, salida, tipo='d').ordenar()
+            self.assertEqual(list(leer_numeros(salida, 'd')), sorted(flotantes))
+        with self.assertRaises(ValueError):
+            Ordenamiento_externo('entrada', 'salida', memoria=1000)
+
+    def test_counting_sort(self):
+        generador = random.Random(3)
+        lista = [generador.randint(-100, 100) for _ in range(1000)]
+        self.assertEqual(Counting_sort(lista).ordenar(), sorted(lista))
+        self.assertEqual(Counting_sort([]).ordenar(), [])
+        with self.assertRaises(ValueError):
+            Counting_sort([0, 10 ** 9], rango_maximo=1000).ordenar()
+        with self.assertRaises(TypeError):
+            Counting_sort([1.5]).ordenar()
+
+    def test_ordenamiento_adaptativo(self):
+        generador = random.Random(4)
+        n = 5000
+        casi_ordenada = list(range(n))
+        for _ in range(10):
+            i, j = generador.randrange(n), generador.randrange(n)
+            casi_ordenada[i], casi_ordenada[j] = casi_ordenada[j], casi_ordenada[i]
+        casos = {
+            'insercion': [5, 3, 8, 6, 2],
+            'corridas': casi_ordenada,
+            'conteo': [generador.randint(-100, 100) for _ in range(n)],
+            'radix': [generador.getrandbits(30) for _ in range(n)],
+            'tres_vias': [generador.choice([0.5, 1.5, 2.5]) for _ in range(n)],
+            'introsort': [generador.random() for _ in range(n)],
+        }
+        for estrategia, lista in casos.items():
+            adaptativo = Ordenamiento_adaptativo(lista)
+            self.assertEqual(adaptativo.explicar().estrategia, estrategia)
+            self.assertEqual(adaptativo.ordenar(), sorted(lista))
+        # Todas las estrategias ordenan cualquier lista de enteros, sin modificar la original
+        lista = [generador.randint(-50, 50) for _ in range(300)]
+        copia = list(lista)
+        for estrategia in ESTRATEGIAS:
+            self.assertEqual(ordenar_con_estrategia(estrategia, lista), sorted(copia))
+        self.assertEqual(lista, copia)
+        # Una lista inversa es una sola corrida; la traza dice qué se eligió y por qué
+        traza = io.StringIO()
+        self.assertEqual(Ordenamiento_adaptativo(list(range(100, 0, -1)), traza).ordenar(),
+                         list(range(1, 101)))
+        self.assertIn('corridas', traza.getvalue())
+        self.assertEqual(Ordenamiento_adaptativo([]).ordenar(), [])
+        with self.assertRaises(ValueError):
+            ordenar_con_estrategia('burbuja', lista)
+
+
+    def test_instrumentacion(self):
+        generador = random.Random(6)
+        lista = [generador.randint(0, 1000) for _ in range(300)]
+        ordenada, reporte = instrumentar(Burbuja, lista, modo='clasico')
+        self.assertEqual(ordenada, sorted(lista))
+        self.assertEqual(reporte.comparaciones, 300 * 299 // 2)
+        # Cada intercambio escribe dos elementos
+        burbuja = Burbuja(lista.copy(), 'clasico')
+        burbuja.ordenar_lista()
+        self.assertEqual(reporte.movimientos, 2 * burbuja.intercambios)
+        self.assertEqual(reporte.profundidad_maxima, 1)
+        # Las cuentas son deterministas
+        self.assertEqual(instrumentar(Quicksort, lista)[1].comparaciones,
+                         instrumentar(Quicksort, lista)[1].comparaciones)
+        # El clásico con una lista ya ordenada anida una llamada por elemento
+        _, clasico = instrumentar(Quicksort, list(range(300)), motor='clasico')
+        _, intro = instrumentar(Quicksort, list(range(300)))
+        self.assertGreaterEqual(clasico.profundidad_maxima, 299)
+        self.assertEqual(intro.profundidad_maxima, 1)
+        self.assertLess(intro.comparaciones, clasico.comparaciones)
+        # Radix no compara: informa los elementos movidos en sus pasadas
+        ordenada, reporte = instrumentar(Radix_sort, lista)
+        self.assertEqual(ordenada, sorted(lista))
+        self.assertIsNone(reporte.comparaciones)
+        self.assertEqual(reporte.movimientos, 300)
+        self.assertEqual(reporte.llamadas['pasada_por_conteo'], 1)
+        self.assertGreater(reporte.memoria_adicional, 0)
+        self.assertEqual(set(reporte.como_diccionario()),
+                         {'algoritmo', 'n', 'comparaciones', 'movimientos', 'memoria_adicional',
+                          'profundidad_maxima', 'llamadas'})
+
+
+class TestOrdenamientoNumpy(unittest.TestCase):
+    """Radix_sort y Counting_sort sobre arreglos de NumPy"""
+
+    def setUp(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy no está instalado")
+        self.np = np
+        self.generador = np.random.default_rng(0)
+
+    def test_radix_por_tipo(self):
+        np = self.np
+        arreglos = [self.generador.integers(-2 ** 62, 2 ** 62, 2000),
+                    self.generador.integers(-128, 128, 2000).astype(np.int8),
+                    self.generador.integers(0, 2 ** 32, 2000).astype(np.uint32),
+                    self.generador.standard_normal(2000).astype(np.float32),
+                    np.array([0.0, -0.0, np.inf, -np.inf, 5e-324, -1.5] * 10)]
+        for arreglo in arreglos:
+            for bits in (8, 16):
+                resultado = Radix_sort(arreglo, bits_por_digito=bits).ordenar()
+                self.assertIsInstance(resultado, np.ndarray)
+                self.assertEqual(resultado.dtype, arreglo.dtype)
+                self.assertTrue(np.array_equal(resultado, np.sort(arreglo, kind='stable')))
+        with self.assertRaises(ValueError):
+            Radix_sort(np.array([1.0, np.nan])).ordenar()
+        with self.assertRaises(ValueError):
+            Radix_sort(np.arange(3), motor='cadenas').ordenar()
+
+    def test_radix_clave_estable(self):
+        np = self.np
+        registros = np.zeros(1000, dtype=[('clave', 'i4'), ('dato', 'i4')])
+        registros['clave'] = self.generador.integers(-10, 10, 1000)
+        registros['dato'] = np.arange(1000)
+        resultado = Radix_sort(registros, clave=lambda arreglo: arreglo['clave']).ordenar()
+        esperado = registros[np.argsort(registros['clave'], kind='stable')]
+        self.assertTrue(np.array_equal(resultado, esperado))
+
+    def test_counting_sort(self):
+        np = self.np
+        for arreglo in (self.generador.integers(-1000, 1000, 5000),
+                        self.generador.integers(0, 256, 5000).astype(np.uint8),
+                        self.generador.integers(0, 2, 100).astype(bool)):
+            resultado = Counting_sort(arreglo).ordenar()
+            self.assertEqual(resultado.dtype, arreglo.dtype)
+            self.assertTrue(np.array_equal(resultado, np.sort(arreglo)))
+
+    def test_counting_sort_extremos(self):
+        np = self.np
+        maximo_64 = np.iinfo(np.int64).max
+        minimo_64 = np.iinfo(np.int64).min
+        for arreglo in (np.array([2 ** 63 + 5, 2 ** 63 + 1, 2 ** 63 - 2, 2 ** 63 + 1], dtype=np.uint64),
+                        np.array([2 ** 64 - 1, 2 ** 64 - 4, 2 ** 64 - 1], dtype=np.uint64),
+                        np.array([maximo_64, maximo_64 - 3, maximo_64], dtype=np.int64),
+                        np.array([minimo_64 + 2, minimo_64, minimo_64 + 2], dtype=np.int64),
+                        np.array([127, -128, 0, -128], dtype=np.int8)):
+            resultado = Counting_sort(arreglo).ordenar()
+            self.assertEqual(resultado.dtype, arreglo.dtype)
+            self.assertTrue(np.array_equal(resultado, np.sort(arreglo)))
+        # Todo el rango de int64 no entra en un arreglo de conteos
+        with self.assertRaises(ValueError):
+            Counting_sort(np.array([maximo_64, minimo_64, 0], dtype=np.int64)).ordenar()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,172 @@
+# modules/cola_cubetas.py
+
+import heapq
+from collections import deque
+
+
+class ColaCubetas:
+    """
+    Cola de cubetas (bucket queue) para claves enteras de un rango chico, con la
+    misma interfaz que MonticuloIndexado: guarda tuplas (clave, identificador, ...)
+    y las entrega de menor a mayor clave y, con igual clave, de menor a mayor
+    identificador.
+
+    Estructura:
+    - Una cubeta (deque) por cada clave del rango, con los elementos en orden de
+      identificador: si los identificadores llegan crecientes (como los turnos de
+      ColaPrioridad) insertar y extraer son O(1).
+    - Un mapa de bits con un bit encendido por cada cubeta que tiene elementos:
+      la menor cubeta ocupada sale del bit más bajo en O(1).
+    - Los elementos que llegan con un identificador menor al último de su cubeta
+      (por ejemplo, al cambiarles la clave) van a un montículo propio de la
+      cubeta, así se respeta el orden sin reordenar la deque.
+    - eliminar y cambiar_clave marcan el registro como borrado y siguen en O(1);
+      los borrados se descartan cuando llegan al frente o se vacía la cubeta, y
+      si en una cubeta llegan a ser más que los vigentes se la compacta (O(k),
+      amortizado O(1) por borrado). Así la memoria depende de la cantidad de
+      elementos y no de la cantidad de operaciones.
+    """
+
+    def __init__(self, rango):
+        """Inicializa una cola vacía para claves en 'rango' (un range de paso 1)."""
+        if not isinstance(rango, range) or rango.step != 1 or len(rango) == 0:
+            raise ValueError("El rango de prioridades debe ser un range no vacío de paso 1")
+        self.rango = rango
+        self._cubetas = [deque() for _ in rango]
+        self._reubicados = [[] for _ in rango]
+        self._ultimos = [None] * len(rango)
+        self._vivos = [0] * len(rango)
+        self._borrados = [0] * len(rango)
+        self._ocupadas = 0
+        self._registros = {}
+        self.tamanoActual = 0
+
+    def __nivel(self, clave):
+        if not isinstance(clave, int) or clave not in self.rango:
+            raise ValueError(f"La prioridad {clave!r} está fuera del rango "
+                             f"{self.rango.start}..{self.rango.stop - 1}")
+        return clave - self.rango.start
+
+    def __registro(self, identificador):
+        try:
+            return self._registros[identificador]
+        except KeyError:
+            raise KeyError(f"No hay ningún elemento con identificador {identificador!r}") from None
+
+    def __ubicar(self, elemento):
+        # Un registro es [elemento, vigente]; al borrarlo se apaga 'vigente'
+        nivel = self.__nivel(elemento[0])
+        registro = [elemento, True]
+        identificador = elemento[1]
+        ultimo = self._ultimos[nivel]
+        if ultimo is None or ultimo < identificador:
+            self._cubetas[nivel].append(registro)
+            self._ultimos[nivel] = identificador
+        else:
+            heapq.heappush(self._reubicados[nivel], (identificador, registro))
+        self._registros[identificador] = registro
+        self._vivos[nivel] += 1
+        self._ocupadas |= 1 << nivel
+        self.tamanoActual += 1
+
+    def __descontar(self, registro):
+        registro[1] = False
+        nivel = registro[0][0] - self.rango.start
+        self._vivos[nivel] -= 1
+        self.tamanoActual -= 1
+        if not self._vivos[nivel]:
+            # Sólo quedaban borrados: se descartan todos juntos
+            self._ocupadas &= ~(1 << nivel)
+            self._cubetas[nivel].clear()
+            self._reubicados[nivel].clear()
+            self._ultimos[nivel] = None
+            self._borrados[nivel] = 0
+        else:
+            self._borrados[nivel] += 1
+            if self._borrados[nivel] > self._vivos[nivel]:
+                self.__compactar(nivel)
+
+    def __compactar(self, nivel):
+        """Saca los registros borrados de la cubeta 'nivel', sin cambiar el orden - O(k)"""
+        cubeta = deque(registro for registro in self._cubetas[nivel] if registro[1])
+        reubicados = [par for par in self._reubicados[nivel] if par[1][1]]
+        heapq.heapify(reubicados)
+        self._cubetas[nivel] = cubeta
+        self._reubicados[nivel] = reubicados
+        self._ultimos[nivel] = cubeta[-1][0][1] if cubeta else None
+        self._borrados[nivel] = 0
+
+    def __primero(self):
+        """Registro vigente con la menor clave e identificador, o None si no hay."""
+        if not self._ocupadas:
+            return None
+        nivel = (self._ocupadas & -self._ocupadas).bit_length() - 1
+        cubeta = self._cubetas[nivel]
+        reubicados = self._reubicados[nivel]
+        while cubeta and not cubeta[0][1]:
+            cubeta.popleft()
+            self._borrados[nivel] -= 1
+        while reubicados and not reubicados[0][1][1]:
+            heapq.heappop(reubicados)
+            self._borrados[nivel] -= 1
+        if reubicados and (not cubeta or reubicados[0][0] < cubeta[0][0][1]):
+            return reubicados[0][1]
+        return cubeta[0]
+
+    def insertar(self, k):
+        """Inserta la tupla 'k'; lanza ValueError si su identificador ya está. Complejidad: O(1)"""
+        if k[1] in self._registros:
+            raise ValueError(f"Ya hay un elemento con identificador {k[1]!r}")
+        self.__ubicar(k)
+
+    def eliminarMin(self):
+        """Elimina y devuelve el elemento más pequeño, o None si está vacía. Complejidad: O(1)"""
+        registro = self.__primero()
+        if registro is None:
+            return None
+        del self._registros[registro[0][1]]
+        self.__descontar(registro)
+        return registro[0]
+
+    def ver_minimo(self):
+        """Devuelve el elemento más pequeño sin sacarlo, o None si está vacía. Complejidad: O(1)"""
+        registro = self.__primero()
+        return None if registro is None else registro[0]
+
+    def contiene(self, identificador):
+        """Devuelve True si hay un elemento con ese identificador. Complejidad: O(1)"""
+        return identificador in self._registros
+
+    def obtener(self, identificador):
+        """Devuelve el elemento con ese identificador sin sacarlo. Complejidad: O(1)"""
+        return self.__registro(identificador)[0]
+
+    def cambiar_clave(self, identificador, clave):
+        """
+        Reemplaza la clave del elemento con ese identificador; conserva su lugar
+        entre los de igual clave según el identificador. Complejidad: O(1), u
+        O(log k) si pasa a una cubeta con k elementos más nuevos.
+        """
+        self.__nivel(clave)
+        registro = self.__registro(identificador)
+        self.__descontar(registro)
+        self.__ubicar((clave,) + registro[0][1:])
+
+    def eliminar(self, identificador):
+        """Saca y devuelve el elemento con ese identificador. Complejidad: O(1)"""
+        registro = self.__registro(identificador)
+        del self._registros[identificador]
+        self.__descontar(registro)
+        return registro[0]
+
+    def esta_vacio(self):
+        """Devuelve True si la cola no contiene elementos."""
+        return self.tamanoActual == 0
+
+    def tamano(self):
+        """Devuelve la cantidad de elementos en la cola."""
+        return self.tamanoActual
+
+    def ver_lista_interna(self):
+        """Devuelve los elementos vigentes, sin un orden en particular."""
+        return [registro[0] for registro in self._registros.values()]
@@ -1,6 +1,7 @@
 # modules/cola_prioridad.py
 
-from modules.monticulo_binario import MonticuloBinario
+from modules.cola_cubetas import ColaCubetas
+from modules.monticulo_binario import MonticuloBinario, MonticuloIndexado
 
 class ColaPrioridad:
     """
@@ -11,41 +12,101 @@ class ColaPrioridad:
     - Siempre extrae el elemento con la prioridad más alta (menor valor numérico).
     - Resuelve empates de prioridad usando el orden de llegada (FIFO).
     - Es genérica: puede almacenar cualquier tipo de dato.
+    - insertar devuelve un turno con el que después se puede cambiar la
+      prioridad del elemento o sacarlo de la cola sin reconstruirla. Llevar la
+      posición de cada turno encarece insertar y extraer, así que la cola usa
+      un MonticuloBinario común y recién la primera vez que se pide algo por
+      turno lo pasa a un MonticuloIndexado (O(n), una sola vez).
+    - Si las prioridades son enteros de un rango conocido (por ejemplo, los
+      niveles de riesgo de un triage) y se declara ese rango, usa una cola de
+      cubetas (ver ColaCubetas) en vez del montículo: insertar, extraer,
+      cambiar_prioridad y eliminar pasan a ser O(1), con el mismo orden.
     """
 
-    def __init__(self):
-        """Inicializa una cola de prioridad vacía."""
-        self._monticulo = MonticuloBinario()
+    def __init__(self, aridad=2, rango=None):
+        """
+        Inicializa una cola de prioridad vacía. 'aridad' es la cantidad de hijos
+        por nodo del montículo (ver MonticuloBinario). Si se pasa 'rango' (un
+        range, por ejemplo range(1, 4)), sólo se aceptan prioridades enteras de
+        ese rango y se usa una cola de cubetas; en ese caso no hay aridad que
+        elegir.
+        """
+        if rango is None:
+            self._cola = MonticuloBinario(aridad)
+        elif aridad != 2:
+            raise ValueError("La aridad sólo se elige para el montículo, no junto con 'rango'")
+        else:
+            self._cola = ColaCubetas(rango)
         self._contador = 0
 
+    def _por_turno(self):
+        """Devuelve la cola interna, indexándola si todavía es un montículo común."""
+        if type(self._cola) is MonticuloBinario:
+            # El montículo ya es válido: construirlo de nuevo sólo registra las posiciones
+            indexado = MonticuloIndexado(self._cola.aridad)
+            indexado.construirMonticulo(self._cola.ver_lista_interna())
+            self._cola = indexado
+        return self._cola
+
     def insertar(self, prioridad, dato):
         """
         Inserta un 'dato' en la cola con su 'prioridad' asociada.
-        La prioridad es un número: menor número = mayor prioridad.
-        Complejidad: O(log n)
+        La prioridad es un número: menor número = mayor prioridad. Si se
+        declaró un rango, tiene que ser un entero de ese rango (si no, ValueError).
+        Devuelve el turno del elemento (su número de llegada), que sirve para
+        cambiar_prioridad y eliminar.
+        Complejidad: O(log n), O(1) con rango
         """
-        clave_orden = (prioridad, self._contador)
-        self._monticulo.insertar((clave_orden, dato))
+        turno = self._contador
+        self._cola.insertar((prioridad, turno, dato))
         self._contador += 1
+        return turno
 
     def extraer(self):
         """
         Extrae y devuelve el elemento con mayor prioridad.
         Devuelve None si la cola está vacía.
-        Complejidad: O(log n)
+        Complejidad: O(log n), O(1) con rango
         """
         if self.esta_vacia():
             return None
-        clave_orden, dato = self._monticulo.eliminarMin()
+        prioridad, turno, dato = self._cola.eliminarMin()
+        return dato
+
+    def cambiar_prioridad(self, turno, prioridad):
+        """
+        Cambia la prioridad del elemento con ese turno, que conserva su orden de
+        llegada para los empates. Lanza KeyError si ya no está en la cola.
+        Complejidad: O(log n); con rango O(1), u O(log k) si en la nueva
+        prioridad ya esperan k elementos que llegaron después. La primera
+        llamada por turno sobre el montículo suma O(n) (ver _por_turno).
+        """
+        self._por_turno().cambiar_clave(turno, prioridad)
+
+    def eliminar(self, turno):
+        """
+        Saca de la cola el elemento con ese turno y devuelve su dato.
+        Lanza KeyError si ya no está en la cola.
+        Complejidad: O(log n), O(1) con rango
+        """
+        prioridad, turno, dato = self._por_turno().eliminar(turno)
         return dato
 
+    def contiene(self, turno):
+        """Devuelve True si el elemento con ese turno sigue en la cola. Complejidad: O(1)"""
+        return self._por_turno().contiene(turno)
+
+    def prioridad(self, turno):
+        """Devuelve la prioridad actual del elemento con ese turno. Complejidad: O(1)"""
+        return self._por_turno().obtener(turno)[0]
+
     def esta_vacia(self):
         """Devuelve True si la cola de prioridad no contiene elementos."""
-        return self._monticulo.esta_vacio()
+        return self._cola.esta_vacio()
 
     def tamano(self):
         """Devuelve la cantidad de elementos en la cola de prioridad."""
-        return self._monticulo.tamano()
+        return self._cola.tamano()
 
     def ver_proximo(self):
         """
@@ -55,7 +116,7 @@ class ColaPrioridad:
         """
         if self.esta_vacia():
             return None
-        clave_orden, dato = self._monticulo.listaMonticulo[1]
+        prioridad, turno, dato = self._cola.ver_minimo()
         return dato
 
     def ver_todos(self):
@@ -64,6 +125,6 @@ class ColaPrioridad:
         Esta función es solo para visualización y no modifica la cola.
         Complejidad: O(n log n) debido a la ordenación.
         """
-        elementos_en_monticulo = self._monticulo.ver_lista_interna()
-        elementos_ordenados = sorted(elementos_en_monticulo)
-        return [dato for clave_orden, dato in elementos_ordenados]
\ No newline at end of file
+        elementos_en_cola = self._cola.ver_lista_interna()
+        elementos_ordenados = sorted(elementos_en_cola)
+        return [dato for prioridad, turno, dato in elementos_ordenados]
\ No newline at end of file
@@ -13,24 +13,47 @@ class MonticuloBinario:
        - El padre de un nodo en posición 'i' está en 'i // 2'.
     2. Orden: Para cada nodo 'N' con padre 'P', la clave de 'N' es mayor o igual
        a la clave de 'P'. Esto asegura que el elemento más pequeño siempre está en la raíz.
+
+    Con 'aridad' d > 2 cada nodo tiene d hijos (montículo d-ario) con la misma
+    lista desde la posición 1: los hijos de 'i' están en 'd*(i-1) + 2' a
+    'd*(i-1) + d + 1' y su padre en '(i-2) // d + 1' (con d = 2 son las fórmulas
+    de arriba). El árbol es menos profundo, así que insertar hace menos pasos,
+    pero eliminarMin compara hasta d hijos por nivel.
     """
 
-    def __init__(self):
-        """Inicializa un montículo vacío."""
+    def __init__(self, aridad=2):
+        """Inicializa un montículo vacío con 'aridad' hijos por nodo (2 por defecto)."""
+        if not isinstance(aridad, int) or aridad < 2:
+            raise ValueError("La aridad del montículo debe ser un entero mayor o igual a 2")
         self.listaMonticulo = [0]
         self.tamanoActual = 0
+        self.aridad = aridad
 
     def infiltArriba(self, i):
         """
         Mueve el elemento en la posición 'i' hacia arriba en el montículo
         hasta que se restaure la propiedad de orden del montículo.
         Se usa después de insertar un nuevo elemento al final.
+        En vez de intercambiar en cada nivel, se deja un "hueco": los padres
+        mayores bajan una posición (una escritura por nivel) y el elemento se
+        escribe una sola vez, al final. Se corta en cuanto el padre no es mayor.
         """
-        while i // 2 > 0:
-            if self.listaMonticulo[i] < self.listaMonticulo[i // 2]:
-                self.listaMonticulo[i], self.listaMonticulo[i // 2] = \
-                    self.listaMonticulo[i // 2], self.listaMonticulo[i]
-            i //= 2
+        lista = self.listaMonticulo
+        elemento = lista[i]
+        if self.aridad == 2:
+            padre = i // 2
+            while padre > 0 and elemento < lista[padre]:
+                lista[i] = lista[padre]
+                i = padre
+                padre = i // 2
+        else:
+            d = self.aridad
+            padre = (i - 2) // d + 1
+            while padre > 0 and elemento < lista[padre]:
+                lista[i] = lista[padre]
+                i = padre
+                padre = (i - 2) // d + 1
+        lista[i] = elemento
 
     def insertar(self, k):
         """
@@ -47,26 +70,70 @@ class MonticuloBinario:
         Encuentra y devuelve el índice del hijo con el valor más pequeño
         para el nodo en la posición 'i'.
         """
-        if i * 2 + 1 > self.tamanoActual:
-            return i * 2
-        else:
-            if self.listaMonticulo[i * 2] < self.listaMonticulo[i * 2 + 1]:
+        if self.aridad == 2:
+            if i * 2 + 1 > self.tamanoActual:
                 return i * 2
             else:
-                return i * 2 + 1
+                if self.listaMonticulo[i * 2] < self.listaMonticulo[i * 2 + 1]:
+                    return i * 2
+                else:
+                    return i * 2 + 1
+        d = self.aridad
+        hijo = d * (i - 1) + 2
+        menor = hijo
+        for j in range(hijo + 1, min(hijo + d, self.tamanoActual + 1)):
+            # Con hijos iguales se queda con el último, como en la versión binaria
+            if not self.listaMonticulo[menor] < self.listaMonticulo[j]:
+                menor = j
+        return menor
 
     def infiltAbajo(self, i):
         """
         Mueve el elemento en la posición 'i' hacia abajo en el montículo
         hasta que se restaure la propiedad de orden del montículo.
         Se usa después de reemplazar la raíz con el último elemento.
+        Igual que infiltArriba mueve un hueco: el hijo menor sube si es menor
+        que el elemento, y se corta en cuanto ninguno lo es.
         """
-        while (i * 2) <= self.tamanoActual:
-            hm = self.hijoMin(i)
-            if self.listaMonticulo[i] > self.listaMonticulo[hm]:
-                self.listaMonticulo[i], self.listaMonticulo[hm] = \
-                    self.listaMonticulo[hm], self.listaMonticulo[i]
-            i = hm
+        if self.aridad != 2:
+            self._infiltAbajoVariosHijos(i)
+            return
+        lista = self.listaMonticulo
+        tamano = self.tamanoActual
+        elemento = lista[i]
+        hijo = i * 2
+        while hijo <= tamano:
+            # Mismo criterio que hijoMin, sin la llamada
+            if hijo < tamano and not lista[hijo] < lista[hijo + 1]:
+                hijo += 1
+            if not lista[hijo] < elemento:
+                break
+            lista[i] = lista[hijo]
+            i = hijo
+            hijo = i * 2
+        lista[i] = elemento
+
+    def _infiltAbajoVariosHijos(self, i):
+        """infiltAbajo con más de dos hijos por nodo: busca el menor entre los d hijos."""
+        lista = self.listaMonticulo
+        tamano = self.tamanoActual
+        d = self.aridad
+        elemento = lista[i]
+        hijo = d * (i - 1) + 2
+        while hijo <= tamano:
+            fin = hijo + d
+            if fin > tamano + 1:
+                fin = tamano + 1
+            menor = hijo
+            for j in range(hijo + 1, fin):
+                if not lista[menor] < lista[j]:
+                    menor = j
+            if not lista[menor] < elemento:
+                break
+            lista[i] = lista[menor]
+            i = menor
+            hijo = d * (i - 1) + 2
+        lista[i] = elemento
 
     def eliminarMin(self):
         """
@@ -79,11 +146,11 @@ class MonticuloBinario:
             return None
 
         valorSacado = self.listaMonticulo[1]
-        self.listaMonticulo[1] = self.listaMonticulo[self.tamanoActual]
+        ultimo = self.listaMonticulo.pop()
         self.tamanoActual -= 1
-        self.listaMonticulo.pop()
 
         if self.tamanoActual > 0:
+            self.listaMonticulo[1] = ultimo
             self.infiltAbajo(1)
 
         return valorSacado
@@ -94,7 +161,8 @@ class MonticuloBinario:
         Es más eficiente que insertar uno por uno.
         Complejidad: O(n)
         """
-        i = len(unaLista) // 2
+        # Último nodo con hijos: el padre del último elemento
+        i = (len(unaLista) - 2) // self.aridad + 1
         self.tamanoActual = len(unaLista)
         self.listaMonticulo = [0] + unaLista[:]
         while i > 0:
@@ -109,9 +177,141 @@ class MonticuloBinario:
         """Devuelve la cantidad de elementos en el montículo."""
         return self.tamanoActual
 
+    def ver_minimo(self):
+        """Devuelve el elemento más pequeño sin sacarlo, o None si está vacío. Complejidad: O(1)"""
+        if self.tamanoActual == 0:
+            return None
+        return self.listaMonticulo[1]
+
     def ver_lista_interna(self):
         """
         Devuelve una copia de la lista interna del montículo (sin el 0 inicial).
         Útil para depuración o visualización.
         """
-        return self.listaMonticulo[1:]
\ No newline at end of file
+        return self.listaMonticulo[1:]
+
+class MonticuloIndexado(MonticuloBinario):
+    """
+    Montículo Binario Mínimo que además recuerda la posición de cada elemento,
+    para poder cambiarle la clave o sacarlo del medio en O(log n).
+
+    Los elementos son tuplas (clave, identificador, ...) donde el identificador
+    es único y hashable: como no se repite, al comparar dos tuplas nunca se llega
+    a los componentes siguientes. 'posiciones' guarda identificador -> índice en
+    listaMonticulo y los infiltrados lo actualizan en cada escritura.
+    """
+
+    def __init__(self, aridad=2):
+        """Inicializa un montículo indexado vacío con 'aridad' hijos por nodo."""
+        super().__init__(aridad)
+        self.posiciones = {}
+
+    def infiltArriba(self, i):
+        """Como MonticuloBinario.infiltArriba, registrando la nueva posición de lo que se mueve."""
+        lista = self.listaMonticulo
+        posiciones = self.posiciones
+        d = self.aridad
+        elemento = lista[i]
+        padre = (i - 2) // d + 1
+        while padre > 0 and elemento < lista[padre]:
+            lista[i] = lista[padre]
+            posiciones[lista[i][1]] = i
+            i = padre
+            padre = (i - 2) // d + 1
+        lista[i] = elemento
+        posiciones[elemento[1]] = i
+
+    def infiltAbajo(self, i):
+        """Como MonticuloBinario.infiltAbajo, registrando la nueva posición de lo que se mueve."""
+        lista = self.listaMonticulo
+        posiciones = self.posiciones
+        tamano = self.tamanoActual
+        d = self.aridad
+        elemento = lista[i]
+        hijo = d * (i - 1) + 2
+        while hijo <= tamano:
+            if d == 2:
+                if hijo < tamano and not lista[hijo] < lista[hijo + 1]:
+                    hijo += 1
+            else:
+                menor = hijo
+                for j in range(hijo + 1, min(hijo + d, tamano + 1)):
+                    if not lista[menor] < lista[j]:
+                        menor = j
+                hijo = menor
+            if not lista[hijo] < elemento:
+                break
+            lista[i] = lista[hijo]
+            posiciones[lista[i][1]] = i
+            i = hijo
+            hijo = d * (i - 1) + 2
+        lista[i] = elemento
+        posiciones[elemento[1]] = i
+
+    def insertar(self, k):
+        """Inserta la tupla 'k'; lanza ValueError si su identificador ya está. Complejidad: O(log n)"""
+        if k[1] in self.posiciones:
+            raise ValueError(f"Ya hay un elemento con identificador {k[1]!r}")
+        super().insertar(k)
+
+    def eliminarMin(self):
+        """Elimina y devuelve el elemento más pequeño. Complejidad: O(log n)"""
+        valorSacado = super().eliminarMin()
+        if valorSacado is not None:
+            del self.posiciones[valorSacado[1]]
+        return valorSacado
+
+    def construirMonticulo(self, unaLista):
+        """Construye el montículo a partir de una lista de tuplas. Complejidad: O(n)"""
+        posiciones = {elemento[1]: i for i, elemento in enumerate(unaLista, 1)}
+        if len(posiciones) != len(unaLista):
+            raise ValueError("Los identificadores de los elementos deben ser únicos")
+        self.posiciones = posiciones
+        super().construirMonticulo(unaLista)
+
+    def contiene(self, identificador):
+        """Devuelve True si hay un elemento con ese identificador. Complejidad: O(1)"""
+        return identificador in self.posiciones
+
+    def obtener(self, identificador):
+        """Devuelve el elemento con ese identificador sin sacarlo. Complejidad: O(1)"""
+        return self.listaMonticulo[self.__posicion(identificador)]
+
+    def cambiar_clave(self, identificador, clave):
+        """
+        Reemplaza la clave del elemento con ese identificador y lo infiltra hacia
+        arriba si bajó o hacia abajo si subió. Complejidad: O(log n)
+        """
+        i = self.__posicion(identificador)
+        anterior = self.listaMonticulo[i]
+        nuevo = (clave,) + anterior[1:]
+        self.listaMonticulo[i] = nuevo
+        if nuevo < anterior:
+            self.infiltArriba(i)
+        else:
+            self.infiltAbajo(i)
+
+    def eliminar(self, identificador):
+        """
+        Saca y devuelve el elemento con ese identificador: el último ocupa su lugar
+        y se infiltra hacia donde haga falta. Complejidad: O(log n)
+        """
+        i = self.__posicion(identificador)
+        del self.posiciones[identificador]
+        lista = self.listaMonticulo
+        eliminado = lista[i]
+        ultimo = lista.pop()
+        self.tamanoActual -= 1
+        if i <= self.tamanoActual:
+            lista[i] = ultimo
+            if ultimo < eliminado:
+                self.infiltArriba(i)
+            else:
+                self.infiltAbajo(i)
+        return eliminado
+
+    def __posicion(self, identificador):
+        try:
+            return self.posiciones[identificador]
+        except KeyError:
+            raise KeyError(f"No hay ningún elemento con identificador {identificador!r}") from None
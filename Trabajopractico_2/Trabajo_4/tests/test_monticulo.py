@@ -0,0 +1,375 @@
+# Archivo de test para realizar pruebas unitarias del montículo y la cola de prioridad
+# Correr desde Trabajo_4: python -m pytest -q tests/test_monticulo.py
+from modules.monticulo_binario import MonticuloBinario, MonticuloIndexado
+from modules.cola_cubetas import ColaCubetas
+from modules.cola_prioridad import ColaPrioridad
+import heapq
+import random
+import unittest
+
+
+class MonticuloTestCase(unittest.TestCase):
+    """Comprobaciones comunes a los tests de los montículos"""
+
+    def verificar_propiedad(self, monticulo):
+        """Comprueba que ningún elemento sea menor que su padre"""
+        lista = monticulo.listaMonticulo
+        self.assertEqual(len(lista) - 1, monticulo.tamano())
+        for i in range(2, len(lista)):
+            padre = (i - 2) // monticulo.aridad + 1
+            self.assertFalse(lista[i] < lista[padre],
+                             f"El elemento {lista[i]} en {i} es menor que su padre {lista[padre]}")
+
+
+class Test_MonticuloBinario(MonticuloTestCase):
+    """Test de MonticuloBinario contra heapq y sorted()"""
+
+    # Hijos por nodo; las subclases del final repiten el test con otras aridades
+    aridad = 2
+
+    def crear(self):
+        return MonticuloBinario(self.aridad)
+
+    def test_insertar_y_eliminar_como_heapq(self):
+        """inserciones y extracciones aleatorias dan lo mismo que heapq"""
+        generador = random.Random(22)
+        for _ in range(20):
+            monticulo = self.crear()
+            referencia = []
+            for _ in range(400):
+                if generador.random() < 0.6 or not referencia:
+                    # Rango chico para que haya claves repetidas
+                    clave = generador.randint(0, 50)
+                    monticulo.insertar(clave)
+                    heapq.heappush(referencia, clave)
+                else:
+                    self.assertEqual(monticulo.eliminarMin(), heapq.heappop(referencia))
+                self.assertEqual(monticulo.tamano(), len(referencia))
+            self.verificar_propiedad(monticulo)
+            while referencia:
+                self.assertEqual(monticulo.eliminarMin(), heapq.heappop(referencia))
+            self.assertTrue(monticulo.esta_vacio())
+            self.assertIsNone(monticulo.eliminarMin())
+
+    def test_insertar_decrecientes(self):
+        """cada clave nueva sube hasta la raíz"""
+        monticulo = self.crear()
+        for clave in range(100, 0, -1):
+            monticulo.insertar(clave)
+            self.assertEqual(monticulo.listaMonticulo[1], clave)
+        self.verificar_propiedad(monticulo)
+
+    def test_construir_y_vaciar(self):
+        """construirMonticulo y vaciarlo da la lista ordenada"""
+        generador = random.Random(7)
+        for n in (0, 1, 2, 3, 10, 31, 32, 33, 500):
+            claves = [generador.randint(0, n) for _ in range(n)]
+            monticulo = self.crear()
+            monticulo.construirMonticulo(claves)
+            self.verificar_propiedad(monticulo)
+            vaciado = [monticulo.eliminarMin() for _ in range(n)]
+            self.assertEqual(vaciado, sorted(claves))
+            self.assertTrue(monticulo.esta_vacio())
+
+    def test_construir_no_modifica_la_lista(self):
+        """construirMonticulo trabaja sobre una copia"""
+        claves = [5, 3, 8, 1]
+        self.crear().construirMonticulo(claves)
+        self.assertEqual(claves, [5, 3, 8, 1])
+
+    def test_hijo_minimo(self):
+        """hijoMin elige el menor de los hijos, también con el último nodo incompleto"""
+        monticulo = self.crear()
+        for n in range(2, 3 * self.aridad + 2):
+            monticulo.construirMonticulo(list(range(n, 0, -1)))
+            lista = monticulo.listaMonticulo
+            for i in range(1, (n - 2) // self.aridad + 2):
+                primero = self.aridad * (i - 1) + 2
+                hijos = range(primero, min(primero + self.aridad, n + 1))
+                self.assertEqual(lista[monticulo.hijoMin(i)], min(lista[j] for j in hijos))
+
+    def test_aridad_invalida(self):
+        """la aridad tiene que ser un entero mayor o igual a 2"""
+        for aridad in (1, 0, -2, 2.0, '3', None):
+            self.assertRaises(ValueError, MonticuloBinario, aridad)
+            self.assertRaises(ValueError, MonticuloIndexado, aridad)
+            self.assertRaises(ValueError, ColaPrioridad, aridad)
+
+
+class Test_MonticuloIndexado(MonticuloTestCase):
+    """Test de MonticuloIndexado contra un diccionario identificador -> clave"""
+
+    aridad = 2
+
+    def crear(self):
+        return MonticuloIndexado(self.aridad)
+
+    def verificar_posiciones(self, monticulo, modelo):
+        """Comprueba el montículo, las posiciones y los elementos contra el modelo"""
+        self.verificar_propiedad(monticulo)
+        self.assertEqual(len(monticulo.posiciones), len(modelo))
+        for identificador, clave in modelo.items():
+            posicion = monticulo.posiciones[identificador]
+            self.assertEqual(monticulo.listaMonticulo[posicion], (clave, identificador))
+
+    def test_operaciones_aleatorias(self):
+        """insertar, eliminarMin, cambiar_clave y eliminar mantienen las posiciones"""
+        generador = random.Random(23)
+        monticulo = self.crear()
+        modelo = {}
+        siguiente = 0
+        for paso in range(2000):
+            operacion = generador.random()
+            if operacion < 0.4 or not modelo:
+                modelo[siguiente] = generador.randint(0, 30)
+                monticulo.insertar((modelo[siguiente], siguiente))
+                siguiente += 1
+            elif operacion < 0.6:
+                minimo = min((clave, identificador) for identificador, clave in modelo.items())
+                self.assertEqual(monticulo.eliminarMin(), minimo)
+                del modelo[minimo[1]]
+            elif operacion < 0.85:
+                identificador = generador.choice(list(modelo))
+                modelo[identificador] = generador.randint(0, 30)
+                monticulo.cambiar_clave(identificador, modelo[identificador])
+            else:
+                identificador = generador.choice(list(modelo))
+                self.assertEqual(monticulo.eliminar(identificador),
+                                 (modelo.pop(identificador), identificador))
+            if paso % 50 == 0:
+                self.verificar_posiciones(monticulo, modelo)
+        self.verificar_posiciones(monticulo, modelo)
+        vaciado = [monticulo.eliminarMin() for _ in range(len(modelo))]
+        self.assertEqual(vaciado, sorted((clave, i) for i, clave in modelo.items()))
+        self.assertEqual(monticulo.posiciones, {})
+
+    def test_construir(self):
+        """construirMonticulo registra las posiciones y rechaza identificadores repetidos"""
+        monticulo = self.crear()
+        modelo = {identificador: clave for identificador, clave in enumerate([7, 3, 9, 3, 1, 8])}
+        monticulo.construirMonticulo([(clave, i) for i, clave in modelo.items()])
+        self.verificar_posiciones(monticulo, modelo)
+        # Si se rechaza la lista, el montículo queda como estaba
+        self.assertRaises(ValueError, monticulo.construirMonticulo, [(1, 'a'), (2, 'a')])
+        self.verificar_posiciones(monticulo, modelo)
+        self.assertRaises(ValueError, monticulo.insertar, (0, 0))
+
+    def test_identificador_desconocido(self):
+        """los identificadores que no están lanzan KeyError"""
+        monticulo = self.crear()
+        monticulo.insertar((1, 'a'))
+        self.assertFalse(monticulo.contiene('b'))
+        self.assertRaises(KeyError, monticulo.obtener, 'b')
+        self.assertRaises(KeyError, monticulo.cambiar_clave, 'b', 0)
+        self.assertRaises(KeyError, monticulo.eliminar, 'b')
+
+
+class Test_ColaPrioridad(unittest.TestCase):
+    """Test de ColaPrioridad: orden de extracción y operaciones por turno"""
+
+    aridad = 2
+
+    def crear(self):
+        return ColaPrioridad(self.aridad)
+
+    def cargar(self, cola, prioridades):
+        """Inserta un dato por prioridad (el dato es su posición) y devuelve los turnos"""
+        return [cola.insertar(prioridad, dato) for dato, prioridad in enumerate(prioridades)]
+
+    def vaciar(self, cola):
+        return [cola.extraer() for _ in range(cola.tamano())]
+
+    def test_orden_de_llegada_en_empates(self):
+        """con igual prioridad sale primero el que llegó antes"""
+        cola = self.crear()
+        self.cargar(cola, [2, 1, 2, 1, 3, 2])
+        self.assertEqual(cola.ver_proximo(), 1)
+        self.assertEqual(self.vaciar(cola), [1, 3, 0, 2, 5, 4])
+        self.assertIsNone(cola.extraer())
+        self.assertIsNone(cola.ver_proximo())
+
+    def test_cambiar_prioridad(self):
+        """subir un elemento lo adelanta y bajarlo lo atrasa"""
+        cola = self.crear()
+        turnos = self.cargar(cola, [5, 5, 5, 5, 5])
+        cola.cambiar_prioridad(turnos[3], 1)
+        cola.cambiar_prioridad(turnos[0], 9)
+        self.assertEqual(cola.prioridad(turnos[3]), 1)
+        self.assertEqual(cola.ver_proximo(), 3)
+        self.assertEqual(self.vaciar(cola), [3, 1, 2, 4, 0])
+
+    def test_orden_de_llegada_despues_de_cambiar(self):
+        """al cambiar la prioridad se conserva el turno para los empates"""
+        cola = self.crear()
+        turnos = self.cargar(cola, [2, 1, 2, 3])
+        cola.cambiar_prioridad(turnos[1], 2)
+        cola.cambiar_prioridad(turnos[3], 2)
+        self.assertEqual(self.vaciar(cola), [0, 1, 2, 3])
+
+    def test_eliminar(self):
+        """se puede sacar el próximo, uno del medio y el último"""
+        cola = self.crear()
+        turnos = self.cargar(cola, [4, 1, 6, 2, 5, 3, 7])
+        self.assertEqual(cola.eliminar(turnos[1]), 1)
+        self.assertEqual(cola.eliminar(turnos[4]), 4)
+        self.assertEqual(cola.eliminar(turnos[6]), 6)
+        self.assertEqual(cola.tamano(), 4)
+        self.assertEqual(cola.ver_todos(), [3, 5, 0, 2])
+        self.assertEqual(self.vaciar(cola), [3, 5, 0, 2])
+
+    def test_turnos_que_no_estan(self):
+        """los turnos extraídos, eliminados o inexistentes lanzan KeyError"""
+        cola = self.crear()
+        turnos = self.cargar(cola, [1, 2, 3])
+        cola.extraer()
+        cola.eliminar(turnos[1])
+        for turno in (turnos[0], turnos[1], 99):
+            self.assertFalse(cola.contiene(turno))
+            self.assertRaises(KeyError, cola.cambiar_prioridad, turno, 1)
+            self.assertRaises(KeyError, cola.eliminar, turno)
+            self.assertRaises(KeyError, cola.prioridad, turno)
+        self.assertTrue(cola.contiene(turnos[2]))
+
+    def test_indexa_al_usar_turnos(self):
+        """sin operaciones por turno la cola usa un montículo común"""
+        cola = ColaPrioridad()
+        turnos = self.cargar(cola, [3, 1, 2, 1])
+        self.assertIs(type(cola._cola), MonticuloBinario)
+        self.assertEqual(cola.extraer(), 1)
+        self.assertTrue(cola.contiene(turnos[0]))
+        self.assertIsInstance(cola._cola, MonticuloIndexado)
+        self.assertEqual(self.vaciar(cola), [3, 2, 0])
+
+
+class Test_ColaPrioridad_Rango(Test_ColaPrioridad):
+    """Corre el test de ColaPrioridad con la cola de cubetas y compara con el montículo"""
+
+    # Alcanza para las prioridades que usan los tests de ColaPrioridad
+    rango = range(0, 10)
+
+    def crear(self):
+        return ColaPrioridad(rango=self.rango)
+
+    def test_operaciones_aleatorias_como_el_monticulo(self):
+        """las mismas operaciones dan los mismos resultados que con el montículo"""
+        generador = random.Random(25)
+        for _ in range(30):
+            cubetas = self.crear()
+            monticulo = ColaPrioridad()
+            turnos = []
+            for _ in range(300):
+                operacion = generador.random()
+                if operacion < 0.4 or not turnos:
+                    prioridad = generador.choice(self.rango)
+                    dato = generador.random()
+                    turno = cubetas.insertar(prioridad, dato)
+                    self.assertEqual(monticulo.insertar(prioridad, dato), turno)
+                    turnos.append(turno)
+                elif operacion < 0.6:
+                    self.assertEqual(cubetas.ver_proximo(), monticulo.ver_proximo())
+                    self.assertEqual(cubetas.extraer(), monticulo.extraer())
+                    turnos = [turno for turno in turnos if monticulo.contiene(turno)]
+                elif operacion < 0.85:
+                    turno = generador.choice(turnos)
+                    prioridad = generador.choice(self.rango)
+                    cubetas.cambiar_prioridad(turno, prioridad)
+                    monticulo.cambiar_prioridad(turno, prioridad)
+                    self.assertEqual(cubetas.prioridad(turno), prioridad)
+                else:
+                    turno = generador.choice(turnos)
+                    self.assertEqual(cubetas.eliminar(turno), monticulo.eliminar(turno))
+                    turnos.remove(turno)
+                self.assertEqual(cubetas.tamano(), monticulo.tamano())
+            self.assertEqual(cubetas.ver_todos(), monticulo.ver_todos())
+            self.assertEqual(self.vaciar(cubetas), self.vaciar(monticulo))
+            self.assertTrue(cubetas.esta_vacia())
+            self.assertIsNone(cubetas.extraer())
+
+    def test_prioridades_invalidas(self):
+        """se rechazan las prioridades fuera del rango o que no son enteras"""
+        cola = ColaPrioridad(rango=range(1, 4))
+        turno = cola.insertar(2, 'a')
+        for prioridad in (0, 4, -1, 2.0, '2', None):
+            self.assertRaises(ValueError, cola.insertar, prioridad, 'b')
+            self.assertRaises(ValueError, cola.cambiar_prioridad, turno, prioridad)
+        # Una inserción rechazada no gasta turno ni cambia la cola
+        self.assertEqual(cola.insertar(3, 'b'), turno + 1)
+        self.assertEqual(cola.prioridad(turno), 2)
+        self.assertEqual(self.vaciar(cola), ['a', 'b'])
+
+    def test_rango_invalido(self):
+        """el rango tiene que ser un range no vacío de paso 1, sin aridad"""
+        for rango in (range(3, 3), range(0, 10, 2), [1, 2, 3], 3):
+            self.assertRaises(ValueError, ColaPrioridad, rango=rango)
+        self.assertRaises(ValueError, ColaPrioridad, 4, range(1, 4))
+
+    def test_compacta_los_borrados(self):
+        """cambiar prioridades sin vaciar las cubetas no acumula registros borrados"""
+        cola = ColaCubetas(range(1, 3))
+        for identificador in range(10):
+            cola.insertar((1, identificador))
+        for paso in range(5000):
+            cola.cambiar_clave(paso % 10, 2 if paso % 20 < 10 else 1)
+            for nivel in range(2):
+                guardados = len(cola._cubetas[nivel]) + len(cola._reubicados[nivel])
+                self.assertLessEqual(guardados, 2 * cola._vivos[nivel] + 1)
+        self.assertEqual(cola.tamano(), 10)
+        self.assertEqual([cola.eliminarMin()[1] for _ in range(10)], list(range(10)))
+
+
+class Test_MonticuloBinario_3(Test_MonticuloBinario):
+    """Corre el test de MonticuloBinario con 3 hijos por nodo"""
+
+    aridad = 3
+
+
+class Test_MonticuloIndexado_3(Test_MonticuloIndexado):
+    """Corre el test de MonticuloIndexado con 3 hijos por nodo"""
+
+    aridad = 3
+
+
+class Test_ColaPrioridad_3(Test_ColaPrioridad):
+    """Corre el test de ColaPrioridad con 3 hijos por nodo"""
+
+    aridad = 3
+
+
+class Test_MonticuloBinario_4(Test_MonticuloBinario):
+    """Corre el test de MonticuloBinario con 4 hijos por nodo"""
+
+    aridad = 4
+
+
+class Test_MonticuloIndexado_4(Test_MonticuloIndexado):
+    """Corre el test de MonticuloIndexado con 4 hijos por nodo"""
+
+    aridad = 4
+
+
+class Test_ColaPrioridad_4(Test_ColaPrioridad):
+    """Corre el test de ColaPrioridad con 4 hijos por nodo"""
+
+    aridad = 4
+
+
+class Test_MonticuloBinario_8(Test_MonticuloBinario):
+    """Corre el test de MonticuloBinario con 8 hijos por nodo"""
+
+    aridad = 8
+
+
+class Test_MonticuloIndexado_8(Test_MonticuloIndexado):
+    """Corre el test de MonticuloIndexado con 8 hijos por nodo"""
+
+    aridad = 8
+
+
+class Test_ColaPrioridad_8(Test_ColaPrioridad):
+    """Corre el test de ColaPrioridad con 8 hijos por nodo"""
+
+    aridad = 8
+
+
+if __name__ == '__main__':
+    unittest.main()
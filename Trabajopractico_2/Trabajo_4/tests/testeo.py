@@ -4,7 +4,7 @@ import time
 import datetime
 import random
 
-from modules.paciente import Paciente
+from modules.paciente import Paciente, niveles_de_riesgo
 from modules.cola_prioridad import ColaPrioridad
 
 # --- Configuración de la simulación ---
@@ -12,7 +12,8 @@ N_CICLOS_SIMULACION = 20
 PROBABILIDAD_ATENCION = 0.5
 
 # --- Inicialización ---
-sala_de_espera = ColaPrioridad()
+# Los niveles de riesgo son pocos y fijos: con el rango declarado la cola usa cubetas
+sala_de_espera = ColaPrioridad(rango=range(min(niveles_de_riesgo), max(niveles_de_riesgo) + 1))
 
 print("--- INICIANDO SIMULACIÓN DE SALA DE EMERGENCIAS ---")
 
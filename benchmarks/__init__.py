@@ -0,0 +1,6 @@
+"""
+Benchmarks de las estructuras y algoritmos de los trabajos prácticos.
+
+Se ejecutan aparte de los tests, desde la raíz del repositorio, con
+'python -m benchmarks' (ver 'python -m benchmarks --help').
+"""
@@ -0,0 +1,245 @@
+"""
+Línea de comandos de los benchmarks.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks --listar
+    python -m benchmarks listas --tamanios 1000 10000 --repeticiones 7 \
+        --json resultados.json --csv resultados.csv --graficar resultados.png
+    python -m benchmarks historial
+    python -m benchmarks comparar BASE [CANDIDATO]
+    python -m benchmarks analizar [CORRIDA]
+
+Cada ejecución se guarda en benchmarks/resultados.sqlite (ver --almacen y
+--no-guardar). BASE y CANDIDATO pueden ser un id de corrida, una etiqueta,
+un prefijo de commit, 'ultima' o 'anterior'.
+
+--analizar (o el comando analizar sobre una corrida guardada) ajusta la
+complejidad de cada operación y sale con código 1 si alguna no crece
+como se espera.
+"""
+import argparse
+import sys
+
+from benchmarks import suites
+from benchmarks.almacen import RUTA_POR_DEFECTO, Almacen, huella_maquina
+from benchmarks.comparacion import REGRESION, comparar, imprimir_comparacion
+from benchmarks.complejidad import (ComplejidadInesperadaError, analizar, imprimir_analisis,
+                                    verificar)
+from benchmarks.ejecucion import ejecutar_suite
+from benchmarks.salida import escribir_csv, escribir_json, graficar, imprimir_tabla
+
+
+def agregar_opciones_comparacion(parser):
+    parser.add_argument('--alfa', type=float, default=0.05,
+                        help="nivel de significación de la prueba U (por defecto 0.05)")
+    parser.add_argument('--umbral', type=float, default=0.10,
+                        help="cambio relativo mínimo de la mediana a informar (por defecto 0.10)")
+
+
+def agregar_opciones_analisis(parser):
+    parser.add_argument('--nivel', type=float, default=0.01,
+                        help="peso de Akaike por debajo del cual se descarta la complejidad"
+                             " esperada (por defecto 0.01)")
+    parser.add_argument('--tolerancia', type=int, default=1,
+                        help="pasos de distancia aceptados entre el ajuste y la complejidad"
+                             " esperada (por defecto 1)")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Mide las estructuras y algoritmos del repositorio")
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help="suites a ejecutar (por defecto, todas)")
+    parser.add_argument('--listar', action='store_true', help="muestra las suites disponibles")
+    parser.add_argument('-n', '--tamanios', type=int, nargs='+',
+                        help="tamaños de entrada (por defecto, los de cada suite)")
+    parser.add_argument('-o', '--operaciones', nargs='+', help="mide sólo estas operaciones")
+    parser.add_argument('-r', '--repeticiones', type=int, default=5,
+                        help="muestras por medición (por defecto 5)")
+    parser.add_argument('--calentamiento', type=int, default=1,
+                        help="ejecuciones descartadas antes de medir (por defecto 1)")
+    parser.add_argument('--tiempo-minimo', type=float, default=0.05,
+                        help="duración mínima de cada muestra en segundos (por defecto 0.05)")
+    parser.add_argument('--json', metavar='ARCHIVO', help="guarda las mediciones en JSON")
+    parser.add_argument('--csv', metavar='ARCHIVO', help="guarda las estadísticas en CSV")
+    parser.add_argument('--graficar', metavar='ARCHIVO', nargs='?', const='',
+                        help="grafica los resultados; con ARCHIVO los guarda sin abrir ventanas")
+    parser.add_argument('--backend', help="backend de matplotlib para --graficar (ej. Agg)")
+    parser.add_argument('-q', '--silencioso', action='store_true', help="no muestra el progreso")
+    parser.add_argument('--almacen', default=RUTA_POR_DEFECTO,
+                        help="base SQLite donde se guardan las corridas")
+    parser.add_argument('--no-guardar', action='store_true', help="no guarda la corrida")
+    parser.add_argument('--etiqueta', help="nombre para referirse a la corrida al comparar")
+    parser.add_argument('--comparar-con', metavar='BASE',
+                        help="al terminar compara contra BASE; sale con código 1 si hay regresiones")
+    parser.add_argument('--analizar', action='store_true',
+                        help="ajusta la complejidad de cada operación; sale con código 1 si alguna deriva")
+    agregar_opciones_comparacion(parser)
+    agregar_opciones_analisis(parser)
+    return parser
+
+
+def crear_parser_comparar():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks comparar',
+                                     description="Compara una corrida guardada contra una base")
+    parser.add_argument('base', help="corrida de referencia")
+    parser.add_argument('candidato', nargs='?', default='ultima',
+                        help="corrida a evaluar (por defecto, la última)")
+    parser.add_argument('--almacen', default=RUTA_POR_DEFECTO)
+    parser.add_argument('--cambios', action='store_true', help="muestra sólo lo que cambió")
+    agregar_opciones_comparacion(parser)
+    return parser
+
+
+def crear_parser_analizar():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks analizar',
+                                     description="Ajusta la complejidad de una corrida guardada")
+    parser.add_argument('corrida', nargs='?', default='ultima',
+                        help="corrida a analizar (por defecto, la última)")
+    parser.add_argument('--almacen', default=RUTA_POR_DEFECTO)
+    agregar_opciones_analisis(parser)
+    return parser
+
+
+def crear_parser_historial():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks historial',
+                                     description="Lista las corridas guardadas")
+    parser.add_argument('--almacen', default=RUTA_POR_DEFECTO)
+    return parser
+
+
+def informar_comparacion(almacen, base, mediciones, candidato=None, alfa=0.05, umbral=0.10,
+                         solo_cambios=False):
+    """
+    Imprime la comparación de 'mediciones' contra la corrida 'base' y
+    devuelve 1 si hay regresiones. 'candidato' es la corrida de la que
+    salen las mediciones, o None si son las de esta ejecución.
+    """
+    maquina = candidato.maquina if candidato else huella_maquina()[0]
+    print(f"base:      {base.describir()}")
+    print(f"candidato: {candidato.describir() if candidato else 'esta ejecución'}")
+    if base.maquina != maquina:
+        print("ATENCIÓN: las corridas son de máquinas o intérpretes distintos", file=sys.stderr)
+    comparaciones = comparar(almacen.mediciones(base.id), mediciones, alfa, umbral)
+    if not comparaciones:
+        print("Las corridas no tienen mediciones en común")
+        return 0
+    imprimir_comparacion(comparaciones, solo_cambios=solo_cambios)
+    regresiones = sum(c.estado == REGRESION for c in comparaciones)
+    print(f"\n{regresiones} regresiones en {len(comparaciones)} mediciones")
+    return 1 if regresiones else 0
+
+
+def informar_analisis(mediciones, nivel, tolerancia):
+    """Imprime el ajuste de complejidad de las mediciones y devuelve 1 si alguna deriva"""
+    analisis = analizar(mediciones, nivel, tolerancia)
+    if not analisis:
+        print("Se necesitan mediciones en al menos tres tamaños para ajustar la complejidad")
+        return 0
+    imprimir_analisis(analisis)
+    try:
+        verificar(analisis)
+    except ComplejidadInesperadaError as error:
+        print(f"\nComplejidad inesperada: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main_analizar(argv):
+    args = crear_parser_analizar().parse_args(argv)
+    with Almacen(args.almacen) as almacen:
+        try:
+            corrida = almacen.corrida(args.corrida)
+        except KeyError as error:
+            print(error.args[0], file=sys.stderr)
+            return 2
+        print(f"corrida: {corrida.describir()}")
+        return informar_analisis(almacen.mediciones(corrida.id), args.nivel, args.tolerancia)
+
+
+def main_comparar(argv):
+    args = crear_parser_comparar().parse_args(argv)
+    with Almacen(args.almacen) as almacen:
+        try:
+            base = almacen.corrida(args.base)
+            candidato = almacen.corrida(args.candidato)
+        except KeyError as error:
+            print(error.args[0], file=sys.stderr)
+            return 2
+        return informar_comparacion(almacen, base, almacen.mediciones(candidato.id), candidato,
+                                    args.alfa, args.umbral, args.cambios)
+
+
+def main_historial(argv):
+    args = crear_parser_historial().parse_args(argv)
+    with Almacen(args.almacen) as almacen:
+        maquina_actual, _ = huella_maquina()
+        for corrida in almacen.corridas():
+            suites_corridas = ', '.join(corrida.parametros.get('suites', []))
+            marca = '' if corrida.maquina == maquina_actual else '  (otra máquina)'
+            print(f"{corrida.describir()}  {suites_corridas}{marca}")
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == 'comparar':
+        return main_comparar(argv[1:])
+    if argv and argv[0] == 'historial':
+        return main_historial(argv[1:])
+    if argv and argv[0] == 'analizar':
+        return main_analizar(argv[1:])
+
+    args = crear_parser().parse_args(argv)
+
+    if args.listar:
+        for nombre in suites.SUITES:
+            print(f"{nombre:<14}{suites.cargar(nombre).__doc__}")
+        return 0
+
+    nombres = args.suites or list(suites.SUITES)
+    mediciones = []
+    for nombre in nombres:
+        mediciones += ejecutar_suite(
+            nombre, args.tamanios, args.operaciones, args.repeticiones,
+            args.calentamiento, args.tiempo_minimo,
+            progreso=None if args.silencioso else sys.stderr)
+
+    imprimir_tabla(mediciones)
+    if args.json:
+        escribir_json(mediciones, args.json)
+    if args.csv:
+        escribir_csv(mediciones, args.csv)
+    if args.graficar is not None:
+        graficar(mediciones, args.graficar or None, args.backend)
+
+    codigo = 0
+    if args.analizar:
+        print()
+        codigo = informar_analisis(mediciones, args.nivel, args.tolerancia)
+
+    if args.no_guardar and not args.comparar_con:
+        return codigo
+    with Almacen(args.almacen) as almacen:
+        # La base se busca antes de guardar para que 'ultima' no sea esta misma corrida
+        base = None
+        if args.comparar_con:
+            try:
+                base = almacen.corrida(args.comparar_con)
+            except KeyError as error:
+                print(error.args[0], file=sys.stderr)
+                return 2
+        if not args.no_guardar:
+            parametros = {'suites': nombres, 'tamanios': args.tamanios,
+                          'operaciones': args.operaciones, 'repeticiones': args.repeticiones,
+                          'calentamiento': args.calentamiento, 'tiempo_minimo': args.tiempo_minimo}
+            corrida_id = almacen.guardar(mediciones, args.etiqueta, parametros)
+            print(f"\nCorrida #{corrida_id} guardada en {args.almacen}")
+        if base is not None:
+            print()
+            codigo = max(codigo, informar_comparacion(almacen, base, mediciones, alfa=args.alfa,
+                                                      umbral=args.umbral))
+    return codigo
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Almacén de resultados en SQLite.
+
+Cada ejecución de los benchmarks se guarda como una corrida, con la
+huella de la máquina, el commit de git y los parámetros usados, junto
+con todas sus mediciones (incluidas las muestras individuales) para
+poder compararlas después contra otra corrida.
+"""
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+from datetime import datetime, timezone
+
+from benchmarks.ejecucion import Medicion
+from benchmarks.medicion import Estadisticas
+from benchmarks.proyectos import RAIZ
+
+RUTA_POR_DEFECTO = os.path.join(RAIZ, 'benchmarks', 'resultados.sqlite')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS corridas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fecha TEXT NOT NULL,
+    etiqueta TEXT,
+    git_commit TEXT,
+    git_rama TEXT,
+    git_sucio INTEGER,
+    maquina TEXT NOT NULL,
+    detalle_maquina TEXT NOT NULL,
+    parametros TEXT
+);
+CREATE TABLE IF NOT EXISTS mediciones (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    corrida_id INTEGER NOT NULL REFERENCES corridas(id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    operacion TEXT NOT NULL,
+    variante TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    numero INTEGER NOT NULL,
+    mediana REAL NOT NULL,
+    tiempos TEXT NOT NULL,
+    complejidad TEXT
+);
+CREATE INDEX IF NOT EXISTS mediciones_por_corrida ON mediciones(corrida_id);
+"""
+
+
+def huella_maquina():
+    """
+    Devuelve (huella, detalle): un resumen corto que identifica la máquina
+    y el intérprete, y el diccionario con los datos de los que sale.
+    Dos corridas sólo son comparables con confianza si la huella coincide.
+    """
+    detalle = {
+        'sistema': platform.system(),
+        'version_sistema': platform.release(),
+        'arquitectura': platform.machine(),
+        'procesador': platform.processor(),
+        'cpus': os.cpu_count(),
+        'nodo': platform.node(),
+        'python': platform.python_implementation() + ' ' + platform.python_version(),
+    }
+    texto = json.dumps(detalle, sort_keys=True)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:12], detalle
+
+
+def estado_git(carpeta=RAIZ):
+    """Devuelve (commit, rama, sucio) del repositorio, o (None, None, None) sin git"""
+    def git(*argumentos):
+        return subprocess.run(['git', *argumentos], cwd=carpeta, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    try:
+        commit = git('rev-parse', 'HEAD')
+        rama = git('rev-parse', '--abbrev-ref', 'HEAD')
+        sucio = bool(git('status', '--porcelain', '--untracked-files=no'))
+    except (OSError, subprocess.CalledProcessError):
+        return None, None, None
+    return commit, rama, sucio
+
+
+class Corrida:
+    """Datos de una corrida guardada (sin sus mediciones)"""
+    __slots__ = ('id', 'fecha', 'etiqueta', 'git_commit', 'git_rama', 'git_sucio',
+                 'maquina', 'detalle_maquina', 'parametros')
+
+    def __init__(self, fila):
+        for campo in self.__slots__:
+            setattr(self, campo, fila[campo])
+        self.detalle_maquina = json.loads(self.detalle_maquina)
+        self.parametros = json.loads(self.parametros) if self.parametros else {}
+
+    def describir(self):
+        commit = (self.git_commit or '?')[:10] + ('*' if self.git_sucio else '')
+        etiqueta = f" [{self.etiqueta}]" if self.etiqueta else ''
+        return f"#{self.id} {self.fecha} {commit} máquina {self.maquina}{etiqueta}"
+
+
+class Almacen:
+    """Base de datos SQLite con las corridas de benchmarks"""
+
+    def __init__(self, ruta=RUTA_POR_DEFECTO):
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.row_factory = sqlite3.Row
+        self._conexion.execute("PRAGMA foreign_keys = ON")
+        self._conexion.executescript(ESQUEMA)
+        columnas = {fila['name'] for fila in self._conexion.execute("PRAGMA table_info(mediciones)")}
+        if 'complejidad' not in columnas:
+            # Bases creadas antes de que se registrara la complejidad esperada
+            self._conexion.execute("ALTER TABLE mediciones ADD COLUMN complejidad TEXT")
+
+    def cerrar(self):
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def guardar(self, mediciones, etiqueta=None, parametros=None):
+        """Guarda una corrida con sus mediciones y devuelve su id"""
+        maquina, detalle = huella_maquina()
+        commit, rama, sucio = estado_git()
+        with self._conexion:
+            cursor = self._conexion.execute(
+                "INSERT INTO corridas (fecha, etiqueta, git_commit, git_rama, git_sucio,"
+                " maquina, detalle_maquina, parametros) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (datetime.now(timezone.utc).isoformat(timespec='seconds'), etiqueta,
+                 commit, rama, sucio, maquina, json.dumps(detalle),
+                 json.dumps(parametros) if parametros else None))
+            corrida_id = cursor.lastrowid
+            self._conexion.executemany(
+                "INSERT INTO mediciones (corrida_id, suite, operacion, variante, n, numero,"
+                " mediana, tiempos, complejidad) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(corrida_id, m.suite, m.operacion, m.variante, m.n, m.numero,
+                  m.estadisticas.mediana, json.dumps(m.estadisticas.tiempos), m.complejidad)
+                 for m in mediciones])
+        return corrida_id
+
+    def corridas(self):
+        """Devuelve todas las corridas, de la más vieja a la más nueva"""
+        return [Corrida(fila) for fila in
+                self._conexion.execute("SELECT * FROM corridas ORDER BY id")]
+
+    def corrida(self, referencia):
+        """
+        Busca una corrida por id ('12' o '#12'), por etiqueta, por prefijo
+        de commit o con 'ultima'/'anterior'. Si hay varias que coinciden
+        devuelve la más nueva. Lanza KeyError si no encuentra ninguna.
+        """
+        referencia = str(referencia)
+        consultas = []
+        if referencia in ('ultima', 'anterior'):
+            desplazamiento = 0 if referencia == 'ultima' else 1
+            consultas.append(("SELECT * FROM corridas ORDER BY id DESC LIMIT 1 OFFSET ?",
+                              (desplazamiento,)))
+        if referencia.lstrip('#').isdigit():
+            consultas.append(("SELECT * FROM corridas WHERE id = ?", (int(referencia.lstrip('#')),)))
+        consultas.append(("SELECT * FROM corridas WHERE etiqueta = ? ORDER BY id DESC LIMIT 1",
+                          (referencia,)))
+        consultas.append(("SELECT * FROM corridas WHERE git_commit LIKE ? ORDER BY id DESC LIMIT 1",
+                          (referencia + '%',)))
+        for consulta, parametros in consultas:
+            fila = self._conexion.execute(consulta, parametros).fetchone()
+            if fila is not None:
+                return Corrida(fila)
+        raise KeyError(f"No hay ninguna corrida que coincida con {referencia!r}")
+
+    def mediciones(self, corrida_id):
+        """Devuelve las mediciones de la corrida indicada"""
+        filas = self._conexion.execute(
+            "SELECT * FROM mediciones WHERE corrida_id = ? ORDER BY id", (corrida_id,))
+        return [Medicion(fila['suite'], fila['operacion'], fila['variante'], fila['n'],
+                         fila['numero'], Estadisticas(json.loads(fila['tiempos'])),
+                         fila['complejidad'])
+                for fila in filas]
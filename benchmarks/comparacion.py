@@ -0,0 +1,131 @@
+"""
+Comparación de dos corridas para detectar regresiones de rendimiento.
+
+Para cada medición presente en ambas corridas se aplica la prueba U de
+Mann-Whitney a las muestras (no supone que los tiempos sean normales y
+tolera valores atípicos) y se calcula la razón entre las medianas.
+Un cambio se informa sólo si es estadísticamente significativo Y supera
+el umbral relativo: con muchas muestras cualquier diferencia mínima
+termina siendo "significativa" aunque no importe en la práctica.
+"""
+import math
+from functools import lru_cache
+
+REGRESION = 'regresión'
+MEJORA = 'mejora'
+SIN_CAMBIO = 'sin cambio'
+
+# Hasta este producto de tamaños de muestra se usa la distribución exacta de U
+LIMITE_EXACTO = 400
+
+
+@lru_cache(maxsize=None)
+def _cantidad_de_ordenes(u, m, n):
+    """Cantidad de ordenamientos de m + n valores distintos cuyo estadístico U vale u"""
+    if u < 0 or u > m * n:
+        return 0
+    if m == 0 or n == 0:
+        return 1 if u == 0 else 0
+    # El mayor de todos pertenece a la primera muestra (aporta n) o a la segunda
+    return _cantidad_de_ordenes(u - n, m - 1, n) + _cantidad_de_ordenes(u, m, n - 1)
+
+
+def mann_whitney_u(a, b):
+    """
+    Prueba U de Mann-Whitney de una cola: devuelve (U, p) donde U cuenta
+    los pares (x de a, y de b) con x > y (los empates suman 1/2) y p es la
+    probabilidad de obtener un U al menos así de grande si ambas muestras
+    vinieran de la misma distribución. Un p chico indica que 'a' tiende a
+    ser mayor que 'b'.
+    """
+    m, n = len(a), len(b)
+    if m == 0 or n == 0:
+        raise ValueError("Las dos muestras deben tener al menos un valor")
+
+    u = 0.0
+    for x in a:
+        for y in b:
+            if x > y:
+                u += 1
+            elif x == y:
+                u += 0.5
+
+    valores = sorted([*a, *b])
+    hay_empates = len(set(valores)) < len(valores)
+
+    if m * n <= LIMITE_EXACTO and not hay_empates:
+        total = math.comb(m + n, m)
+        cola = sum(_cantidad_de_ordenes(k, m, n) for k in range(math.ceil(u), m * n + 1))
+        return u, cola / total
+
+    # Aproximación normal con corrección por empates y por continuidad
+    media = m * n / 2
+    grupos = {}
+    for valor in valores:
+        grupos[valor] = grupos.get(valor, 0) + 1
+    correccion = sum(t ** 3 - t for t in grupos.values()) / ((m + n) * (m + n - 1))
+    varianza = m * n / 12 * ((m + n + 1) - correccion)
+    if varianza == 0:
+        return u, 0.5
+    z = (u - media - 0.5) / math.sqrt(varianza)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class Comparacion:
+    """Resultado de comparar una misma medición entre la base y el candidato"""
+    __slots__ = ('clave', 'base', 'candidato', 'razon', 'p_valor', 'estado')
+
+    def __init__(self, clave, base, candidato, razon, p_valor, estado):
+        self.clave = clave
+        self.base = base
+        self.candidato = candidato
+        self.razon = razon
+        self.p_valor = p_valor
+        self.estado = estado
+
+
+def clave_de(medicion):
+    return (medicion.suite, medicion.operacion, medicion.variante, medicion.n)
+
+
+def comparar(base, candidato, alfa=0.05, umbral=0.10):
+    """
+    Compara las mediciones de 'candidato' contra las de 'base' (listas de
+    Medicion). Devuelve una Comparacion por cada medición presente en las
+    dos, marcada como REGRESION si el candidato es más lento con p < alfa
+    y su mediana supera a la de la base en más de 'umbral' (0.10 = 10 %),
+    MEJORA en el caso simétrico y SIN_CAMBIO si no.
+    """
+    por_clave = {clave_de(m): m for m in base}
+    comparaciones = []
+    for m_candidato in candidato:
+        clave = clave_de(m_candidato)
+        m_base = por_clave.get(clave)
+        if m_base is None:
+            continue
+        tiempos_base = m_base.estadisticas.tiempos
+        tiempos_candidato = m_candidato.estadisticas.tiempos
+        razon = m_candidato.estadisticas.mediana / m_base.estadisticas.mediana
+
+        _, p_mas_lento = mann_whitney_u(tiempos_candidato, tiempos_base)
+        _, p_mas_rapido = mann_whitney_u(tiempos_base, tiempos_candidato)
+        if p_mas_lento < alfa and razon > 1 + umbral:
+            estado, p_valor = REGRESION, p_mas_lento
+        elif p_mas_rapido < alfa and razon < 1 / (1 + umbral):
+            estado, p_valor = MEJORA, p_mas_rapido
+        else:
+            estado, p_valor = SIN_CAMBIO, min(p_mas_lento, p_mas_rapido)
+        comparaciones.append(Comparacion(clave, m_base, m_candidato, razon, p_valor, estado))
+    return comparaciones
+
+
+def imprimir_comparacion(comparaciones, archivo=None, solo_cambios=False):
+    """Imprime la razón de medianas, el p-valor y el veredicto de cada medición"""
+    print(f"{'suite':<14}{'operación':<20}{'variante':<28}{'n':>9}{'razón':>9}{'p':>9}  estado",
+          file=archivo)
+    for c in comparaciones:
+        if solo_cambios and c.estado == SIN_CAMBIO:
+            continue
+        suite, operacion, variante, n = c.clave
+        print(f"{suite:<14}{operacion:<20}{variante:<28}{n:>9}{c.razon:>8.2f}x{c.p_valor:>9.4f}"
+              f"  {c.estado}", file=archivo)
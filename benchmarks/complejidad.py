@@ -0,0 +1,191 @@
+"""
+Ajuste empírico de complejidad.
+
+Para cada serie de mediciones (misma suite, operación y variante a
+distintos n) se ajustan por mínimos cuadrados ponderados los modelos
+t = a + b·f(n) con f en 1, log n, n, n log n y n², y se comparan con el
+criterio de información de Akaike (AIC). Los pesos de Akaike de cada modelo
+sirven como confianza: la probabilidad relativa de que ese modelo sea el
+mejor de los candidatos dados los datos.
+
+Se ajusta la mediana de cada tamaño y no cada muestra: las muestras de
+un mismo n se toman seguidas y son mucho más parecidas entre sí que entre
+tamaños, así que tratarlas como independientes da confianzas de casi
+100 % a diferencias que son ruido. Se pondera por 1/t² porque el error
+de una medición de tiempo es más o menos proporcional al tiempo medido;
+así los n chicos pesan lo mismo que los grandes. No se usa la corrección
+para muestras chicas (AICc): con cuatro o cinco tamaños penaliza tanto al
+segundo parámetro que hasta una serie cuadrática se ajusta mejor con una
+constante.
+
+Clases vecinas (n y n log n, 1 y log n) son difíciles de separar en uno o
+dos órdenes de magnitud de n, y los efectos de caché suelen sumar un
+crecimiento extra a los recorridos grandes. Por eso, por defecto, sólo
+se considera una deriva un salto de dos o más clases (O(1) que pasa a
+O(n), O(n) que pasa a O(n²)).
+"""
+import math
+import statistics
+from collections import defaultdict
+
+# Modelos en orden de crecimiento: nombre -> f(n) (None para el constante)
+MODELOS = {
+    '1': None,
+    'log n': math.log,
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n^2': lambda n: n * n,
+}
+ORDEN = list(MODELOS)
+
+
+class ComplejidadInesperadaError(AssertionError):
+    """Alguna operación no crece según la complejidad que se espera de ella"""
+
+
+class Ajuste:
+    """Un modelo t = a + b·f(n) ajustado a una serie"""
+    __slots__ = ('modelo', 'a', 'b', 'aic', 'peso')
+
+    def __init__(self, modelo, a, b, aic):
+        self.modelo = modelo
+        self.a = a
+        self.b = b
+        self.aic = aic
+        self.peso = None
+
+    def predecir(self, n):
+        f = MODELOS[self.modelo]
+        return self.a + (self.b * f(n) if f else 0)
+
+
+def _ajustar(modelo, puntos):
+    """
+    Ajusta 'modelo' a los puntos (n, t, peso) con a >= 0 y b >= 0 y
+    devuelve el Ajuste con su AIC.
+    """
+    f = MODELOS[modelo]
+    W = sum(w for _, _, w in puntos)
+    Sy = sum(w * t for _, t, w in puntos)
+    if f is None:
+        a, b, k = Sy / W, 0.0, 1
+    else:
+        xs = [(f(n), t, w) for n, t, w in puntos]
+        Sx = sum(w * x for x, _, w in xs)
+        Sxx = sum(w * x * x for x, _, w in xs)
+        Sxy = sum(w * x * t for x, t, w in xs)
+        determinante = W * Sxx - Sx * Sx
+        b = (W * Sxy - Sx * Sy) / determinante if determinante > 0 else 0.0
+        a = (Sy - b * Sx) / W
+        if b < 0:
+            # No crece: el mejor ajuste con b >= 0 es el constante
+            a, b = Sy / W, 0.0
+        elif a < 0:
+            # Tiempo negativo para n chicos: se fuerza a pasar por el origen
+            a, b = 0.0, Sxy / Sxx
+        k = 2
+
+    ajuste = Ajuste(modelo, a, b, 0.0)
+    residuo = sum(w * (t - ajuste.predecir(n)) ** 2 for n, t, w in puntos)
+    cantidad = len(puntos)
+    ajuste.aic = cantidad * math.log(max(residuo, 1e-300) / cantidad) + 2 * k
+    return ajuste
+
+
+def ajustar_modelos(muestras):
+    """
+    Recibe {n: [tiempos]} y devuelve los Ajuste de todos los modelos,
+    del más al menos probable, con su peso de Akaike cargado.
+    Se necesitan al menos tres tamaños distintos.
+    """
+    if len(muestras) < 3:
+        raise ValueError("Se necesitan mediciones en al menos tres tamaños para ajustar modelos")
+    puntos = []
+    for n, tiempos in muestras.items():
+        mediana = statistics.median(tiempos) or 1e-12
+        puntos.append((n, mediana, 1 / mediana ** 2))
+
+    ajustes = [_ajustar(modelo, puntos) for modelo in MODELOS]
+    mejor = min(a.aic for a in ajustes)
+    relativos = [math.exp(-(a.aic - mejor) / 2) for a in ajustes]
+    total = sum(relativos)
+    for ajuste, relativo in zip(ajustes, relativos):
+        ajuste.peso = relativo / total
+    return sorted(ajustes, key=lambda a: a.aic)
+
+
+class Analisis:
+    """Ajustes de una serie (suite, operación, variante) y su veredicto"""
+    __slots__ = ('clave', 'ajustes', 'esperada', 'deriva')
+
+    def __init__(self, clave, ajustes, esperada, deriva):
+        self.clave = clave
+        self.ajustes = ajustes
+        self.esperada = esperada
+        self.deriva = deriva
+
+    @property
+    def mejor(self):
+        return self.ajustes[0]
+
+    def peso(self, modelo):
+        return next(a.peso for a in self.ajustes if a.modelo == modelo)
+
+
+def analizar(mediciones, nivel=0.01, tolerancia=1):
+    """
+    Ajusta los modelos a cada serie de 'mediciones' con al menos tres
+    tamaños y devuelve la lista de Analisis.
+
+    Una serie con complejidad esperada deriva si el mejor modelo está a
+    más de 'tolerancia' pasos de la esperada en el orden 1 < log n < n <
+    n log n < n², y además los datos descartan la esperada: su peso de
+    Akaike queda por debajo de 'nivel'.
+    """
+    series = defaultdict(dict)
+    esperadas = {}
+    for m in mediciones:
+        clave = (m.suite, m.operacion, m.variante)
+        series[clave][m.n] = m.estadisticas.tiempos
+        esperadas[clave] = m.complejidad
+
+    resultado = []
+    for clave, muestras in series.items():
+        if len(muestras) < 3:
+            continue
+        analisis = Analisis(clave, ajustar_modelos(muestras), esperadas[clave], False)
+        if analisis.esperada is not None:
+            if analisis.esperada not in MODELOS:
+                raise ValueError(f"Complejidad desconocida {analisis.esperada!r};"
+                                 f" opciones: {', '.join(ORDEN)}")
+            distancia = abs(ORDEN.index(analisis.mejor.modelo) - ORDEN.index(analisis.esperada))
+            analisis.deriva = distancia > tolerancia and analisis.peso(analisis.esperada) < nivel
+        resultado.append(analisis)
+    return resultado
+
+
+def verificar(analisis):
+    """Lanza ComplejidadInesperadaError si alguna serie derivó de su complejidad esperada"""
+    derivas = [a for a in analisis if a.deriva]
+    if derivas:
+        detalle = '; '.join(
+            f"{'/'.join(a.clave)}: se esperaba O({a.esperada}) y se midió O({a.mejor.modelo}) "
+            f"(confianza {a.mejor.peso:.0%})" for a in derivas)
+        raise ComplejidadInesperadaError(detalle)
+
+
+def imprimir_analisis(analisis, archivo=None):
+    """Imprime el mejor modelo, su confianza y la complejidad esperada de cada serie"""
+    print(f"{'suite':<14}{'operación':<20}{'variante':<28}{'ajuste':>12}{'confianza':>11}"
+          f"{'esperada':>12}  estado", file=archivo)
+    for a in analisis:
+        suite, operacion, variante = a.clave
+        if a.esperada is None:
+            estado = ''
+        elif a.deriva:
+            estado = 'DERIVA'
+        else:
+            estado = 'ok'
+        esperada = f"O({a.esperada})" if a.esperada else '-'
+        print(f"{suite:<14}{operacion:<20}{variante:<28}{'O(' + a.mejor.modelo + ')':>12}"
+              f"{a.mejor.peso:>11.0%}{esperada:>12}  {estado}", file=archivo)
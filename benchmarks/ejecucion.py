@@ -0,0 +1,68 @@
+"""Ejecución de las suites: recorre casos y tamaños y junta las mediciones"""
+import sys
+
+from benchmarks import suites
+from benchmarks.medicion import medir
+from benchmarks.proyectos import proyecto
+
+
+class Medicion:
+    """Resultado de medir un caso de una suite para un tamaño de entrada"""
+    __slots__ = ('suite', 'operacion', 'variante', 'n', 'numero', 'estadisticas', 'complejidad')
+
+    CAMPOS = ('suite', 'operacion', 'variante', 'n', 'numero', 'repeticiones',
+              'mediana', 'q1', 'q3', 'iqr', 'minimo', 'maximo', 'complejidad')
+
+    def __init__(self, suite, operacion, variante, n, numero, estadisticas, complejidad=None):
+        self.suite = suite
+        self.operacion = operacion
+        self.variante = variante
+        self.n = n
+        self.numero = numero
+        self.estadisticas = estadisticas
+        self.complejidad = complejidad
+
+    def a_dict(self, con_tiempos=True):
+        """Devuelve la medición como diccionario plano (para JSON/CSV)"""
+        e = self.estadisticas
+        datos = {
+            'suite': self.suite, 'operacion': self.operacion, 'variante': self.variante,
+            'n': self.n, 'numero': self.numero, 'repeticiones': len(e.tiempos),
+            'mediana': e.mediana, 'q1': e.q1, 'q3': e.q3, 'iqr': e.iqr,
+            'minimo': e.minimo, 'maximo': e.maximo, 'complejidad': self.complejidad,
+        }
+        if con_tiempos:
+            datos['tiempos'] = e.tiempos
+        return datos
+
+
+def ejecutar_suite(nombre, tamanios=None, operaciones=None, repeticiones=5,
+                   calentamiento=1, tiempo_minimo=0.05, progreso=sys.stderr):
+    """
+    Mide todos los casos de la suite 'nombre' (o sólo los de 'operaciones')
+    para cada tamaño y devuelve la lista de Medicion.
+    """
+    suite = suites.cargar(nombre)
+    with proyecto(suite.PROYECTO):
+        casos = suite.casos()
+    if operaciones:
+        casos = [caso for caso in casos if caso.operacion in operaciones]
+
+    mediciones = []
+    try:
+        for n in tamanios or suite.TAMANIOS:
+            for caso in casos:
+                if caso.n_maximo is not None and n > caso.n_maximo:
+                    continue
+                if progreso is not None:
+                    print(f"[{nombre}] {caso.operacion} / {caso.variante} n={n}", file=progreso)
+                estadisticas, numero = medir(
+                    caso.ejecutar, lambda: caso.preparar(n), caso.muta,
+                    repeticiones, calentamiento, tiempo_minimo)
+                mediciones.append(Medicion(nombre, caso.operacion, caso.variante, n,
+                                           numero, estadisticas, caso.complejidad))
+    finally:
+        finalizar = getattr(suite, 'finalizar', None)
+        if finalizar is not None:
+            finalizar()
+    return mediciones
@@ -0,0 +1,79 @@
+"""
+Medición de tiempos al estilo timeit: calentamiento, ajuste automático
+de la cantidad de ejecuciones por muestra y estadísticas robustas
+(mediana y rango intercuartílico) sobre varias repeticiones.
+"""
+import statistics
+import timeit
+
+
+class Estadisticas:
+    """Resumen de los tiempos por ejecución (en segundos) de una medición"""
+    __slots__ = ('tiempos', 'mediana', 'q1', 'q3', 'minimo', 'maximo')
+
+    def __init__(self, tiempos):
+        if not tiempos:
+            raise ValueError("Se necesita al menos un tiempo para calcular estadísticas")
+        self.tiempos = list(tiempos)
+        self.mediana = statistics.median(self.tiempos)
+        if len(self.tiempos) > 1:
+            self.q1, _, self.q3 = statistics.quantiles(self.tiempos, n=4, method='inclusive')
+        else:
+            self.q1 = self.q3 = self.mediana
+        self.minimo = min(self.tiempos)
+        self.maximo = max(self.tiempos)
+
+    @property
+    def iqr(self):
+        """Rango intercuartílico: ancho de la mitad central de las muestras"""
+        return self.q3 - self.q1
+
+
+def ajustar_numero(timer, tiempo_minimo):
+    """
+    Busca la cantidad de ejecuciones por muestra (1, 2, 5, 10, 20, 50...)
+    para que una muestra tarde al menos 'tiempo_minimo' segundos, igual
+    que timeit.Timer.autorange pero con el umbral configurable.
+    """
+    multiplicador = 1
+    while True:
+        for factor in (1, 2, 5):
+            numero = factor * multiplicador
+            if timer.timeit(numero) >= tiempo_minimo:
+                return numero
+        multiplicador *= 10
+
+
+def medir(ejecutar, preparar=None, muta=False, repeticiones=5, calentamiento=1,
+          tiempo_minimo=0.2):
+    """
+    Mide el tiempo por ejecución de ejecutar(estado), donde estado es lo
+    que devuelve preparar() (None si no se indica).
+
+    Si la operación modifica el estado (muta=True) cada muestra es una
+    sola ejecución sobre un estado recién preparado; si no, el mismo
+    estado se reutiliza y la cantidad de ejecuciones por muestra se ajusta
+    para que cada muestra dure al menos 'tiempo_minimo' segundos.
+
+    Devuelve (Estadisticas, ejecuciones por muestra).
+    """
+    if preparar is None:
+        preparar = lambda: None
+
+    if muta:
+        tiempos = []
+        for i in range(calentamiento + repeticiones):
+            estado = preparar()
+            timer = timeit.Timer(lambda: ejecutar(estado))
+            tiempo = timer.timeit(1)
+            if i >= calentamiento:
+                tiempos.append(tiempo)
+        return Estadisticas(tiempos), 1
+
+    estado = preparar()
+    timer = timeit.Timer(lambda: ejecutar(estado))
+    for _ in range(calentamiento):
+        timer.timeit(1)
+    numero = ajustar_numero(timer, tiempo_minimo)
+    tiempos = [t / numero for t in timer.repeat(repeticiones, numero)]
+    return Estadisticas(tiempos), numero
@@ -0,0 +1,51 @@
+"""
+Carga del código de cada proyecto del repositorio.
+
+Cada proyecto se ejecuta con su carpeta en el PYTHONPATH e importa su
+propio paquete 'modules', así que todos se llaman igual. 'proyecto' pone
+la carpeta indicada al frente de sys.path y aísla los 'modules' ya
+importados para que dentro del bloque with se resuelvan los del proyecto.
+Los módulos de cada proyecto se guardan al salir y se reponen al volver a
+entrar, así cada bloque ve los mismos objetos: las clases no se duplican y
+las funciones se pueden enviar por referencia a otros procesos.
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Carpeta del proyecto -> sus módulos 'modules'/'tests' importados la última vez
+_CARGADOS = {}
+
+
+def _modulos_del_paquete():
+    return {nombre: modulo for nombre, modulo in sys.modules.items()
+            if nombre == 'modules' or nombre.startswith('modules.')
+            or nombre == 'tests' or nombre.startswith('tests.')}
+
+
+@contextmanager
+def proyecto(ruta):
+    """
+    Permite importar 'modules' (y 'tests') de la carpeta 'ruta', relativa
+    a la raíz del repositorio. Al salir se restauran sys.path y los módulos
+    que había antes; los objetos ya importados siguen siendo válidos.
+    """
+    carpeta = os.path.join(RAIZ, ruta)
+    if not os.path.isdir(carpeta):
+        raise FileNotFoundError(f"No existe el proyecto {ruta!r}")
+
+    anteriores = _modulos_del_paquete()
+    for nombre in anteriores:
+        del sys.modules[nombre]
+    sys.modules.update(_CARGADOS.get(carpeta, {}))
+    sys.path.insert(0, carpeta)
+    try:
+        yield carpeta
+    finally:
+        sys.path.remove(carpeta)
+        _CARGADOS[carpeta] = _modulos_del_paquete()
+        for nombre in _CARGADOS[carpeta]:
+            del sys.modules[nombre]
+        sys.modules.update(anteriores)
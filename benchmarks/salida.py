@@ -0,0 +1,83 @@
+"""Salida de las mediciones: tabla en texto, JSON, CSV y gráficos"""
+import csv
+import json
+from collections import defaultdict
+
+from benchmarks.ejecucion import Medicion
+
+
+def _formatear(segundos):
+    for unidad, escala in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if segundos >= escala:
+            return f"{segundos / escala:.3f} {unidad}"
+    return f"{segundos / 1e-9:.1f} ns"
+
+
+def imprimir_tabla(mediciones, archivo=None):
+    """Imprime mediana e IQR de cada medición"""
+    print(f"{'suite':<14}{'operación':<20}{'variante':<28}{'n':>9}{'mediana':>14}{'IQR':>14}",
+          file=archivo)
+    for m in mediciones:
+        e = m.estadisticas
+        print(f"{m.suite:<14}{m.operacion:<20}{m.variante:<28}{m.n:>9}"
+              f"{_formatear(e.mediana):>14}{_formatear(e.iqr):>14}", file=archivo)
+
+
+def escribir_json(mediciones, ruta):
+    """Guarda las mediciones, con todas las muestras, en un archivo JSON"""
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump([m.a_dict() for m in mediciones], archivo, indent=2, ensure_ascii=False)
+
+
+def escribir_csv(mediciones, ruta):
+    """Guarda una fila de estadísticas por medición en un archivo CSV"""
+    with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=Medicion.CAMPOS)
+        escritor.writeheader()
+        for m in mediciones:
+            escritor.writerow(m.a_dict(con_tiempos=False))
+
+
+def graficar(mediciones, ruta=None, backend=None):
+    """
+    Grafica la mediana (con el IQR como banda) en función de n, un panel
+    por operación y una curva por variante. Con 'ruta' guarda la figura
+    en ese archivo; si no, la muestra en pantalla. 'backend' permite elegir
+    el de matplotlib; si se guarda a archivo sin indicarlo se usa Agg, que
+    no necesita pantalla.
+    """
+    import matplotlib
+    if backend is None and ruta is not None:
+        backend = 'Agg'
+    if backend is not None:
+        matplotlib.use(backend)
+    import matplotlib.pyplot as plt
+
+    series = defaultdict(lambda: defaultdict(list))
+    for m in mediciones:
+        series[(m.suite, m.operacion)][m.variante].append(m)
+
+    columnas = min(3, len(series)) or 1
+    filas = (len(series) + columnas - 1) // columnas
+    figura, ejes = plt.subplots(filas, columnas, figsize=(5 * columnas, 4 * filas), squeeze=False)
+    for eje, ((suite, operacion), variantes) in zip(ejes.flat, series.items()):
+        for variante, puntos in variantes.items():
+            puntos.sort(key=lambda m: m.n)
+            ns = [m.n for m in puntos]
+            eje.plot(ns, [m.estadisticas.mediana for m in puntos], 'o-', label=variante)
+            eje.fill_between(ns, [m.estadisticas.q1 for m in puntos],
+                             [m.estadisticas.q3 for m in puntos], alpha=0.2)
+        eje.set_title(f"{suite}: {operacion}", fontweight='bold')
+        eje.set_xlabel('Número de elementos (N)')
+        eje.set_ylabel('Tiempo (segundos)')
+        eje.grid(True, alpha=0.3)
+        eje.legend(fontsize=8)
+    for eje in list(ejes.flat)[len(series):]:
+        eje.set_visible(False)
+    figura.tight_layout()
+
+    if ruta is None:
+        plt.show()
+    else:
+        figura.savefig(ruta)
+    plt.close(figura)
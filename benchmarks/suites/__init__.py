@@ -0,0 +1,60 @@
+"""
+Suites de benchmarks.
+
+Cada suite es un módulo con:
+  - PROYECTO: carpeta del proyecto, relativa a la raíz del repositorio
+  - TAMANIOS: tamaños de entrada a medir por defecto
+  - casos(): lista de Caso, llamada con el proyecto ya cargado
+  - finalizar() (opcional): libera lo que hayan creado los casos (procesos,
+    archivos); se llama al terminar la suite, aunque la medición falle
+"""
+import importlib
+
+SUITES = {
+    'listas': 'benchmarks.suites.listas',
+    'ordenamiento': 'benchmarks.suites.ordenamiento',
+    'quicksort': 'benchmarks.suites.quicksort',
+    'adaptativo': 'benchmarks.suites.adaptativo',
+    'matriz': 'benchmarks.suites.matriz',
+    'paralelo': 'benchmarks.suites.paralelo',
+    'externo': 'benchmarks.suites.externo',
+    'radix': 'benchmarks.suites.radix',
+    'radix_numpy': 'benchmarks.suites.radix_numpy',
+    'monticulo': 'benchmarks.suites.monticulo',
+    'heap_flujo': 'benchmarks.suites.heap_flujo',
+    'avl': 'benchmarks.suites.avl',
+    'prim': 'benchmarks.suites.prim',
+}
+
+
+class Caso:
+    """
+    Una operación a medir sobre una variante de la estructura.
+
+    preparar(n) arma el estado de entrada de tamaño n y ejecutar(estado)
+    es lo que se cronometra. muta indica que ejecutar modifica el estado
+    de forma que no se puede repetir sobre el mismo. complejidad es el
+    orden de crecimiento esperado del tiempo de ejecutar en función de n
+    ('1', 'log n', 'n', 'n log n' o 'n^2'), o None si no se verifica.
+    n_maximo es el tamaño más grande en que se mide el caso (None: todos),
+    para no esperar minutos por las variantes lentas en tamaños grandes.
+    """
+    __slots__ = ('operacion', 'variante', 'preparar', 'ejecutar', 'muta', 'complejidad', 'n_maximo')
+
+    def __init__(self, operacion, variante, preparar, ejecutar, muta=False, complejidad=None,
+                 n_maximo=None):
+        self.operacion = operacion
+        self.variante = variante
+        self.preparar = preparar
+        self.ejecutar = ejecutar
+        self.muta = muta
+        self.complejidad = complejidad
+        self.n_maximo = n_maximo
+
+
+def cargar(nombre):
+    """Devuelve el módulo de la suite 'nombre'"""
+    try:
+        return importlib.import_module(SUITES[nombre])
+    except KeyError:
+        raise KeyError(f"Suite desconocida {nombre!r}; disponibles: {', '.join(SUITES)}") from None
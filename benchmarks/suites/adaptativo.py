@@ -0,0 +1,52 @@
+"""Ordenamiento adaptativo contra introsort y sorted sobre entradas de distinta forma"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+TAMANIOS = [1000, 3000, 10000, 30000, 100000]
+
+
+def casi_ordenada(n):
+    generador = random.Random(n)
+    lista = list(range(n))
+    for _ in range(max(1, n // 1000)):
+        i, j = generador.randrange(n), generador.randrange(n)
+        lista[i], lista[j] = lista[j], lista[i]
+    return lista
+
+
+def aleatoria(valor):
+    def preparar(n):
+        generador = random.Random(n)
+        return [valor(generador, n) for _ in range(n)]
+    return preparar
+
+
+# Operación -> generador de la entrada de tamaño n
+ENTRADAS = {
+    'casi_ordenada': casi_ordenada,
+    'rango_chico': aleatoria(lambda generador, n: generador.randrange(n)),
+    'enteros_30_bits': aleatoria(lambda generador, n: generador.getrandbits(30)),
+    'pocos_distintos': aleatoria(lambda generador, n: generador.choice((0.5, 1.5, 2.5))),
+    'flotantes': aleatoria(lambda generador, n: generador.random()),
+}
+
+
+def casos():
+    from modules.ordenamiento_adaptativo import Ordenamiento_adaptativo
+    from modules.quicksort import Quicksort
+
+    casos = []
+    for operacion, preparar in ENTRADAS.items():
+        # El despachador elige una estrategia lineal para las tres primeras entradas
+        lineal = operacion in ('casi_ordenada', 'rango_chico', 'pocos_distintos')
+        casos += [
+            Caso(operacion, 'adaptativo', preparar,
+                 lambda lista: Ordenamiento_adaptativo(lista).ordenar(),
+                 complejidad='n' if lineal else None),
+            Caso(operacion, 'introsort', preparar,
+                 lambda lista: Quicksort(lista.copy()).ordenar(), complejidad='n log n'),
+            Caso(operacion, 'sorted', preparar, lambda lista: sorted(lista)),
+        ]
+    return casos
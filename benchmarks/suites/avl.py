@@ -0,0 +1,41 @@
+"""Árbol AVL del Trabajo 5"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'Trabajopractico_2/Trabajo_5'
+TAMANIOS = [500, 1000, 3000, 10000, 30000]
+
+# Cantidad de búsquedas por medición, fija para que el costo dependa sólo de la altura
+BUSQUEDAS = 1000
+
+
+def claves_mezcladas(n):
+    claves = list(range(n))
+    random.Random(n).shuffle(claves)
+    return claves
+
+
+def casos():
+    from modules.AVL import ArbolAVL
+
+    def construir(claves):
+        arbol = ArbolAVL()
+        for clave in claves:
+            arbol.insertar(clave, clave)
+        return arbol
+
+    def preparar_busqueda(n):
+        claves = claves_mezcladas(n)
+        return construir(claves), random.Random(-n).choices(claves, k=BUSQUEDAS)
+
+    def buscar(estado):
+        arbol, claves = estado
+        for clave in claves:
+            arbol.buscar(clave)
+
+    return [
+        Caso('insertar', 'ArbolAVL', claves_mezcladas, construir, complejidad='n log n'),
+        Caso(f'buscar x{BUSQUEDAS}', 'ArbolAVL', preparar_busqueda, buscar,
+             complejidad='log n'),
+    ]
@@ -0,0 +1,42 @@
+"""Ordenamiento externo del proyecto 3: archivos binarios ordenados con memoria acotada"""
+import os
+import random
+import tempfile
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+# Un archivo de varios GB (3·10^8 enteros de 64 bits son 2.4 GB):
+#   python -m benchmarks externo -n 300000000 -o sorted -r 1 --calentamiento 0
+TAMANIOS = [100000, 1000000, 3000000]
+MIB = 2 ** 20
+
+
+class Archivos:
+    """Carpeta temporal con n enteros de 64 bits aleatorios; se borra cuando se libera el objeto"""
+
+    def __init__(self, n, escribir_numeros):
+        self.carpeta = tempfile.TemporaryDirectory(prefix='externo_')
+        self.entrada = os.path.join(self.carpeta.name, 'entrada.bin')
+        self.salida = os.path.join(self.carpeta.name, 'salida.bin')
+        generador = random.Random(n)
+        escribir_numeros(self.entrada, (generador.getrandbits(64) - 2 ** 63 for _ in range(n)))
+
+
+def casos():
+    from modules.ordenamiento_externo import Ordenamiento_externo, escribir_numeros
+
+    def externo(algoritmo, memoria):
+        def ejecutar(archivos):
+            Ordenamiento_externo(archivos.entrada, archivos.salida, algoritmo, memoria,
+                                 carpeta_temporal=archivos.carpeta.name).ordenar()
+        return Caso(algoritmo, f'{memoria // MIB} MiB', lambda n: Archivos(n, escribir_numeros),
+                    ejecutar, complejidad='n log n')
+
+    # Con 4 MiB hay decenas de corridas por archivo; con 64 MiB, pocas
+    return [
+        externo('sorted', 4 * MIB),
+        externo('sorted', 64 * MIB),
+        externo('quicksort', 64 * MIB),
+        externo('radix', 64 * MIB),
+    ]
@@ -0,0 +1,90 @@
+"""Montículo del Trabajo 4 con 2, 4 y 8 hijos por nodo contra su versión original (Runestone) y heapq"""
+import heapq
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'Trabajopractico_2/Trabajo_4'
+TAMANIOS = [10000, 30000, 100000, 300000, 1000000]
+
+# Hijos por nodo a comparar (ver MonticuloBinario)
+ARIDADES = (2, 4, 8)
+
+
+def claves_aleatorias(n):
+    generador = random.Random(n)
+    return [generador.random() for _ in range(n)]
+
+
+def casos():
+    from modules.monticulo_binario import MonticuloBinario
+
+    class MonticuloRunestone(MonticuloBinario):
+        """Infiltrados de la versión original: intercambian en cada nivel y no cortan antes"""
+
+        def infiltArriba(self, i):
+            while i // 2 > 0:
+                if self.listaMonticulo[i] < self.listaMonticulo[i // 2]:
+                    self.listaMonticulo[i], self.listaMonticulo[i // 2] = \
+                        self.listaMonticulo[i // 2], self.listaMonticulo[i]
+                i //= 2
+
+        def infiltAbajo(self, i):
+            while (i * 2) <= self.tamanoActual:
+                hm = self.hijoMin(i)
+                if self.listaMonticulo[i] > self.listaMonticulo[hm]:
+                    self.listaMonticulo[i], self.listaMonticulo[hm] = \
+                        self.listaMonticulo[hm], self.listaMonticulo[i]
+                i = hm
+
+    def insertar_y_vaciar(crear):
+        # n inserciones seguidas de n eliminarMin
+        def ejecutar(claves):
+            monticulo = crear()
+            for clave in claves:
+                monticulo.insertar(clave)
+            while not monticulo.esta_vacio():
+                monticulo.eliminarMin()
+        return ejecutar
+
+    def construir_y_vaciar(crear):
+        # Muchas más extracciones que inserciones: se construye en O(n) y se vacía
+        def ejecutar(claves):
+            monticulo = crear()
+            monticulo.construirMonticulo(claves)
+            while not monticulo.esta_vacio():
+                monticulo.eliminarMin()
+        return ejecutar
+
+    def insertar_mayormente(crear):
+        # Muchas más inserciones que extracciones: una extracción cada diez inserciones
+        def ejecutar(claves):
+            monticulo = crear()
+            for i, clave in enumerate(claves):
+                monticulo.insertar(clave)
+                if i % 10 == 9:
+                    monticulo.eliminarMin()
+        return ejecutar
+
+    def heapq_insertar_y_vaciar(claves):
+        monticulo = []
+        for clave in claves:
+            heapq.heappush(monticulo, clave)
+        while monticulo:
+            heapq.heappop(monticulo)
+
+    casos = []
+    for operacion, carga in (('insertar_y_vaciar', insertar_y_vaciar),
+                             ('construir_y_vaciar', construir_y_vaciar),
+                             ('insertar_mayormente', insertar_mayormente)):
+        for aridad in ARIDADES:
+            casos.append(Caso(operacion, f'MonticuloBinario d={aridad}', claves_aleatorias,
+                              carga(lambda aridad=aridad: MonticuloBinario(aridad)),
+                              complejidad='n log n'))
+    casos += [
+        Caso('insertar_y_vaciar', 'Runestone', claves_aleatorias,
+             insertar_y_vaciar(MonticuloRunestone), complejidad='n log n'),
+        Caso('insertar_y_vaciar', 'heapq', claves_aleatorias, heapq_insertar_y_vaciar,
+             complejidad='n log n'),
+    ]
+    return casos
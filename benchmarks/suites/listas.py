@@ -0,0 +1,69 @@
+"""Listas doblemente enlazadas del proyecto 1 (nodos, arreglos y desenrollada)"""
+import gc
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_1'
+TAMANIOS = [1000, 3000, 10000, 30000, 100000]
+
+
+def construir_con_bucle(clase_lista, n):
+    lista = clase_lista()
+    for i in range(n):
+        lista.agregar_al_final(i)
+    return lista
+
+
+def recorrer(lista):
+    for _ in lista:
+        pass
+
+
+def insertar_y_extraer_en_el_medio(lista):
+    medio = len(lista) // 2
+    lista.insertar(None, medio)
+    lista.extraer(medio)
+
+
+def vaciar_por_extremos(lista):
+    while len(lista) > 1:
+        lista.extraer(0)
+        lista.extraer()
+
+
+def casos():
+    from modules.Listadobleenlazada import ListaDobleEnlazada
+    from modules.ListaArreglo import ListaDobleEnlazadaArreglo
+    from modules.ListaDesenrollada import ListaDesenrollada
+
+    lista_casos = []
+    for clase_lista in (ListaDobleEnlazada, ListaDobleEnlazadaArreglo, ListaDesenrollada):
+        variante = clase_lista.__name__
+
+        def crear(n, clase_lista=clase_lista):
+            if hasattr(clase_lista, 'desde_iterable'):
+                return clase_lista.desde_iterable(range(n))
+            return construir_con_bucle(clase_lista, n)
+
+        lista_casos += [
+            Caso('len', variante, crear, len, complejidad='1'),
+            Caso('copiar', variante, crear, lambda lista: lista.copiar(), complejidad='n'),
+            # Sólo la lista de nodos recorre la lista para invertirla
+            Caso('invertir', variante, crear, lambda lista: lista.invertir(),
+                 complejidad='n' if clase_lista is ListaDobleEnlazada else '1'),
+            Caso('recorrer', variante, crear, recorrer, complejidad='n'),
+            Caso('insertar_medio', variante, crear, insertar_y_extraer_en_el_medio,
+                 complejidad='n'),
+            Caso('extraer_extremos', variante, crear, vaciar_por_extremos, muta=True,
+                 complejidad='n'),
+            Caso('agregar_al_final', variante, lambda n: n,
+                 lambda n, clase_lista=clase_lista: construir_con_bucle(clase_lista, n),
+                 complejidad='n'),
+            Caso('gc.collect', variante, crear, lambda lista: gc.collect()),
+        ]
+        if hasattr(clase_lista, 'desde_iterable'):
+            lista_casos.append(Caso('desde_iterable', variante, lambda n: range(n),
+                                    clase_lista.desde_iterable, complejidad='n'))
+            lista_casos.append(Caso('a_lista', variante, crear, lambda lista: lista.a_lista(),
+                                    complejidad='n'))
+    return lista_casos
@@ -0,0 +1,110 @@
+"""Matriz de ordenamientos del proyecto 3 sobre entradas de distinta forma, hasta 10^7 elementos"""
+import itertools
+import random
+from functools import lru_cache
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+TAMANIOS = [1000, 10000, 100000, 1000000, 10000000]
+
+# Burbuja es cuadrática: por encima de este tamaño no se mide (se puede cambiar antes de casos())
+BURBUJA_N_MAXIMO = 2000
+# Exponente de la distribución de Zipf: el valor de rango k aparece con probabilidad ∝ 1/k^s
+EXPONENTE_ZIPF = 1.2
+# Cantidad de valores distintos de 'pocos_unicos'
+POCOS_UNICOS = 16
+
+
+def ordenada(generador, n):
+    return sorted(generador.randrange(n) for _ in range(n))
+
+
+def inversa(generador, n):
+    return ordenada(generador, n)[::-1]
+
+
+def casi_ordenada(generador, n):
+    """Ordenada con el 1 % de los elementos intercambiados con un vecino cercano"""
+    lista = ordenada(generador, n)
+    for _ in range(n // 100):
+        i = generador.randrange(n)
+        j = min(n - 1, i + generador.randrange(1, 10))
+        lista[i], lista[j] = lista[j], lista[i]
+    return lista
+
+
+def organo(generador, n):
+    """Tubos de órgano: sube hasta la mitad y baja (0 1 2 ... 2 1 0)"""
+    mitad = ordenada(generador, n - n // 2)
+    return mitad + mitad[n // 2 - 1::-1] if n // 2 else mitad
+
+
+def pocos_unicos(generador, n):
+    return [generador.randrange(POCOS_UNICOS) for _ in range(n)]
+
+
+def zipf(generador, n):
+    """Rangos 1..n con probabilidad ∝ 1/k^EXPONENTE_ZIPF: pocos valores muy repetidos y una cola larga"""
+    acumulados = list(itertools.accumulate(1 / k ** EXPONENTE_ZIPF for k in range(1, n + 1)))
+    return generador.choices(range(1, n + 1), cum_weights=acumulados, k=n)
+
+
+def enteros_grandes(generador, n):
+    """Enteros de hasta 62 bits con signo: radix necesita seis pasadas de 11 bits"""
+    return [generador.getrandbits(62) - (1 << 61) for _ in range(n)]
+
+
+def aleatoria(generador, n):
+    return [generador.randrange(n) for _ in range(n)]
+
+
+# Operación -> generador de la entrada a partir de un random.Random y el tamaño
+ENTRADAS = {
+    'aleatoria': aleatoria,
+    'ordenada': ordenada,
+    'inversa': inversa,
+    'casi_ordenada': casi_ordenada,
+    'organo': organo,
+    'pocos_unicos': pocos_unicos,
+    'zipf': zipf,
+    'enteros_grandes': enteros_grandes,
+}
+
+# Entradas que sorted() resuelve en tiempo lineal (una o dos corridas)
+LINEALES_PARA_SORTED = ('ordenada', 'inversa', 'organo')
+
+
+@lru_cache(maxsize=1)
+def entrada(operacion, n):
+    """
+    Entrada de tamaño n con la semilla fija n. Se guarda la última porque los casos de
+    una misma operación se miden seguidos y generar 10^7 elementos tarda varios segundos.
+    """
+    return ENTRADAS[operacion](random.Random(n), n)
+
+
+def casos():
+    from modules.burbuja import Burbuja
+    from modules.ordenamiento_adaptativo import Ordenamiento_adaptativo
+    from modules.quicksort import Quicksort
+    from modules.radix_sort import Radix_sort
+
+    casos = []
+    for operacion in ENTRADAS:
+        def preparar(n, operacion=operacion):
+            return entrada(operacion, n)
+        # Cada ejecución ordena una copia, así la entrada guardada no cambia
+        casos += [
+            Caso(operacion, 'Burbuja', preparar,
+                 lambda lista: Burbuja(lista.copy()).ordenar_lista(), n_maximo=BURBUJA_N_MAXIMO),
+            Caso(operacion, 'Quicksort', preparar,
+                 lambda lista: Quicksort(lista.copy()).ordenar(), complejidad='n log n'),
+            Caso(operacion, 'Radix_sort', preparar,
+                 lambda lista: Radix_sort(lista).ordenar(), complejidad='n'),
+            Caso(operacion, 'Ordenamiento_adaptativo', preparar,
+                 lambda lista: Ordenamiento_adaptativo(lista).ordenar()),
+            Caso(operacion, 'sorted', preparar, lambda lista: sorted(lista),
+                 complejidad='n' if operacion in LINEALES_PARA_SORTED else 'n log n'),
+        ]
+    return casos
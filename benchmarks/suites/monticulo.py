@@ -0,0 +1,87 @@
+"""Montículo binario y cola de prioridad del Trabajo 4"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'Trabajopractico_2/Trabajo_4'
+TAMANIOS = [500, 1000, 3000, 10000, 30000]
+
+
+# Prioridades de triage: las mismas tres de modules/paciente.py
+NIVELES_TRIAGE = range(1, 4)
+
+
+def claves_aleatorias(n):
+    generador = random.Random(n)
+    return [generador.randint(0, 10 * n) for _ in range(n)]
+
+
+def niveles_aleatorios(n):
+    generador = random.Random(n)
+    return [generador.choice(NIVELES_TRIAGE) for _ in range(n)]
+
+
+def casos():
+    from modules.monticulo_binario import MonticuloBinario
+    from modules.cola_prioridad import ColaPrioridad
+
+    def insertar_decrecientes(n):
+        # Cada clave nueva es la mínima y sube hasta la raíz: el peor caso
+        monticulo = MonticuloBinario()
+        for clave in range(n, 0, -1):
+            monticulo.insertar(clave)
+        return monticulo
+
+    def construir(claves):
+        monticulo = MonticuloBinario()
+        monticulo.construirMonticulo(claves)
+        return monticulo
+
+    def vaciar(monticulo):
+        while not monticulo.esta_vacio():
+            monticulo.eliminarMin()
+
+    def cola_llena(n):
+        cola = ColaPrioridad()
+        turnos = [cola.insertar(prioridad, None) for prioridad in claves_aleatorias(n)]
+        return cola, turnos
+
+    def cambiar_todas(estado):
+        # Cada turno pasa a otra prioridad aleatoria: sube o baja O(log n) niveles
+        cola, turnos = estado
+        generador = random.Random(len(turnos))
+        for turno in turnos:
+            cola.cambiar_prioridad(turno, generador.randint(0, 10 * len(turnos)))
+
+    def eliminar_todos(estado):
+        # Se sacan en orden de llegada, que no es el de prioridad
+        cola, turnos = estado
+        for turno in turnos:
+            cola.eliminar(turno)
+
+    def usar_cola(claves, rango=None):
+        cola = ColaPrioridad(rango=rango)
+        for prioridad in claves:
+            cola.insertar(prioridad, None)
+        while not cola.esta_vacia():
+            cola.extraer()
+
+    return [
+        Caso('insertar', 'MonticuloBinario', lambda n: n, insertar_decrecientes,
+             complejidad='n log n'),
+        Caso('construirMonticulo', 'MonticuloBinario', claves_aleatorias, construir,
+             complejidad='n'),
+        Caso('eliminarMin', 'MonticuloBinario', lambda n: construir(claves_aleatorias(n)),
+             vaciar, muta=True, complejidad='n log n'),
+        Caso('insertar_y_extraer', 'ColaPrioridad', claves_aleatorias, usar_cola,
+             complejidad='n log n'),
+        Caso('cambiar_prioridad', 'ColaPrioridad', cola_llena, cambiar_todas, muta=True,
+             complejidad='n log n'),
+        Caso('eliminar', 'ColaPrioridad', cola_llena, eliminar_todos, muta=True,
+             complejidad='n log n'),
+        # Pocas prioridades: el montículo contra la cola de cubetas del mismo rango
+        Caso('triage', 'ColaPrioridad', niveles_aleatorios, usar_cola,
+             complejidad='n log n'),
+        Caso('triage', 'ColaPrioridad rango', niveles_aleatorios,
+             lambda niveles: usar_cola(niveles, NIVELES_TRIAGE), complejidad='n'),
+    ]
@@ -0,0 +1,64 @@
+"""Algoritmos de ordenamiento del proyecto 3 (burbuja, quicksort, radix) y sorted()"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+TAMANIOS = [100, 200, 400, 700, 1000]
+
+
+def lista_aleatoria(n):
+    """
+    Enteros entre 0 y 1000 como en medir_tiempos; la semilla fija la
+    entrada para cada n. Con el motor aritmético y dígitos de 11 bits,
+    valores hasta 1000 entran en una sola pasada, así que el costo de
+    radix es lineal en n.
+    """
+    generador = random.Random(n)
+    return [generador.randint(0, 1000) for _ in range(n)]
+
+
+def casi_ordenada(n):
+    """Lista ordenada con un intercambio de vecinos cada 100 elementos"""
+    lista = sorted(lista_aleatoria(n))
+    for i in range(0, n - 1, 100):
+        lista[i], lista[i + 1] = lista[i + 1], lista[i]
+    return lista
+
+
+def casos():
+    from modules.burbuja import Burbuja
+    from modules.quicksort import Quicksort
+    from modules.radix_sort import Radix_sort
+
+    # Cada ejecución ordena una copia para que todas partan de la misma entrada
+    return [
+        Caso('ordenar', 'Burbuja', lista_aleatoria,
+             lambda lista: Burbuja(lista.copy()).ordenar_lista(), complejidad='n^2'),
+        Caso('ordenar', 'Burbuja clasico', lista_aleatoria,
+             lambda lista: Burbuja(lista.copy(), 'clasico').ordenar_lista(), complejidad='n^2'),
+        Caso('ordenar', 'Burbuja cocktail', lista_aleatoria,
+             lambda lista: Burbuja(lista.copy(), 'cocktail').ordenar_lista(), complejidad='n^2'),
+        Caso('ordenar', 'Burbuja comb', lista_aleatoria,
+             lambda lista: Burbuja(lista.copy(), 'comb').ordenar_lista(), complejidad='n log n'),
+        Caso('ordenar', 'Quicksort', lista_aleatoria,
+             lambda lista: Quicksort(lista.copy()).ordenar(), complejidad='n log n'),
+        Caso('ordenar', 'Quicksort clasico', lista_aleatoria,
+             lambda lista: Quicksort(lista.copy(), 'clasico').ordenar(), complejidad='n log n'),
+        Caso('ordenar', 'Radix_sort', lista_aleatoria,
+             lambda lista: Radix_sort(lista.copy()).ordenar(), complejidad='n'),
+        Caso('ordenar', 'sorted', lista_aleatoria, lambda lista: sorted(lista.copy()),
+             complejidad='n log n'),
+        # Entrada ya ordenada: el Quicksort clásico es cuadrático y con 1000 elementos
+        # supera el límite de recursión, así que sólo se mide introsort
+        Caso('ordenada', 'Burbuja', lambda n: sorted(lista_aleatoria(n)),
+             lambda lista: Burbuja(lista.copy()).ordenar_lista(), complejidad='n'),
+        Caso('casi_ordenada', 'Burbuja', casi_ordenada,
+             lambda lista: Burbuja(lista.copy()).ordenar_lista(), complejidad='n'),
+        Caso('casi_ordenada', 'Burbuja clasico', casi_ordenada,
+             lambda lista: Burbuja(lista.copy(), 'clasico').ordenar_lista(), complejidad='n^2'),
+        Caso('ordenada', 'Quicksort', lambda n: sorted(lista_aleatoria(n)),
+             lambda lista: Quicksort(lista.copy()).ordenar(), complejidad='n log n'),
+        Caso('ordenada', 'sorted', lambda n: sorted(lista_aleatoria(n)),
+             lambda lista: sorted(lista.copy()), complejidad='n'),
+    ]
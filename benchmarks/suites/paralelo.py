@@ -0,0 +1,47 @@
+"""Ordenamiento en paralelo del proyecto 3: aceleración según la cantidad de procesos"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.proyectos import proyecto
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+TAMANIOS = [100000, 1000000]
+# De 1 proceso (ordenamiento en el mismo proceso, la base de la aceleración) al doble de núcleos
+PROCESOS = sorted({1, 2, 4, os.cpu_count() or 1, 2 * (os.cpu_count() or 1)})
+
+# Pools de procesos por cantidad de procesos, compartidos por todos los casos de la suite
+ejecutores = {}
+
+
+def enteros(n):
+    generador = random.Random(n)
+    return [generador.randrange(-2 ** 62, 2 ** 62) for _ in range(n)]
+
+
+def casos():
+    from modules.ordenamiento_paralelo import ALGORITMOS
+
+    def en_paralelo(algoritmo, procesos):
+        def ejecutar(lista):
+            # Los procesos se crean en la primera ejecución (el calentamiento) y se reutilizan.
+            # Se crean con el proyecto cargado para que importen sus mismos 'modules'.
+            with proyecto(PROYECTO):
+                from modules.ordenamiento_paralelo import Ordenamiento_paralelo
+                if procesos > 1 and procesos not in ejecutores:
+                    ejecutores[procesos] = ProcessPoolExecutor(procesos)
+                return Ordenamiento_paralelo(lista, algoritmo, procesos,
+                                             ejecutores.get(procesos)).ordenar()
+        return ejecutar
+
+    return [Caso(algoritmo, f'{procesos} procesos', enteros, en_paralelo(algoritmo, procesos),
+                 complejidad='n log n' if algoritmo != 'radix' else 'n')
+            for algoritmo in ALGORITMOS for procesos in PROCESOS]
+
+
+def finalizar():
+    """Cierra los pools de procesos creados durante la medición"""
+    for ejecutor in ejecutores.values():
+        ejecutor.shutdown()
+    ejecutores.clear()
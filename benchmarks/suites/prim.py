@@ -0,0 +1,28 @@
+"""Árbol de expansión mínima con Prim del Trabajo 6"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'Trabajopractico_2/Trabajo_6'
+TAMANIOS = [500, 1000, 3000, 10000, 30000]
+
+# Aristas extra por nodo además de las del árbol que asegura que el grafo sea conexo
+ARISTAS_POR_NODO = 3
+
+
+def aristas_aleatorias(n):
+    """Grafo conexo de n nodos con unas (ARISTAS_POR_NODO + 1)·n aristas de peso aleatorio"""
+    generador = random.Random(n)
+    aristas = [(generador.randrange(i), i, generador.randint(1, 1000)) for i in range(1, n)]
+    aristas += [(generador.randrange(n), generador.randrange(n), generador.randint(1, 1000))
+                for _ in range(ARISTAS_POR_NODO * n)]
+    return [(u, v, w) for u, v, w in aristas if u != v]
+
+
+def casos():
+    from modules.grafos import grafo_no_dirigido, mst_prim
+
+    return [
+        Caso('mst_prim', 'heapq', lambda n: grafo_no_dirigido(aristas_aleatorias(n))[0],
+             lambda adyacencias: mst_prim(adyacencias, 0), complejidad='n log n'),
+    ]
@@ -0,0 +1,50 @@
+"""Particiones de Quicksort (Hoare y tres vías) sobre distribuciones con y sin repetidos"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+TAMANIOS = [1000, 3000, 10000, 30000, 100000]
+
+# Operación -> cantidad de valores distintos de la entrada (None: todos distintos)
+DISTRIBUCIONES = {
+    'aleatoria': None,
+    'mil_unicos': 1000,
+    'diez_unicos': 10,
+    'dos_unicos': 2,
+    'iguales': 1,
+}
+
+
+def generador_de(unicos):
+    def preparar(n):
+        generador = random.Random(n)
+        if unicos is None:
+            return [generador.random() for _ in range(n)]
+        return [generador.randrange(unicos) for _ in range(n)]
+    return preparar
+
+
+def casos():
+    from modules.quicksort import Quicksort
+
+    casos = []
+    for operacion, unicos in DISTRIBUCIONES.items():
+        preparar = generador_de(unicos)
+        # Con k valores distintos la partición en tres vías es O(n·k): lineal si k es fijo
+        lineal = unicos is not None and unicos <= 10
+        casos += [
+            Caso(operacion, 'hoare', preparar,
+                 lambda lista: Quicksort(lista.copy()).ordenar(), complejidad='n log n'),
+            Caso(operacion, 'tres_vias', preparar,
+                 lambda lista: Quicksort(lista.copy(), particion='tres_vias').ordenar(),
+                 complejidad='n' if lineal else 'n log n'),
+            # Timsort es lineal sólo si la entrada ya es una corrida ordenada (todos iguales)
+            Caso(operacion, 'sorted', preparar, lambda lista: sorted(lista.copy()),
+                 complejidad='n' if unicos == 1 else 'n log n'),
+        ]
+    # El clásico pone los iguales al pivote de un solo lado: con repetidos es cuadrático
+    casos.append(Caso('aleatoria', 'clasico', generador_de(None),
+                      lambda lista: Quicksort(lista.copy(), 'clasico').ordenar(),
+                      complejidad='n log n'))
+    return casos
@@ -0,0 +1,62 @@
+"""Motores de Radix_sort del proyecto 3 sobre enteros grandes"""
+import random
+
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+# Para los tamaños grandes: python -m benchmarks radix -n 1000000 10000000 -r 3
+TAMANIOS = [10000, 100000, 1000000]
+
+
+def enteros_aleatorios(n):
+    """Enteros de 31 bits (hasta 10 dígitos decimales) con semilla fija para cada n"""
+    generador = random.Random(n)
+    return [generador.randrange(2 ** 31) for _ in range(n)]
+
+
+def enteros_con_signo(n):
+    generador = random.Random(n)
+    return [generador.randrange(-2 ** 30, 2 ** 30) for _ in range(n)]
+
+
+def flotantes(n):
+    generador = random.Random(n)
+    return [generador.uniform(-1e6, 1e6) for _ in range(n)]
+
+
+def registros(n):
+    """Tuplas (clave con signo, dato) para ordenar por clave"""
+    return [(clave, None) for clave in enteros_con_signo(n)]
+
+
+def primero(registro):
+    return registro[0]
+
+
+def casos():
+    from modules.radix_sort import Radix_sort
+
+    def aritmetico(bits):
+        return Caso('ordenar', f'aritmetico {bits} bits', enteros_aleatorios,
+                    lambda lista: Radix_sort(lista, 'aritmetico', bits).ordenar(), complejidad='n')
+
+    # Ningún motor modifica la lista recibida, así que no hace falta copiarla
+    return [
+        Caso('ordenar', 'cadenas', enteros_aleatorios,
+             lambda lista: Radix_sort(lista, 'cadenas').ordenar(), complejidad='n'),
+        aritmetico(8),
+        aritmetico(11),
+        aritmetico(16),
+        Caso('ordenar', 'sorted', enteros_aleatorios, sorted, complejidad='n log n'),
+        Caso('con_signo', 'aritmetico 16 bits', enteros_con_signo,
+             lambda lista: Radix_sort(lista, bits_por_digito=16).ordenar(), complejidad='n'),
+        Caso('con_signo', 'sorted', enteros_con_signo, sorted, complejidad='n log n'),
+        Caso('flotantes', 'aritmetico 16 bits', flotantes,
+             lambda lista: Radix_sort(lista, bits_por_digito=16).ordenar(), complejidad='n'),
+        Caso('flotantes', 'sorted', flotantes, sorted, complejidad='n log n'),
+        Caso('por_clave', 'aritmetico 16 bits', registros,
+             lambda lista: Radix_sort(lista, bits_por_digito=16, clave=primero).ordenar(),
+             complejidad='n'),
+        Caso('por_clave', 'sorted', registros, lambda lista: sorted(lista, key=primero),
+             complejidad='n log n'),
+    ]
@@ -0,0 +1,59 @@
+"""Radix_sort y Counting_sort vectorizados con NumPy contra np.sort y la versión en Python"""
+from benchmarks.suites import Caso
+
+PROYECTO = 'TrabajoPractico_1/proyecto_3'
+# Hasta 10^8: python -m benchmarks radix_numpy -n 100000 1000000 10000000 100000000 -r 3
+# (con 10^8 enteros de 64 bits hacen falta unos 4 GB de memoria)
+TAMANIOS = [100000, 1000000, 10000000]
+# La versión en Python tarda más de un minuto por muestra con 10^7 elementos
+N_MAXIMO_PYTHON = 1000000
+
+
+def enteros(n):
+    """Enteros de 31 bits en un arreglo int64, con semilla fija para cada n"""
+    import numpy as np
+    return np.random.default_rng(n).integers(0, 2 ** 31, n)
+
+
+def flotantes(n):
+    import numpy as np
+    return np.random.default_rng(n).standard_normal(n)
+
+
+def acotados(n):
+    """Enteros entre 0 y 65535, el caso en que conviene counting sort"""
+    import numpy as np
+    return np.random.default_rng(n).integers(0, 2 ** 16, n)
+
+
+def casos():
+    import numpy as np
+    from modules.counting_sort import Counting_sort
+    from modules.radix_sort import Radix_sort
+
+    def radix(operacion, preparar, bits):
+        return Caso(operacion, f'Radix_sort {bits} bits', preparar,
+                    lambda arreglo: Radix_sort(arreglo, bits_por_digito=bits).ordenar(),
+                    complejidad='n')
+
+    def estable(arreglo):
+        return np.sort(arreglo, kind='stable')
+
+    # Ninguna variante modifica el arreglo recibido; la de Python recibe una lista
+    return [
+        radix('enteros', enteros, 8),
+        radix('enteros', enteros, 16),
+        Caso('enteros', 'np.sort stable', enteros, estable, complejidad='n'),
+        Caso('enteros', 'Radix_sort en Python', lambda n: enteros(n).tolist(),
+             lambda lista: Radix_sort(lista, bits_por_digito=16).ordenar(),
+             complejidad='n', n_maximo=N_MAXIMO_PYTHON),
+        radix('flotantes', flotantes, 16),
+        Caso('flotantes', 'np.sort stable', flotantes, estable, complejidad='n log n'),
+        Caso('acotados', 'Counting_sort', acotados,
+             lambda arreglo: Counting_sort(arreglo).ordenar(), complejidad='n'),
+        radix('acotados', acotados, 16),
+        Caso('acotados', 'np.sort stable', acotados, estable, complejidad='n'),
+        Caso('acotados', 'Counting_sort en Python', lambda n: acotados(n).tolist(),
+             lambda lista: Counting_sort(lista).ordenar(), complejidad='n',
+             n_maximo=N_MAXIMO_PYTHON),
+    ]
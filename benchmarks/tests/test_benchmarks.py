@@ -0,0 +1,262 @@
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+from benchmarks.__main__ import main
+from benchmarks.almacen import Almacen
+from benchmarks.comparacion import MEJORA, REGRESION, SIN_CAMBIO, comparar, mann_whitney_u
+from benchmarks.complejidad import (MODELOS, ComplejidadInesperadaError, ajustar_modelos,
+                                    analizar, verificar)
+from benchmarks.ejecucion import Medicion, ejecutar_suite
+from benchmarks.medicion import Estadisticas, medir
+from benchmarks.proyectos import proyecto
+from benchmarks.suites import matriz
+
+
+class Test_Medicion(unittest.TestCase):
+    """Test de la medición de tiempos y sus estadísticas"""
+
+    def test_estadisticas(self):
+        e = Estadisticas([5, 1, 3, 2, 4])
+        self.assertEqual(e.mediana, 3)
+        self.assertEqual((e.q1, e.q3), (2, 4))
+        self.assertEqual(e.iqr, 2)
+        self.assertEqual((e.minimo, e.maximo), (1, 5))
+        self.assertEqual(Estadisticas([7]).iqr, 0)
+        with self.assertRaises(ValueError):
+            Estadisticas([])
+
+    def test_ajusta_ejecuciones_por_muestra(self):
+        llamadas = []
+        estadisticas, numero = medir(llamadas.append, repeticiones=3, tiempo_minimo=0.001)
+        self.assertGreater(numero, 1, "Una operación tan rápida debe repetirse en cada muestra")
+        self.assertEqual(len(estadisticas.tiempos), 3)
+
+    def test_operacion_que_muta_se_prepara_cada_vez(self):
+        preparados = []
+
+        def preparar():
+            preparados.append([1, 2, 3])
+            return preparados[-1]
+
+        estadisticas, numero = medir(lambda lista: lista.pop(), preparar, muta=True,
+                                     repeticiones=4, calentamiento=2)
+        self.assertEqual(numero, 1)
+        self.assertEqual(len(estadisticas.tiempos), 4)
+        self.assertEqual(len(preparados), 6)
+        self.assertTrue(all(lista == [1, 2] for lista in preparados))
+
+
+class Test_Proyectos(unittest.TestCase):
+    """Test de la carga de los paquetes 'modules' de cada proyecto"""
+
+    def test_cada_proyecto_usa_sus_modules(self):
+        antes = list(sys.path)
+        with proyecto('TrabajoPractico_1/proyecto_1'):
+            from modules.Listadobleenlazada import ListaDobleEnlazada
+        with proyecto('TrabajoPractico_1/proyecto_2'):
+            from modules.Listadobleenlazada import ListaDobleEnlazada as OtraLista
+        self.assertIsNot(ListaDobleEnlazada, OtraLista)
+        self.assertTrue(hasattr(ListaDobleEnlazada, 'desde_iterable'))
+        self.assertEqual(sys.path, antes)
+        self.assertNotIn('modules.Listadobleenlazada', sys.modules)
+        with proyecto('TrabajoPractico_1/proyecto_1'):
+            from modules.Listadobleenlazada import ListaDobleEnlazada as Misma
+        self.assertIs(ListaDobleEnlazada, Misma, "Al volver a un proyecto se reutilizan sus módulos")
+
+    def test_proyecto_inexistente(self):
+        with self.assertRaises(FileNotFoundError):
+            with proyecto('no_existe'):
+                pass
+
+
+class Test_Ejecucion(unittest.TestCase):
+    """Test de la ejecución de una suite completa"""
+
+    def test_finaliza_la_suite_aunque_falle(self):
+        from benchmarks.suites import paralelo
+        # El primer tamaño crea los pools de procesos y el segundo hace fallar a preparar
+        with self.assertRaises(TypeError):
+            ejecutar_suite('paralelo', [2000, 'x'], operaciones=['radix'], repeticiones=1,
+                           tiempo_minimo=0, progreso=None)
+        self.assertEqual(paralelo.ejecutores, {}, "Los pools de procesos deben cerrarse")
+
+
+class Test_Matriz(unittest.TestCase):
+    """Test de las entradas de la suite matriz"""
+
+    def test_entradas_reproducibles(self):
+        for operacion, generar in matriz.ENTRADAS.items():
+            for n in (1, 2, 101):
+                lista = generar(random.Random(n), n)
+                self.assertEqual(len(lista), n, operacion)
+                self.assertEqual(lista, generar(random.Random(n), n), operacion)
+        self.assertEqual(matriz.ordenada(random.Random(0), 50),
+                         sorted(matriz.aleatoria(random.Random(0), 50)))
+        organo = matriz.organo(random.Random(0), 9)
+        self.assertEqual(organo[:5], sorted(organo[:5]))
+        self.assertEqual(organo[4:], sorted(organo[4:], reverse=True))
+        self.assertLessEqual(len(set(matriz.pocos_unicos(random.Random(0), 1000))),
+                             matriz.POCOS_UNICOS)
+
+    def test_burbuja_tiene_tamanio_maximo(self):
+        mediciones = ejecutar_suite('matriz', [matriz.BURBUJA_N_MAXIMO, matriz.BURBUJA_N_MAXIMO + 1],
+                                    ['ordenada'], repeticiones=1, calentamiento=0,
+                                    tiempo_minimo=0, progreso=None)
+        burbuja = [m.n for m in mediciones if m.variante == 'Burbuja']
+        self.assertEqual(burbuja, [matriz.BURBUJA_N_MAXIMO])
+        self.assertEqual(len(mediciones), 9)
+
+
+def medicion(operacion, tiempos, n=100, complejidad=None):
+    return Medicion('prueba', operacion, 'Variante', n, 1, Estadisticas(tiempos), complejidad)
+
+
+def serie(operacion, modelo, complejidad, ruido=0.03, semilla=0):
+    """Mediciones sintéticas que crecen según 'modelo' con ruido relativo"""
+    generador = random.Random(semilla)
+    f = MODELOS[modelo] or (lambda n: 1)
+    return [medicion(operacion, [1e-6 * (1 + f(n) / f(1000)) * generador.uniform(1 - ruido, 1 + ruido)
+                                 for _ in range(5)], n, complejidad)
+            for n in (1000, 3000, 10000, 30000, 100000)]
+
+
+class Test_Complejidad(unittest.TestCase):
+    """Test del ajuste de modelos de complejidad"""
+
+    def test_reconoce_cada_modelo(self):
+        for modelo in ('n', 'n log n', 'n^2'):
+            muestras = {m.n: m.estadisticas.tiempos for m in serie('op', modelo, None)}
+            ajustes = ajustar_modelos(muestras)
+            self.assertEqual(ajustes[0].modelo, modelo)
+            self.assertAlmostEqual(sum(a.peso for a in ajustes), 1)
+
+    def test_constante_no_se_descarta(self):
+        # Con datos constantes un modelo creciente puede ajustar el ruido,
+        # pero la constante nunca debe quedar descartada
+        for semilla in range(5):
+            muestras = {m.n: m.estadisticas.tiempos for m in serie('op', '1', None, semilla=semilla)}
+            ajustes = ajustar_modelos(muestras)
+            self.assertIn(ajustes[0].modelo, ('1', 'log n'))
+            self.assertGreater(next(a.peso for a in ajustes if a.modelo == '1'), 0.05)
+
+    def test_hacen_falta_tres_tamanios(self):
+        with self.assertRaises(ValueError):
+            ajustar_modelos({10: [1.0], 20: [2.0]})
+
+    def test_deriva(self):
+        mediciones = (serie('constante', '1', '1') + serie('lineal', 'n', 'n')
+                      + serie('se_volvio_lineal', 'n', '1') + serie('sin_esperada', 'n^2', None))
+        analisis = {a.clave[1]: a for a in analizar(mediciones)}
+        self.assertFalse(analisis['constante'].deriva)
+        self.assertFalse(analisis['lineal'].deriva)
+        self.assertTrue(analisis['se_volvio_lineal'].deriva)
+        self.assertFalse(analisis['sin_esperada'].deriva)
+        with self.assertRaisesRegex(ComplejidadInesperadaError, 'se_volvio_lineal'):
+            verificar(analisis.values())
+
+    def test_tolerancia(self):
+        """con la tolerancia por defecto se aceptan clases vecinas (n en lugar de n log n)"""
+        mediciones = serie('op', 'n', 'n log n')
+        self.assertFalse(analizar(mediciones)[0].deriva)
+        self.assertTrue(analizar(mediciones, tolerancia=0)[0].deriva)
+
+
+class Test_Comparacion(unittest.TestCase):
+    """Test de la prueba U de Mann-Whitney y de la detección de regresiones"""
+
+    def test_mann_whitney_exacta(self):
+        # Separación total con 5 y 5 muestras: un solo orden de los C(10, 5) = 252 posibles
+        u, p = mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5])
+        self.assertEqual(u, 25)
+        self.assertAlmostEqual(p, 1 / 252)
+        self.assertEqual(mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]), (0, 1.0))
+
+    def test_mann_whitney_con_empates(self):
+        u, p = mann_whitney_u([1, 2, 2, 3], [1, 2, 2, 3])
+        self.assertEqual(u, 8)
+        self.assertGreater(p, 0.3)
+
+    def test_comparar(self):
+        base = [medicion('igual', [1.0, 1.1, 0.9, 1.05, 0.95]),
+                medicion('lenta', [1.0, 1.1, 0.9, 1.05, 0.95]),
+                medicion('rapida', [1.0, 1.1, 0.9, 1.05, 0.95]),
+                medicion('poco', [1.0, 1.01, 0.99, 1.005, 0.995]),
+                medicion('solo_en_base', [1.0])]
+        candidato = [medicion('igual', [1.02, 1.08, 0.92, 1.0, 0.97]),
+                     medicion('lenta', [2.0, 2.1, 1.9, 2.05, 1.95]),
+                     medicion('rapida', [0.5, 0.55, 0.45, 0.52, 0.48]),
+                     medicion('poco', [1.03, 1.04, 1.02, 1.035, 1.025])]
+        estados = {c.clave[1]: c.estado for c in comparar(base, candidato)}
+        self.assertEqual(estados, {'igual': SIN_CAMBIO, 'lenta': REGRESION,
+                                   'rapida': MEJORA, 'poco': SIN_CAMBIO})
+
+
+class Test_Almacen(unittest.TestCase):
+    """Test del almacén SQLite de corridas"""
+
+    def test_guardar_y_recuperar(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            with Almacen(os.path.join(carpeta, 'r.sqlite')) as almacen:
+                primera = almacen.guardar([medicion('op', [1.0, 2.0, 3.0])], 'base',
+                                          {'suites': ['prueba']})
+                segunda = almacen.guardar([medicion('op', [4.0, 5.0]), medicion('op', [6.0], 200)])
+
+                self.assertEqual([c.id for c in almacen.corridas()], [primera, segunda])
+                self.assertEqual(almacen.corrida('base').id, primera)
+                self.assertEqual(almacen.corrida(f"#{primera}").id, primera)
+                self.assertEqual(almacen.corrida('ultima').id, segunda)
+                self.assertEqual(almacen.corrida('anterior').id, primera)
+                self.assertEqual(almacen.corrida('base').parametros, {'suites': ['prueba']})
+                with self.assertRaises(KeyError):
+                    almacen.corrida('no_existe')
+
+                corrida = almacen.corrida('ultima')
+                self.assertEqual(len(corrida.maquina), 12)
+                if corrida.git_commit is not None:
+                    self.assertEqual(almacen.corrida(corrida.git_commit[:8]).id, segunda)
+
+                mediciones = almacen.mediciones(segunda)
+                self.assertEqual([m.n for m in mediciones], [100, 200])
+                self.assertEqual(mediciones[0].estadisticas.tiempos, [4.0, 5.0])
+                self.assertEqual(mediciones[0].estadisticas.mediana, 4.5)
+
+
+class Test_CLI(unittest.TestCase):
+    """Test de punta a punta de 'python -m benchmarks'"""
+
+    def test_json_y_csv(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta_json = os.path.join(carpeta, 'r.json')
+            ruta_csv = os.path.join(carpeta, 'r.csv')
+            with open(os.devnull, 'w') as nulo:
+                salida, sys.stdout = sys.stdout, nulo
+                try:
+                    main(['listas', '-n', '10', '20', '-o', 'len', 'copiar', '-r', '2',
+                          '--tiempo-minimo', '0.001', '-q', '--json', ruta_json, '--csv', ruta_csv,
+                          '--almacen', os.path.join(carpeta, 'r.sqlite')])
+                    with Almacen(os.path.join(carpeta, 'r.sqlite')) as almacen:
+                        guardadas = almacen.mediciones(almacen.corrida('ultima').id)
+                finally:
+                    sys.stdout = salida
+            with open(ruta_json, encoding='utf-8') as archivo:
+                mediciones = json.load(archivo)
+            with open(ruta_csv, encoding='utf-8') as archivo:
+                filas = list(csv.DictReader(archivo))
+
+        # 2 tamaños x 2 operaciones x 3 variantes de lista
+        self.assertEqual(len(mediciones), 12)
+        self.assertEqual(len(filas), 12)
+        self.assertEqual({m['operacion'] for m in mediciones}, {'len', 'copiar'})
+        self.assertEqual({m['n'] for m in mediciones}, {10, 20})
+        self.assertTrue(all(len(m['tiempos']) == 2 for m in mediciones))
+        self.assertEqual(float(filas[0]['mediana']), mediciones[0]['mediana'])
+        self.assertEqual(len(guardadas), 12, "Cada ejecución debe quedar guardada en el almacén")
+
+
+if __name__ == "__main__":
+    unittest.main()